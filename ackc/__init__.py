@@ -1,7 +1,5 @@
 """ACKC - Keycloak API client using niquests.
 """
-from importlib.metadata import version
-
 from .generated import AuthenticatedClient, Client
 from .generated import models
 
@@ -18,8 +16,6 @@ from .exceptions import (
     APIError,
 )
 
-__version__ = version("ackc")
-
 __all__ = (
     # Generated exports
     "AuthenticatedClient",
@@ -42,3 +38,16 @@ __all__ = (
     "ClientNotFoundError",
     "APIError",
 )
+
+
+def __getattr__(name):
+    """https://peps.python.org/pep-0562/
+
+    `__version__` is looked up from the installed metadata on first access only, since
+    scanning `sys.path` for distributions is a noticeable part of import time.
+    """
+    if name == "__version__":
+        from importlib.metadata import version
+        globals()["__version__"] = value = version("ackc")
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,30 +3,90 @@ Keycloak API accessor classes.
 
 These classes provide a clean interface over the generated API code.
 """
-from .base import *
-from .users import *
-from .realms import *
-from .clients import *
-from .roles import *
-from .groups import *
-from .organizations import *
-from .identity_providers import *
-from .client_scopes import *
-from .components import *
-from .sessions import *
-from .events import *
-from .authentication import *
-from .authorization import *
-from .protocol_mappers import *
-from .keys import *
-from .scope_mappings import *
-from .client_role_mappings import *
-from .role_mapper import *
-from .roles_by_id import *
-from .attack_detection import *
-from .client_initial_access import *
-from .client_attribute_certificate import *
-from .client_registration_policy import *
+from .base import AuthError, APIError, AuthenticatedClient, Client, BaseAPI, BaseClientManager
+from .users import (
+    UsersAPI,
+    UsersClientMixin,
+    UserRepresentation,
+    GroupRepresentation,
+    CredentialRepresentation,
+    UserSessionRepresentation,
+    UserConsentRepresentation,
+    FederatedIdentityRepresentation,
+)
+from .realms import (
+    RealmsAPI,
+    RealmsClientMixin,
+    RealmRepresentation,
+    AdminEventRepresentation,
+    EventRepresentation,
+    ClientScopeRepresentation,
+    RealmEventsConfigRepresentation,
+)
+from .clients import (
+    ClientsAPI,
+    ClientsClientMixin,
+    ClientRepresentation,
+    ManagementPermissionReference,
+    GlobalRequestResult,
+)
+from .roles import RolesAPI, RolesClientMixin, RoleRepresentation
+from .groups import GroupsAPI, GroupsClientMixin
+from .organizations import (
+    OrganizationsAPI,
+    OrganizationsClientMixin,
+    OrganizationRepresentation,
+    MemberRepresentation,
+    IdentityProviderRepresentation,
+)
+from .identity_providers import IdentityProvidersAPI, IdentityProvidersClientMixin
+from .client_scopes import ClientScopesAPI, ClientScopesClientMixin
+from .components import ComponentsAPI, ComponentsClientMixin, ComponentRepresentation, ComponentTypeRepresentation
+from .sessions import SessionsAPI, SessionsClientMixin
+from .events import EventsAPI, EventsClientMixin
+from .authentication import (
+    AuthenticationAPI,
+    AuthenticationClientMixin,
+    AuthenticationFlowRepresentation,
+    AuthenticationExecutionRepresentation,
+    AuthenticationExecutionInfoRepresentation,
+    AuthenticatorConfigRepresentation,
+    RequiredActionProviderRepresentation,
+)
+from .authorization import (
+    AuthorizationAPI,
+    AuthorizationClientMixin,
+    build_resource_server,
+    ResourceServerRepresentation,
+    ResourceRepresentation,
+    ScopeRepresentation,
+    AbstractPolicyRepresentation,
+    PolicyProviderRepresentation,
+    PolicyEvaluationResponse,
+    PolicyEvaluationRequest,
+    EvaluationResultRepresentation,
+    PolicyRepresentation,
+)
+from .protocol_mappers import ProtocolMappersAPI, ProtocolMappersClientMixin, ProtocolMapperRepresentation
+from .keys import KeysAPI, KeysClientMixin, KeysMetadataRepresentation
+from .scope_mappings import ScopeMappingsAPI, ScopeMappingsClientMixin
+from .client_role_mappings import ClientRoleMappingsAPI, ClientRoleMappingsClientMixin
+from .role_mapper import RoleMapperAPI, RoleMapperClientMixin
+from .roles_by_id import RolesByIdAPI, RolesByIdClientMixin
+from .attack_detection import AttackDetectionAPI, AttackDetectionClientMixin
+from .client_initial_access import (
+    ClientInitialAccessAPI,
+    ClientInitialAccessClientMixin,
+    ClientInitialAccessPresentation,
+    ClientInitialAccessCreatePresentation,
+)
+from .client_attribute_certificate import (
+    ClientAttributeCertificateAPI,
+    ClientAttributeCertificateClientMixin,
+    CertificateRepresentation,
+    KeyStoreConfig,
+)
+from .client_registration_policy import ClientRegistrationPolicyAPI, ClientRegistrationPolicyClientMixin
 
 __all__ = (
     "AuthError", "APIError", "AuthenticatedClient", "Client", "BaseAPI", "BaseClientManager",
@@ -35,14 +95,14 @@ __all__ = (
     "ClientsAPI", "ClientsClientMixin", "ClientRepresentation", "ManagementPermissionReference",
     "RolesAPI", "RolesClientMixin", "RoleRepresentation",
     "GroupsAPI", "GroupsClientMixin", "GroupRepresentation",
-    "OrganizationsAPI", "OrganizationsClientMixin", "OrganizationRepresentation",
+    "OrganizationsAPI", "OrganizationsClientMixin", "OrganizationRepresentation", "MemberRepresentation",
     "IdentityProvidersAPI", "IdentityProvidersClientMixin", "IdentityProviderRepresentation",
     "ClientScopesAPI", "ClientScopesClientMixin", "ClientScopeRepresentation", "GlobalRequestResult",
     "ComponentsAPI", "ComponentsClientMixin", "ComponentRepresentation", "ComponentTypeRepresentation",
     "SessionsAPI", "SessionsClientMixin", "UserSessionRepresentation",
     "EventsAPI", "EventsClientMixin", "RealmEventsConfigRepresentation", "EventRepresentation", "AdminEventRepresentation",
-    "AuthenticationAPI", "AuthenticationClientMixin", "AuthenticationFlowRepresentation", "AuthenticationExecutionInfoRepresentation", "AuthenticatorConfigRepresentation", "RequiredActionProviderRepresentation",
-    "AuthorizationAPI", "AuthorizationClientMixin", "ResourceServerRepresentation", "ResourceRepresentation", "ScopeRepresentation", "AbstractPolicyRepresentation", "PolicyProviderRepresentation", "PolicyEvaluationResponse", "EvaluationResultRepresentation", "PolicyRepresentation",
+    "AuthenticationAPI", "AuthenticationClientMixin", "AuthenticationFlowRepresentation", "AuthenticationExecutionRepresentation", "AuthenticationExecutionInfoRepresentation", "AuthenticatorConfigRepresentation", "RequiredActionProviderRepresentation",
+    "AuthorizationAPI", "AuthorizationClientMixin", "ResourceServerRepresentation", "ResourceRepresentation", "ScopeRepresentation", "AbstractPolicyRepresentation", "PolicyProviderRepresentation", "PolicyEvaluationResponse", "PolicyEvaluationRequest", "EvaluationResultRepresentation", "PolicyRepresentation", "build_resource_server",
     "ProtocolMappersAPI", "ProtocolMappersClientMixin", "ProtocolMapperRepresentation",
     "KeysAPI", "KeysClientMixin", "KeysMetadataRepresentation",
     "ScopeMappingsAPI", "ScopeMappingsClientMixin",
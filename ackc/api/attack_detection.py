@@ -2,19 +2,20 @@
 from functools import cached_property
 from typing import Any
 
-from .base import BaseAPI
-from ..exceptions import APIError
-from ..generated.api.attack_detection import (
-    get_admin_realms_realm_attack_detection_brute_force_users_user_id,
-    delete_admin_realms_realm_attack_detection_brute_force_users,
-    delete_admin_realms_realm_attack_detection_brute_force_users_user_id,
-)
+from .base import BaseAPI, OK_UPDATE, lazy_import
+
+_ENDPOINTS = "ackc.generated.api.attack_detection"
+
+get_admin_realms_realm_attack_detection_brute_force_users_user_id = lazy_import(_ENDPOINTS, "get_admin_realms_realm_attack_detection_brute_force_users_user_id")
+delete_admin_realms_realm_attack_detection_brute_force_users = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_attack_detection_brute_force_users")
+delete_admin_realms_realm_attack_detection_brute_force_users_user_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_attack_detection_brute_force_users_user_id")
 
 __all__ = "AttackDetectionAPI", "AttackDetectionClientMixin"
 
 
 class AttackDetectionAPI(BaseAPI):
     """Attack detection API methods."""
+    __slots__ = ()
 
     def get_brute_force_user_status(self, realm: str | None = None, *, user_id: str) -> dict[str, Any] | None:
         """Get brute force detection status for a specific user.
@@ -63,8 +64,7 @@ class AttackDetectionAPI(BaseAPI):
             delete_admin_realms_realm_attack_detection_brute_force_users.sync_detailed,
             realm
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to clear brute force users: {response.status_code}")
+        self._check(response, OK_UPDATE, "clear brute force users")
 
     async def aclear_all_brute_force_users(self, realm: str | None = None) -> None:
         """Clear brute force attempts for all users in the realm (async).
@@ -81,8 +81,7 @@ class AttackDetectionAPI(BaseAPI):
             delete_admin_realms_realm_attack_detection_brute_force_users.asyncio_detailed,
             realm
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to clear brute force users: {response.status_code}")
+        self._check(response, OK_UPDATE, "clear brute force users")
 
     def clear_brute_force_user(self, realm: str | None = None, *, user_id: str) -> None:
         """Clear brute force attempts for a specific user.
@@ -101,8 +100,7 @@ class AttackDetectionAPI(BaseAPI):
             realm,
             user_id=user_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to clear brute force user: {response.status_code}")
+        self._check(response, OK_UPDATE, "clear brute force user")
 
     async def aclear_brute_force_user(self, realm: str | None = None, *, user_id: str) -> None:
         """Clear brute force attempts for a specific user (async).
@@ -121,8 +119,7 @@ class AttackDetectionAPI(BaseAPI):
             realm,
             user_id=user_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to clear brute force user: {response.status_code}")
+        self._check(response, OK_UPDATE, "clear brute force user")
 
 
 class AttackDetectionClientMixin:
@@ -2,54 +2,7 @@
 from functools import cached_property
 from typing import Any
 
-from .base import BaseAPI
-from ..generated.api.authentication_management import (
-    # Flows
-    get_admin_realms_realm_authentication_flows,
-    post_admin_realms_realm_authentication_flows,
-    get_admin_realms_realm_authentication_flows_id,
-    put_admin_realms_realm_authentication_flows_id,
-    delete_admin_realms_realm_authentication_flows_id,
-    post_admin_realms_realm_authentication_flows_flow_alias_copy,
-    # Executions
-    get_admin_realms_realm_authentication_flows_flow_alias_executions,
-    put_admin_realms_realm_authentication_flows_flow_alias_executions,
-    post_admin_realms_realm_authentication_flows_flow_alias_executions_execution,
-    post_admin_realms_realm_authentication_flows_flow_alias_executions_flow,
-    get_admin_realms_realm_authentication_executions_execution_id,
-    delete_admin_realms_realm_authentication_executions_execution_id,
-    post_admin_realms_realm_authentication_executions_execution_id_config,
-    post_admin_realms_realm_authentication_executions_execution_id_lower_priority,
-    post_admin_realms_realm_authentication_executions_execution_id_raise_priority,
-    get_admin_realms_realm_authentication_executions_execution_id_config_id,
-    post_admin_realms_realm_authentication_executions,
-    # Configs
-    get_admin_realms_realm_authentication_config_id,
-    put_admin_realms_realm_authentication_config_id,
-    delete_admin_realms_realm_authentication_config_id,
-    post_admin_realms_realm_authentication_config,
-    # Providers
-    get_admin_realms_realm_authentication_authenticator_providers,
-    get_admin_realms_realm_authentication_client_authenticator_providers,
-    get_admin_realms_realm_authentication_form_action_providers,
-    get_admin_realms_realm_authentication_form_providers,
-    # Required Actions
-    get_admin_realms_realm_authentication_required_actions,
-    get_admin_realms_realm_authentication_required_actions_alias,
-    put_admin_realms_realm_authentication_required_actions_alias,
-    delete_admin_realms_realm_authentication_required_actions_alias,
-    post_admin_realms_realm_authentication_required_actions_alias_lower_priority,
-    post_admin_realms_realm_authentication_required_actions_alias_raise_priority,
-    get_admin_realms_realm_authentication_unregistered_required_actions,
-    post_admin_realms_realm_authentication_register_required_action,
-    get_admin_realms_realm_authentication_required_actions_alias_config,
-    put_admin_realms_realm_authentication_required_actions_alias_config,
-    delete_admin_realms_realm_authentication_required_actions_alias_config,
-    get_admin_realms_realm_authentication_required_actions_alias_config_description,
-    # Config descriptions
-    get_admin_realms_realm_authentication_config_description_provider_id,
-    get_admin_realms_realm_authentication_per_client_config_description,
-)
+from .base import BaseAPI, OK_CREATE, OK_UPDATE, lazy_import, ttl_cached
 from ..generated.models import (
     AuthenticationExecutionRepresentation,
     AuthenticationFlowRepresentation,
@@ -64,7 +17,59 @@ from ..generated.models import (
     PostAdminRealmsRealmAuthenticationFlowsFlowAliasCopyBody,
     PostAdminRealmsRealmAuthenticationRegisterRequiredActionBody,
 )
-from ..exceptions import APIError
+
+_ENDPOINTS = "ackc.generated.api.authentication_management"
+
+# Flows
+get_admin_realms_realm_authentication_flows = lazy_import(_ENDPOINTS, "get_admin_realms_realm_authentication_flows")
+post_admin_realms_realm_authentication_flows = lazy_import(_ENDPOINTS, "post_admin_realms_realm_authentication_flows")
+get_admin_realms_realm_authentication_flows_id = lazy_import(_ENDPOINTS, "get_admin_realms_realm_authentication_flows_id")
+put_admin_realms_realm_authentication_flows_id = lazy_import(_ENDPOINTS, "put_admin_realms_realm_authentication_flows_id")
+delete_admin_realms_realm_authentication_flows_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_authentication_flows_id")
+post_admin_realms_realm_authentication_flows_flow_alias_copy = lazy_import(_ENDPOINTS, "post_admin_realms_realm_authentication_flows_flow_alias_copy")
+
+# Executions
+get_admin_realms_realm_authentication_flows_flow_alias_executions = lazy_import(_ENDPOINTS, "get_admin_realms_realm_authentication_flows_flow_alias_executions")
+put_admin_realms_realm_authentication_flows_flow_alias_executions = lazy_import(_ENDPOINTS, "put_admin_realms_realm_authentication_flows_flow_alias_executions")
+post_admin_realms_realm_authentication_flows_flow_alias_executions_execution = lazy_import(_ENDPOINTS, "post_admin_realms_realm_authentication_flows_flow_alias_executions_execution")
+post_admin_realms_realm_authentication_flows_flow_alias_executions_flow = lazy_import(_ENDPOINTS, "post_admin_realms_realm_authentication_flows_flow_alias_executions_flow")
+get_admin_realms_realm_authentication_executions_execution_id = lazy_import(_ENDPOINTS, "get_admin_realms_realm_authentication_executions_execution_id")
+delete_admin_realms_realm_authentication_executions_execution_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_authentication_executions_execution_id")
+post_admin_realms_realm_authentication_executions_execution_id_config = lazy_import(_ENDPOINTS, "post_admin_realms_realm_authentication_executions_execution_id_config")
+post_admin_realms_realm_authentication_executions_execution_id_lower_priority = lazy_import(_ENDPOINTS, "post_admin_realms_realm_authentication_executions_execution_id_lower_priority")
+post_admin_realms_realm_authentication_executions_execution_id_raise_priority = lazy_import(_ENDPOINTS, "post_admin_realms_realm_authentication_executions_execution_id_raise_priority")
+get_admin_realms_realm_authentication_executions_execution_id_config_id = lazy_import(_ENDPOINTS, "get_admin_realms_realm_authentication_executions_execution_id_config_id")
+post_admin_realms_realm_authentication_executions = lazy_import(_ENDPOINTS, "post_admin_realms_realm_authentication_executions")
+
+# Configs
+get_admin_realms_realm_authentication_config_id = lazy_import(_ENDPOINTS, "get_admin_realms_realm_authentication_config_id")
+put_admin_realms_realm_authentication_config_id = lazy_import(_ENDPOINTS, "put_admin_realms_realm_authentication_config_id")
+delete_admin_realms_realm_authentication_config_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_authentication_config_id")
+post_admin_realms_realm_authentication_config = lazy_import(_ENDPOINTS, "post_admin_realms_realm_authentication_config")
+
+# Providers
+get_admin_realms_realm_authentication_authenticator_providers = lazy_import(_ENDPOINTS, "get_admin_realms_realm_authentication_authenticator_providers")
+get_admin_realms_realm_authentication_client_authenticator_providers = lazy_import(_ENDPOINTS, "get_admin_realms_realm_authentication_client_authenticator_providers")
+get_admin_realms_realm_authentication_form_action_providers = lazy_import(_ENDPOINTS, "get_admin_realms_realm_authentication_form_action_providers")
+get_admin_realms_realm_authentication_form_providers = lazy_import(_ENDPOINTS, "get_admin_realms_realm_authentication_form_providers")
+
+# Required Actions
+get_admin_realms_realm_authentication_required_actions = lazy_import(_ENDPOINTS, "get_admin_realms_realm_authentication_required_actions")
+get_admin_realms_realm_authentication_required_actions_alias = lazy_import(_ENDPOINTS, "get_admin_realms_realm_authentication_required_actions_alias")
+put_admin_realms_realm_authentication_required_actions_alias = lazy_import(_ENDPOINTS, "put_admin_realms_realm_authentication_required_actions_alias")
+delete_admin_realms_realm_authentication_required_actions_alias = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_authentication_required_actions_alias")
+post_admin_realms_realm_authentication_required_actions_alias_lower_priority = lazy_import(_ENDPOINTS, "post_admin_realms_realm_authentication_required_actions_alias_lower_priority")
+post_admin_realms_realm_authentication_required_actions_alias_raise_priority = lazy_import(_ENDPOINTS, "post_admin_realms_realm_authentication_required_actions_alias_raise_priority")
+get_admin_realms_realm_authentication_unregistered_required_actions = lazy_import(_ENDPOINTS, "get_admin_realms_realm_authentication_unregistered_required_actions")
+post_admin_realms_realm_authentication_register_required_action = lazy_import(_ENDPOINTS, "post_admin_realms_realm_authentication_register_required_action")
+get_admin_realms_realm_authentication_required_actions_alias_config = lazy_import(_ENDPOINTS, "get_admin_realms_realm_authentication_required_actions_alias_config")
+put_admin_realms_realm_authentication_required_actions_alias_config = lazy_import(_ENDPOINTS, "put_admin_realms_realm_authentication_required_actions_alias_config")
+delete_admin_realms_realm_authentication_required_actions_alias_config = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_authentication_required_actions_alias_config")
+get_admin_realms_realm_authentication_required_actions_alias_config_description = lazy_import(_ENDPOINTS, "get_admin_realms_realm_authentication_required_actions_alias_config_description")
+
+# Config descriptions
+get_admin_realms_realm_authentication_config_description_provider_id = lazy_import(_ENDPOINTS, "get_admin_realms_realm_authentication_config_description_provider_id")
+get_admin_realms_realm_authentication_per_client_config_description = lazy_import(_ENDPOINTS, "get_admin_realms_realm_authentication_per_client_config_description")
 
 __all__ = (
     "AuthenticationAPI", 
@@ -77,8 +82,78 @@ __all__ = (
 )
 
 
+def _copy_flow_body(new_name: str) -> PostAdminRealmsRealmAuthenticationFlowsFlowAliasCopyBody:
+    """Build the copy-flow request body directly, skipping the dict-to-model conversion."""
+    body = PostAdminRealmsRealmAuthenticationFlowsFlowAliasCopyBody()
+    body["newName"] = new_name
+    return body
+
+
+def _add_execution_body(provider: str) -> PostAdminRealmsRealmAuthenticationFlowsFlowAliasExecutionsExecutionBody:
+    """Build the add-execution request body directly, skipping the dict-to-model conversion."""
+    body = PostAdminRealmsRealmAuthenticationFlowsFlowAliasExecutionsExecutionBody()
+    body["provider"] = provider
+    return body
+
+
+def _priority_moves(current: list[str], target: list[str]) -> list[tuple[str, int]]:
+    """Compute the raise-priority moves that turn `current` into `target`.
+
+    Each move is `(item, steps)`. Moving every item up into place in target order needs
+    exactly one step per inverted pair, the minimum for adjacent swaps.
+    """
+    if sorted(current) != sorted(target):
+        raise ValueError("The new order must list exactly the items being reordered")
+
+    order = list(current)
+    moves = []
+    for position, item in enumerate(target):
+        index = order.index(item)
+        if index > position:
+            moves.append((item, index - position))
+            order.insert(position, order.pop(index))
+    return moves
+
+
+def _reorder_moves(current: list[str], order: list[str]) -> list[tuple[str, int]]:
+    """Compute the raise-priority moves that put the items of `order` in that order within `current`.
+
+    `current` is the full server order, since each raise swaps with the adjacent item there.
+    The listed items are rearranged among the positions they occupy; unlisted items keep theirs.
+    """
+    wanted = set(order)
+    if len(wanted) != len(order) or not wanted.issubset(current):
+        raise ValueError("The new order must list distinct, existing items")
+    listed = iter(order)
+    target = [next(listed) if item in wanted else item for item in current]
+    return _priority_moves(current, target)
+
+
+def _execution_siblings(executions: list[AuthenticationExecutionInfoRepresentation], execution_ids: list[str]) -> list[str]:
+    """Return the IDs of all executions sharing the level and parent of `execution_ids`, in server order.
+
+    Executions are listed depth first, so an execution's parent is the latest one seen a level up.
+
+    Raises:
+        ValueError: If the IDs are unknown or not all siblings at one level
+    """
+    groups = {}
+    latest = {}
+    for execution in executions:
+        groups[execution.id] = (execution.level, latest.get(execution.level - 1))
+        latest[execution.level] = execution.id
+    keys = {groups.get(execution_id) for execution_id in execution_ids}
+    if None in keys or len(keys) > 1:
+        raise ValueError("execution_ids must be existing siblings at one level of the flow")
+    if not keys:
+        return []
+    key = keys.pop()
+    return [execution.id for execution in executions if groups[execution.id] == key]
+
+
 class AuthenticationAPI(BaseAPI):
     """Authentication management API methods."""
+    __slots__ = ()
 
     # Authentication Flows
     def get_flows(self, realm: str | None = None) -> list[AuthenticationFlowRepresentation] | None:
@@ -107,6 +182,22 @@ class AuthenticationAPI(BaseAPI):
         """
         return await self._async(get_admin_realms_realm_authentication_flows.asyncio, realm)
 
+    async def aget_flows_for_realms(self, realms: list[str], *, concurrency: int | None = None) -> dict[str, list[AuthenticationFlowRepresentation] | None]:
+        """Get authentication flows for several realms concurrently (async).
+
+        Args:
+            realms: Realm names to fetch flows for
+            concurrency: Maximum number of requests in flight at once (default: unbounded)
+
+        Returns:
+            Mapping of realm name to its list of authentication flows
+        """
+        results = await self.gather(
+            *(self.aget_flows(realm) for realm in realms),
+            concurrency=concurrency
+        )
+        return dict(zip(realms, results))
+
     def create_flow(self, realm: str | None = None, *, flow_data: dict | AuthenticationFlowRepresentation) -> None:
         """Create an authentication flow (sync).
         
@@ -123,8 +214,7 @@ class AuthenticationAPI(BaseAPI):
             flow_data,
             AuthenticationFlowRepresentation
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create flow: {response.status_code}")
+        self._check(response, OK_CREATE, "create flow")
 
     async def acreate_flow(self, realm: str | None = None, *, flow_data: dict | AuthenticationFlowRepresentation) -> None:
         """Create an authentication flow (async).
@@ -142,8 +232,7 @@ class AuthenticationAPI(BaseAPI):
             flow_data,
             AuthenticationFlowRepresentation
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create flow: {response.status_code}")
+        self._check(response, OK_CREATE, "create flow")
 
     def get_flow(self, realm: str | None = None, *, flow_id: str) -> AuthenticationFlowRepresentation | None:
         """Get an authentication flow by ID (sync).
@@ -195,8 +284,7 @@ class AuthenticationAPI(BaseAPI):
             AuthenticationFlowRepresentation,
             id=flow_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update flow: {response.status_code}")
+        self._check(response, OK_UPDATE, "update flow")
 
     async def aupdate_flow(self, realm: str | None = None, *, flow_id: str, flow_data: dict | AuthenticationFlowRepresentation) -> None:
         """Update an authentication flow (async).
@@ -216,8 +304,7 @@ class AuthenticationAPI(BaseAPI):
             AuthenticationFlowRepresentation,
             id=flow_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update flow: {response.status_code}")
+        self._check(response, OK_UPDATE, "update flow")
 
     def delete_flow(self, realm: str | None = None, *, flow_id: str) -> None:
         """Delete an authentication flow (sync).
@@ -234,8 +321,8 @@ class AuthenticationAPI(BaseAPI):
             realm,
             id=flow_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete flow: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete flow")
+        self.flush_cache(realm or self.realm)
 
     async def adelete_flow(self, realm: str | None = None, *, flow_id: str) -> None:
         """Delete an authentication flow (async).
@@ -252,8 +339,8 @@ class AuthenticationAPI(BaseAPI):
             realm,
             id=flow_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete flow: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete flow")
+        self.flush_cache(realm or self.realm)
 
     def copy_flow(self, realm: str | None = None, *, flow_alias: str, new_name: str) -> None:
         """Copy an authentication flow (sync).
@@ -266,15 +353,13 @@ class AuthenticationAPI(BaseAPI):
         Raises:
             APIError: If flow copy fails
         """
-        response = self._sync_detailed_model(
+        response = self._sync_detailed(
             post_admin_realms_realm_authentication_flows_flow_alias_copy.sync_detailed,
             realm,
-            {"newName": new_name},
-            PostAdminRealmsRealmAuthenticationFlowsFlowAliasCopyBody,
+            _copy_flow_body(new_name),
             flow_alias=flow_alias
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to copy flow: {response.status_code}")
+        self._check(response, OK_CREATE, "copy flow")
 
     async def acopy_flow(self, realm: str | None = None, *, flow_alias: str, new_name: str) -> None:
         """Copy an authentication flow (async).
@@ -287,15 +372,13 @@ class AuthenticationAPI(BaseAPI):
         Raises:
             APIError: If flow copy fails
         """
-        response = await self._async_detailed_model(
+        response = await self._async_detailed(
             post_admin_realms_realm_authentication_flows_flow_alias_copy.asyncio_detailed,
             realm,
-            {"newName": new_name},
-            PostAdminRealmsRealmAuthenticationFlowsFlowAliasCopyBody,
+            _copy_flow_body(new_name),
             flow_alias=flow_alias
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to copy flow: {response.status_code}")
+        self._check(response, OK_CREATE, "copy flow")
 
     # Flow Executions
     def get_executions(self, realm: str | None = None, *, flow_alias: str) -> list[AuthenticationExecutionInfoRepresentation] | None:
@@ -330,6 +413,62 @@ class AuthenticationAPI(BaseAPI):
             flow_alias=flow_alias
         )
 
+    async def aget_executions_for_flows(self, realm: str | None = None, *, flow_aliases: list[str], concurrency: int | None = None) -> dict[str, list[AuthenticationExecutionInfoRepresentation] | None]:
+        """Get executions for several flows concurrently (async).
+
+        Args:
+            realm: The realm name
+            flow_aliases: Flow aliases to fetch executions for
+            concurrency: Maximum number of requests in flight at once (default: unbounded)
+
+        Returns:
+            Mapping of flow alias to its list of authentication executions
+        """
+        results = await self.gather(
+            *(self.aget_executions(realm, flow_alias=alias) for alias in flow_aliases),
+            concurrency=concurrency
+        )
+        return dict(zip(flow_aliases, results))
+
+    async def aget_all_flows_with_executions(self, realm: str | None = None, *, concurrency: int | None = 16) -> dict[str, list[AuthenticationExecutionInfoRepresentation] | None]:
+        """Get executions for every flow in a realm (async).
+
+        Preferred over calling `aget_executions()` per flow: the per-flow requests are issued
+        concurrently over the shared session.
+
+        Args:
+            realm: The realm name
+            concurrency: Maximum number of requests in flight at once (default: 16)
+
+        Returns:
+            Mapping of flow alias to its list of authentication executions
+        """
+        flows = await self.aget_flows(realm) or []
+        return await self.aget_executions_for_flows(
+            realm,
+            flow_aliases=[flow.alias for flow in flows],
+            concurrency=concurrency
+        )
+
+    async def aprefetch_flow(self, realm: str | None = None, *, flow_alias: str, concurrency: int | None = 16) -> None:
+        """Warm the cache for editing a flow (async).
+
+        Concurrently fetches every execution of the flow and the unregistered required
+        actions, so follow-up `aget_execution()` and `aget_unregistered_required_actions()`
+        calls are served from the cache while it is fresh.
+
+        Args:
+            realm: The realm name
+            flow_alias: Flow alias
+            concurrency: Maximum number of requests in flight at once (default: 16)
+        """
+        executions = await self.aget_executions(realm, flow_alias=flow_alias) or []
+        await self.gather(
+            *(self.aget_execution(realm, execution_id=execution.id) for execution in executions),
+            self.aget_unregistered_required_actions(realm),
+            concurrency=concurrency
+        )
+
     def update_executions(self, realm: str | None = None, *, flow_alias: str, execution_data: dict | AuthenticationExecutionInfoRepresentation) -> None:
         """Update executions for a flow (sync).
         
@@ -348,8 +487,8 @@ class AuthenticationAPI(BaseAPI):
             AuthenticationExecutionInfoRepresentation,
             flow_alias=flow_alias
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update executions: {response.status_code}")
+        self._check(response, OK_UPDATE, "update executions")
+        self.flush_cache(realm or self.realm)
 
     async def aupdate_executions(self, realm: str | None = None, *, flow_alias: str, execution_data: dict | AuthenticationExecutionInfoRepresentation) -> None:
         """Update executions for a flow (async).
@@ -369,8 +508,8 @@ class AuthenticationAPI(BaseAPI):
             AuthenticationExecutionInfoRepresentation,
             flow_alias=flow_alias
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update executions: {response.status_code}")
+        self._check(response, OK_UPDATE, "update executions")
+        self.flush_cache(realm or self.realm)
 
     # Authenticator Config
     def get_config(self, realm: str | None = None, *, config_id: str) -> AuthenticatorConfigRepresentation | None:
@@ -424,10 +563,9 @@ class AuthenticationAPI(BaseAPI):
             config_data,
             AuthenticatorConfigRepresentation
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create config: {response.status_code}")
+        self._check(response, OK_CREATE, "create config")
         location = response.headers.get("Location", "")
-        return location.split("/")[-1] if location else ""
+        return location.rpartition("/")[2]
 
     async def acreate_config(self, realm: str | None = None, *, config_data: dict | AuthenticatorConfigRepresentation) -> str:
         """Create authenticator configuration (async).
@@ -448,10 +586,9 @@ class AuthenticationAPI(BaseAPI):
             config_data,
             AuthenticatorConfigRepresentation
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create config: {response.status_code}")
+        self._check(response, OK_CREATE, "create config")
         location = response.headers.get("Location", "")
-        return location.split("/")[-1] if location else ""
+        return location.rpartition("/")[2]
 
     def update_config(self, realm: str | None = None, *, config_id: str, config_data: dict | AuthenticatorConfigRepresentation) -> None:
         """Update authenticator configuration (sync).
@@ -471,8 +608,8 @@ class AuthenticationAPI(BaseAPI):
             AuthenticatorConfigRepresentation,
             id=config_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update config: {response.status_code}")
+        self._check(response, OK_UPDATE, "update config")
+        self.flush_cache(realm or self.realm)
 
     async def aupdate_config(self, realm: str | None = None, *, config_id: str, config_data: dict | AuthenticatorConfigRepresentation) -> None:
         """Update authenticator configuration (async).
@@ -492,8 +629,8 @@ class AuthenticationAPI(BaseAPI):
             AuthenticatorConfigRepresentation,
             id=config_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update config: {response.status_code}")
+        self._check(response, OK_UPDATE, "update config")
+        self.flush_cache(realm or self.realm)
 
     def delete_config(self, realm: str | None = None, *, config_id: str) -> None:
         """Delete authenticator configuration (sync).
@@ -510,8 +647,8 @@ class AuthenticationAPI(BaseAPI):
             realm,
             id=config_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete config: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete config")
+        self.flush_cache(realm or self.realm)
 
     async def adelete_config(self, realm: str | None = None, *, config_id: str) -> None:
         """Delete authenticator configuration (async).
@@ -528,10 +665,11 @@ class AuthenticationAPI(BaseAPI):
             realm,
             id=config_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete config: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete config")
+        self.flush_cache(realm or self.realm)
 
     # Providers
+    @ttl_cached()
     def get_authenticator_providers(self, realm: str | None = None) -> list[dict[str, Any]] | None:
         """Get authenticator providers (sync).
         
@@ -546,6 +684,7 @@ class AuthenticationAPI(BaseAPI):
             realm
         )
 
+    @ttl_cached()
     async def aget_authenticator_providers(self, realm: str | None = None) -> list[dict[str, Any]] | None:
         """Get authenticator providers (async).
         
@@ -560,6 +699,7 @@ class AuthenticationAPI(BaseAPI):
             realm
         )
 
+    @ttl_cached()
     def get_client_authenticator_providers(self, realm: str | None = None) -> list[dict[str, Any]] | None:
         """Get client authenticator providers (sync).
         
@@ -574,6 +714,7 @@ class AuthenticationAPI(BaseAPI):
             realm
         )
 
+    @ttl_cached()
     async def aget_client_authenticator_providers(self, realm: str | None = None) -> list[dict[str, Any]] | None:
         """Get client authenticator providers (async).
         
@@ -588,6 +729,7 @@ class AuthenticationAPI(BaseAPI):
             realm
         )
 
+    @ttl_cached()
     def get_form_action_providers(self, realm: str | None = None) -> list[dict[str, Any]] | None:
         """Get form action providers (sync).
         
@@ -602,6 +744,7 @@ class AuthenticationAPI(BaseAPI):
             realm
         )
 
+    @ttl_cached()
     async def aget_form_action_providers(self, realm: str | None = None) -> list[dict[str, Any]] | None:
         """Get form action providers (async).
         
@@ -616,6 +759,7 @@ class AuthenticationAPI(BaseAPI):
             realm
         )
 
+    @ttl_cached()
     def get_form_providers(self, realm: str | None = None) -> list[dict[str, Any]] | None:
         """Get form providers (sync).
         
@@ -630,6 +774,7 @@ class AuthenticationAPI(BaseAPI):
             realm
         )
 
+    @ttl_cached()
     async def aget_form_providers(self, realm: str | None = None) -> list[dict[str, Any]] | None:
         """Get form providers (async).
         
@@ -727,8 +872,7 @@ class AuthenticationAPI(BaseAPI):
             RequiredActionProviderRepresentation,
             alias=alias
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update required action: {response.status_code}")
+        self._check(response, OK_UPDATE, "update required action")
 
     async def aupdate_required_action(self, realm: str | None = None, *, alias: str, action_data: dict | RequiredActionProviderRepresentation) -> None:
         """Update a required action (async).
@@ -748,8 +892,7 @@ class AuthenticationAPI(BaseAPI):
             RequiredActionProviderRepresentation,
             alias=alias
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update required action: {response.status_code}")
+        self._check(response, OK_UPDATE, "update required action")
 
     def delete_required_action(self, realm: str | None = None, *, alias: str) -> None:
         """Delete a required action (sync).
@@ -766,8 +909,8 @@ class AuthenticationAPI(BaseAPI):
             realm,
             alias=alias
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete required action: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete required action")
+        self.flush_cache(realm or self.realm)
 
     async def adelete_required_action(self, realm: str | None = None, *, alias: str) -> None:
         """Delete a required action (async).
@@ -784,9 +927,10 @@ class AuthenticationAPI(BaseAPI):
             realm,
             alias=alias
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete required action: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete required action")
+        self.flush_cache(realm or self.realm)
 
+    @ttl_cached()
     def get_unregistered_required_actions(self, realm: str | None = None) -> list[dict[str, str]] | None:
         """Get unregistered required actions (sync).
         
@@ -801,6 +945,7 @@ class AuthenticationAPI(BaseAPI):
             realm
         )
 
+    @ttl_cached()
     async def aget_unregistered_required_actions(self, realm: str | None = None) -> list[dict[str, str]] | None:
         """Get unregistered required actions (async).
         
@@ -831,8 +976,8 @@ class AuthenticationAPI(BaseAPI):
             provider_data,
             PostAdminRealmsRealmAuthenticationRegisterRequiredActionBody
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to register required action: {response.status_code}")
+        self._check(response, OK_CREATE, "register required action")
+        self.flush_cache(realm or self.realm)
 
     async def aregister_required_action(self, realm: str | None = None, *, provider_data: dict | PostAdminRealmsRealmAuthenticationRegisterRequiredActionBody) -> None:
         """Register a required action (async).
@@ -850,8 +995,70 @@ class AuthenticationAPI(BaseAPI):
             provider_data,
             PostAdminRealmsRealmAuthenticationRegisterRequiredActionBody
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to register required action: {response.status_code}")
+        self._check(response, OK_CREATE, "register required action")
+        self.flush_cache(realm or self.realm)
+
+    async def aregister_required_actions(self, realm: str | None = None, *, providers: list[dict | PostAdminRealmsRealmAuthenticationRegisterRequiredActionBody], concurrency: int | None = None) -> None:
+        """Register several required actions concurrently (async).
+
+        All registrations are sent at once over the shared session; every one is attempted
+        even if some fail.
+
+        Args:
+            realm: The realm name
+            providers: Provider configurations to register
+            concurrency: Maximum number of requests in flight at once (default: unbounded)
+
+        Raises:
+            APIError: If any registration fails
+        """
+        await self._agather_all(
+            "register required actions",
+            [self.aregister_required_action(realm, provider_data=provider) for provider in providers],
+            concurrency
+        )
+
+    def reorder_required_actions(self, realm: str | None = None, *, aliases: list[str]) -> None:
+        """Reorder required actions (sync).
+
+        Issues the minimum number of raise-priority calls. Each call swaps adjacent
+        required actions, so moves are planned against the full server order and applied
+        in order. Listed actions are rearranged among the positions they occupy; unlisted
+        actions keep theirs.
+
+        Args:
+            realm: The realm name
+            aliases: Aliases of the required actions to reorder, in the desired order
+
+        Raises:
+            ValueError: If aliases contains unknown or duplicate aliases
+            APIError: If a priority change fails
+        """
+        actions = self.get_required_actions(realm) or []
+        for alias, steps in _reorder_moves([action.alias for action in actions], aliases):
+            for _ in range(steps):
+                self.raise_required_action_priority(realm, alias=alias)
+
+    async def areorder_required_actions(self, realm: str | None = None, *, aliases: list[str]) -> None:
+        """Reorder required actions (async).
+
+        Issues the minimum number of raise-priority calls. Each call swaps adjacent
+        required actions, so moves are planned against the full server order and applied
+        in order. Listed actions are rearranged among the positions they occupy; unlisted
+        actions keep theirs.
+
+        Args:
+            realm: The realm name
+            aliases: Aliases of the required actions to reorder, in the desired order
+
+        Raises:
+            ValueError: If aliases contains unknown or duplicate aliases
+            APIError: If a priority change fails
+        """
+        actions = await self.aget_required_actions(realm) or []
+        for alias, steps in _reorder_moves([action.alias for action in actions], aliases):
+            for _ in range(steps):
+                await self.araise_required_action_priority(realm, alias=alias)
 
     def lower_required_action_priority(self, realm: str | None = None, *, alias: str) -> None:
         """Lower required action priority (sync).
@@ -868,8 +1075,7 @@ class AuthenticationAPI(BaseAPI):
             realm,
             alias=alias
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to lower required action priority: {response.status_code}")
+        self._check(response, OK_UPDATE, "lower required action priority")
 
     async def alower_required_action_priority(self, realm: str | None = None, *, alias: str) -> None:
         """Lower required action priority (async).
@@ -886,8 +1092,7 @@ class AuthenticationAPI(BaseAPI):
             realm,
             alias=alias
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to lower required action priority: {response.status_code}")
+        self._check(response, OK_UPDATE, "lower required action priority")
 
     def raise_required_action_priority(self, realm: str | None = None, *, alias: str) -> None:
         """Raise required action priority (sync).
@@ -904,8 +1109,7 @@ class AuthenticationAPI(BaseAPI):
             realm,
             alias=alias
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to raise required action priority: {response.status_code}")
+        self._check(response, OK_UPDATE, "raise required action priority")
 
     async def araise_required_action_priority(self, realm: str | None = None, *, alias: str) -> None:
         """Raise required action priority (async).
@@ -922,8 +1126,7 @@ class AuthenticationAPI(BaseAPI):
             realm,
             alias=alias
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to raise required action priority: {response.status_code}")
+        self._check(response, OK_UPDATE, "raise required action priority")
 
     # Execution management
     def add_execution(self, realm: str | None = None, *, flow_alias: str, provider: str) -> None:
@@ -937,15 +1140,13 @@ class AuthenticationAPI(BaseAPI):
         Raises:
             APIError: If adding execution fails
         """
-        response = self._sync_detailed_model(
+        response = self._sync_detailed(
             post_admin_realms_realm_authentication_flows_flow_alias_executions_execution.sync_detailed,
             realm,
-            {"provider": provider},
-            PostAdminRealmsRealmAuthenticationFlowsFlowAliasExecutionsExecutionBody,
+            body=_add_execution_body(provider),
             flow_alias=flow_alias
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to add execution: {response.status_code}")
+        self._check(response, OK_CREATE, "add execution")
 
     async def aadd_execution(self, realm: str | None = None, *, flow_alias: str, provider: str) -> None:
         """Add new authentication execution (async).
@@ -958,15 +1159,13 @@ class AuthenticationAPI(BaseAPI):
         Raises:
             APIError: If adding execution fails
         """
-        response = await self._async_detailed_model(
+        response = await self._async_detailed(
             post_admin_realms_realm_authentication_flows_flow_alias_executions_execution.asyncio_detailed,
             realm,
-            {"provider": provider},
-            PostAdminRealmsRealmAuthenticationFlowsFlowAliasExecutionsExecutionBody,
+            body=_add_execution_body(provider),
             flow_alias=flow_alias
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to add execution: {response.status_code}")
+        self._check(response, OK_CREATE, "add execution")
 
     def add_flow_execution(self, realm: str | None = None, *, flow_alias: str, flow_data: dict) -> None:
         """Add new flow to execution (sync).
@@ -986,8 +1185,7 @@ class AuthenticationAPI(BaseAPI):
             PostAdminRealmsRealmAuthenticationFlowsFlowAliasExecutionsFlowBody,
             flow_alias=flow_alias
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to add flow execution: {response.status_code}")
+        self._check(response, OK_CREATE, "add flow execution")
 
     async def aadd_flow_execution(self, realm: str | None = None, *, flow_alias: str, flow_data: dict) -> None:
         """Add new flow to execution (async).
@@ -1007,9 +1205,9 @@ class AuthenticationAPI(BaseAPI):
             PostAdminRealmsRealmAuthenticationFlowsFlowAliasExecutionsFlowBody,
             flow_alias=flow_alias
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to add flow execution: {response.status_code}")
+        self._check(response, OK_CREATE, "add flow execution")
 
+    @ttl_cached(ttl=5.0)
     def get_execution(self, realm: str | None = None, *, execution_id: str) -> AuthenticationExecutionRepresentation | None:
         """Get execution by ID (sync).
         
@@ -1026,6 +1224,7 @@ class AuthenticationAPI(BaseAPI):
             execution_id=execution_id
         )
 
+    @ttl_cached(ttl=5.0)
     async def aget_execution(self, realm: str | None = None, *, execution_id: str) -> AuthenticationExecutionRepresentation | None:
         """Get execution by ID (async).
         
@@ -1057,8 +1256,8 @@ class AuthenticationAPI(BaseAPI):
             realm,
             execution_id=execution_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete execution: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete execution")
+        self.flush_cache(realm or self.realm)
 
     async def adelete_execution(self, realm: str | None = None, *, execution_id: str) -> None:
         """Delete execution (async).
@@ -1075,8 +1274,8 @@ class AuthenticationAPI(BaseAPI):
             realm,
             execution_id=execution_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete execution: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete execution")
+        self.flush_cache(realm or self.realm)
 
     def create_execution_config(self, realm: str | None = None, *, execution_id: str, config_data: dict | AuthenticatorConfigRepresentation) -> None:
         """Create execution configuration (sync).
@@ -1096,8 +1295,8 @@ class AuthenticationAPI(BaseAPI):
             AuthenticatorConfigRepresentation,
             execution_id=execution_id
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create execution config: {response.status_code}")
+        self._check(response, OK_CREATE, "create execution config")
+        self.flush_cache(realm or self.realm)
 
     async def acreate_execution_config(self, realm: str | None = None, *, execution_id: str, config_data: dict | AuthenticatorConfigRepresentation) -> None:
         """Create execution configuration (async).
@@ -1117,8 +1316,8 @@ class AuthenticationAPI(BaseAPI):
             AuthenticatorConfigRepresentation,
             execution_id=execution_id
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create execution config: {response.status_code}")
+        self._check(response, OK_CREATE, "create execution config")
+        self.flush_cache(realm or self.realm)
 
     def lower_execution_priority(self, realm: str | None = None, *, execution_id: str) -> None:
         """Lower execution priority (sync).
@@ -1135,8 +1334,8 @@ class AuthenticationAPI(BaseAPI):
             realm,
             execution_id=execution_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to lower execution priority: {response.status_code}")
+        self._check(response, OK_UPDATE, "lower execution priority")
+        self.flush_cache(realm or self.realm)
 
     async def alower_execution_priority(self, realm: str | None = None, *, execution_id: str) -> None:
         """Lower execution priority (async).
@@ -1153,8 +1352,8 @@ class AuthenticationAPI(BaseAPI):
             realm,
             execution_id=execution_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to lower execution priority: {response.status_code}")
+        self._check(response, OK_UPDATE, "lower execution priority")
+        self.flush_cache(realm or self.realm)
 
     def raise_execution_priority(self, realm: str | None = None, *, execution_id: str) -> None:
         """Raise execution priority (sync).
@@ -1171,8 +1370,8 @@ class AuthenticationAPI(BaseAPI):
             realm,
             execution_id=execution_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to raise execution priority: {response.status_code}")
+        self._check(response, OK_UPDATE, "raise execution priority")
+        self.flush_cache(realm or self.realm)
 
     async def araise_execution_priority(self, realm: str | None = None, *, execution_id: str) -> None:
         """Raise execution priority (async).
@@ -1189,8 +1388,54 @@ class AuthenticationAPI(BaseAPI):
             realm,
             execution_id=execution_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to raise execution priority: {response.status_code}")
+        self._check(response, OK_UPDATE, "raise execution priority")
+        self.flush_cache(realm or self.realm)
+
+    def reorder_executions(self, realm: str | None = None, *, flow_alias: str, execution_ids: list[str]) -> None:
+        """Reorder sibling executions of a flow (sync).
+
+        Issues the minimum number of raise-priority calls. Each call swaps an execution
+        with its adjacent sibling, so moves are planned against all siblings at that level
+        and applied in order. Listed executions are rearranged among the positions they
+        occupy; unlisted siblings keep theirs.
+
+        Args:
+            realm: The realm name
+            flow_alias: Flow alias
+            execution_ids: Sibling execution IDs (same level and parent flow), in the desired order
+
+        Raises:
+            ValueError: If execution_ids contains unknown or duplicate IDs, or IDs from different levels
+            APIError: If a priority change fails
+        """
+        executions = self.get_executions(realm, flow_alias=flow_alias) or []
+        siblings = _execution_siblings(executions, execution_ids)
+        for execution_id, steps in _reorder_moves(siblings, execution_ids):
+            for _ in range(steps):
+                self.raise_execution_priority(realm, execution_id=execution_id)
+
+    async def areorder_executions(self, realm: str | None = None, *, flow_alias: str, execution_ids: list[str]) -> None:
+        """Reorder sibling executions of a flow (async).
+
+        Issues the minimum number of raise-priority calls. Each call swaps an execution
+        with its adjacent sibling, so moves are planned against all siblings at that level
+        and applied in order. Listed executions are rearranged among the positions they
+        occupy; unlisted siblings keep theirs.
+
+        Args:
+            realm: The realm name
+            flow_alias: Flow alias
+            execution_ids: Sibling execution IDs (same level and parent flow), in the desired order
+
+        Raises:
+            ValueError: If execution_ids contains unknown or duplicate IDs, or IDs from different levels
+            APIError: If a priority change fails
+        """
+        executions = await self.aget_executions(realm, flow_alias=flow_alias) or []
+        siblings = _execution_siblings(executions, execution_ids)
+        for execution_id, steps in _reorder_moves(siblings, execution_ids):
+            for _ in range(steps):
+                await self.araise_execution_priority(realm, execution_id=execution_id)
 
     def get_execution_config(self, realm: str | None = None, *, execution_id: str, config_id: str) -> AuthenticatorConfigRepresentation | None:
         """Get execution configuration by ID (sync).
@@ -1244,8 +1489,7 @@ class AuthenticationAPI(BaseAPI):
             execution_data,
             AuthenticationExecutionRepresentation
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create execution: {response.status_code}")
+        self._check(response, OK_CREATE, "create execution")
 
     async def acreate_execution(self, realm: str | None = None, *, execution_data: dict | AuthenticationExecutionRepresentation) -> None:
         """Create authentication execution (async).
@@ -1263,8 +1507,7 @@ class AuthenticationAPI(BaseAPI):
             execution_data,
             AuthenticationExecutionRepresentation
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create execution: {response.status_code}")
+        self._check(response, OK_CREATE, "create execution")
 
     def get_required_action_config(self, realm: str | None = None, *, alias: str) -> RequiredActionConfigRepresentation | None:
         """Get required action configuration (sync).
@@ -1316,8 +1559,7 @@ class AuthenticationAPI(BaseAPI):
             RequiredActionConfigRepresentation,
             alias=alias
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update required action config: {response.status_code}")
+        self._check(response, OK_UPDATE, "update required action config")
 
     async def aupdate_required_action_config(self, realm: str | None = None, *, alias: str, config_data: dict | RequiredActionConfigRepresentation) -> None:
         """Update required action configuration (async).
@@ -1337,8 +1579,7 @@ class AuthenticationAPI(BaseAPI):
             RequiredActionConfigRepresentation,
             alias=alias
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update required action config: {response.status_code}")
+        self._check(response, OK_UPDATE, "update required action config")
 
     def delete_required_action_config(self, realm: str | None = None, *, alias: str) -> None:
         """Delete required action configuration (sync).
@@ -1355,8 +1596,7 @@ class AuthenticationAPI(BaseAPI):
             realm,
             alias=alias
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete required action config: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete required action config")
 
     async def adelete_required_action_config(self, realm: str | None = None, *, alias: str) -> None:
         """Delete required action configuration (async).
@@ -1373,8 +1613,7 @@ class AuthenticationAPI(BaseAPI):
             realm,
             alias=alias
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete required action config: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete required action config")
 
     def get_required_action_config_description(self, realm: str | None = None, *, alias: str) -> RequiredActionConfigInfoRepresentation | None:
         """Get required action configuration description (sync).
@@ -1408,6 +1647,7 @@ class AuthenticationAPI(BaseAPI):
             alias=alias
         )
 
+    @ttl_cached()
     def get_config_description(self, realm: str | None = None, *, provider_id: str) -> AuthenticatorConfigInfoRepresentation | None:
         """Get authenticator configuration description (sync).
         
@@ -1424,6 +1664,7 @@ class AuthenticationAPI(BaseAPI):
             provider_id=provider_id
         )
 
+    @ttl_cached()
     async def aget_config_description(self, realm: str | None = None, *, provider_id: str) -> AuthenticatorConfigInfoRepresentation | None:
         """Get authenticator configuration description (async).
         
@@ -1,47 +1,9 @@
 """Authorization management API methods."""
 import json
 from functools import cached_property
-from typing import Any
-
-from .base import BaseAPI
-from ..generated.api.default import (
-    # Resource Server
-    get_admin_realms_realm_clients_client_uuid_authz_resource_server,
-    put_admin_realms_realm_clients_client_uuid_authz_resource_server,
-    get_admin_realms_realm_clients_client_uuid_authz_resource_server_settings,
-    post_admin_realms_realm_clients_client_uuid_authz_resource_server_import,
-    # Resources
-    get_admin_realms_realm_clients_client_uuid_authz_resource_server_resource,
-    post_admin_realms_realm_clients_client_uuid_authz_resource_server_resource,
-    get_admin_realms_realm_clients_client_uuid_authz_resource_server_resource_resource_id,
-    put_admin_realms_realm_clients_client_uuid_authz_resource_server_resource_resource_id,
-    delete_admin_realms_realm_clients_client_uuid_authz_resource_server_resource_resource_id,
-    get_admin_realms_realm_clients_client_uuid_authz_resource_server_resource_search,
-    get_admin_realms_realm_clients_client_uuid_authz_resource_server_resource_resource_id_attributes,
-    get_admin_realms_realm_clients_client_uuid_authz_resource_server_resource_resource_id_permissions,
-    get_admin_realms_realm_clients_client_uuid_authz_resource_server_resource_resource_id_scopes,
-    # Scopes  
-    get_admin_realms_realm_clients_client_uuid_authz_resource_server_scope,
-    post_admin_realms_realm_clients_client_uuid_authz_resource_server_scope,
-    get_admin_realms_realm_clients_client_uuid_authz_resource_server_scope_scope_id,
-    put_admin_realms_realm_clients_client_uuid_authz_resource_server_scope_scope_id,
-    delete_admin_realms_realm_clients_client_uuid_authz_resource_server_scope_scope_id,
-    get_admin_realms_realm_clients_client_uuid_authz_resource_server_scope_search,
-    get_admin_realms_realm_clients_client_uuid_authz_resource_server_scope_scope_id_permissions,
-    get_admin_realms_realm_clients_client_uuid_authz_resource_server_scope_scope_id_resources,
-    # Policies
-    get_admin_realms_realm_clients_client_uuid_authz_resource_server_policy,
-    post_admin_realms_realm_clients_client_uuid_authz_resource_server_policy,
-    get_admin_realms_realm_clients_client_uuid_authz_resource_server_policy_search,
-    get_admin_realms_realm_clients_client_uuid_authz_resource_server_policy_providers,
-    post_admin_realms_realm_clients_client_uuid_authz_resource_server_policy_evaluate,
-    # Permissions
-    get_admin_realms_realm_clients_client_uuid_authz_resource_server_permission,
-    post_admin_realms_realm_clients_client_uuid_authz_resource_server_permission,
-    get_admin_realms_realm_clients_client_uuid_authz_resource_server_permission_search,
-    get_admin_realms_realm_clients_client_uuid_authz_resource_server_permission_providers,
-    post_admin_realms_realm_clients_client_uuid_authz_resource_server_permission_evaluate,
-)
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Sequence
+
+from .base import BaseAPI, OK_CREATE, OK_UPDATE, OK_ADD, OK_READ, lazy_import, ttl_cached
 from ..generated.models import (
     ResourceServerRepresentation,
     ResourceRepresentation,
@@ -54,7 +16,49 @@ from ..generated.models import (
     PolicyRepresentation,
 )
 from ..generated.types import UNSET, Unset
-from ..exceptions import APIError
+
+_ENDPOINTS = "ackc.generated.api.default"
+
+# Resource Server
+get_admin_realms_realm_clients_client_uuid_authz_resource_server = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_authz_resource_server")
+put_admin_realms_realm_clients_client_uuid_authz_resource_server = lazy_import(_ENDPOINTS, "put_admin_realms_realm_clients_client_uuid_authz_resource_server")
+get_admin_realms_realm_clients_client_uuid_authz_resource_server_settings = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_authz_resource_server_settings")
+post_admin_realms_realm_clients_client_uuid_authz_resource_server_import = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients_client_uuid_authz_resource_server_import")
+
+# Resources
+get_admin_realms_realm_clients_client_uuid_authz_resource_server_resource = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_authz_resource_server_resource")
+post_admin_realms_realm_clients_client_uuid_authz_resource_server_resource = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients_client_uuid_authz_resource_server_resource")
+get_admin_realms_realm_clients_client_uuid_authz_resource_server_resource_resource_id = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_authz_resource_server_resource_resource_id")
+put_admin_realms_realm_clients_client_uuid_authz_resource_server_resource_resource_id = lazy_import(_ENDPOINTS, "put_admin_realms_realm_clients_client_uuid_authz_resource_server_resource_resource_id")
+delete_admin_realms_realm_clients_client_uuid_authz_resource_server_resource_resource_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_clients_client_uuid_authz_resource_server_resource_resource_id")
+get_admin_realms_realm_clients_client_uuid_authz_resource_server_resource_search = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_authz_resource_server_resource_search")
+get_admin_realms_realm_clients_client_uuid_authz_resource_server_resource_resource_id_attributes = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_authz_resource_server_resource_resource_id_attributes")
+get_admin_realms_realm_clients_client_uuid_authz_resource_server_resource_resource_id_permissions = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_authz_resource_server_resource_resource_id_permissions")
+get_admin_realms_realm_clients_client_uuid_authz_resource_server_resource_resource_id_scopes = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_authz_resource_server_resource_resource_id_scopes")
+
+# Scopes
+get_admin_realms_realm_clients_client_uuid_authz_resource_server_scope = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_authz_resource_server_scope")
+post_admin_realms_realm_clients_client_uuid_authz_resource_server_scope = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients_client_uuid_authz_resource_server_scope")
+get_admin_realms_realm_clients_client_uuid_authz_resource_server_scope_scope_id = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_authz_resource_server_scope_scope_id")
+put_admin_realms_realm_clients_client_uuid_authz_resource_server_scope_scope_id = lazy_import(_ENDPOINTS, "put_admin_realms_realm_clients_client_uuid_authz_resource_server_scope_scope_id")
+delete_admin_realms_realm_clients_client_uuid_authz_resource_server_scope_scope_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_clients_client_uuid_authz_resource_server_scope_scope_id")
+get_admin_realms_realm_clients_client_uuid_authz_resource_server_scope_search = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_authz_resource_server_scope_search")
+get_admin_realms_realm_clients_client_uuid_authz_resource_server_scope_scope_id_permissions = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_authz_resource_server_scope_scope_id_permissions")
+get_admin_realms_realm_clients_client_uuid_authz_resource_server_scope_scope_id_resources = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_authz_resource_server_scope_scope_id_resources")
+
+# Policies
+get_admin_realms_realm_clients_client_uuid_authz_resource_server_policy = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_authz_resource_server_policy")
+post_admin_realms_realm_clients_client_uuid_authz_resource_server_policy = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients_client_uuid_authz_resource_server_policy")
+get_admin_realms_realm_clients_client_uuid_authz_resource_server_policy_search = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_authz_resource_server_policy_search")
+get_admin_realms_realm_clients_client_uuid_authz_resource_server_policy_providers = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_authz_resource_server_policy_providers")
+post_admin_realms_realm_clients_client_uuid_authz_resource_server_policy_evaluate = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients_client_uuid_authz_resource_server_policy_evaluate")
+
+# Permissions
+get_admin_realms_realm_clients_client_uuid_authz_resource_server_permission = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_authz_resource_server_permission")
+post_admin_realms_realm_clients_client_uuid_authz_resource_server_permission = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients_client_uuid_authz_resource_server_permission")
+get_admin_realms_realm_clients_client_uuid_authz_resource_server_permission_search = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_authz_resource_server_permission_search")
+get_admin_realms_realm_clients_client_uuid_authz_resource_server_permission_providers = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_authz_resource_server_permission_providers")
+post_admin_realms_realm_clients_client_uuid_authz_resource_server_permission_evaluate = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients_client_uuid_authz_resource_server_permission_evaluate")
 
 __all__ = (
     "AuthorizationAPI",
@@ -68,13 +72,110 @@ __all__ = (
     "PolicyEvaluationRequest",
     "EvaluationResultRepresentation",
     "PolicyRepresentation",
+    "build_resource_server",
 )
 
 
+_PARAM_RENAMES = {"max": "max_", "type": "type_"}
+
+_BATCH_READS = frozenset((
+    "get_resources", "search_resources", "get_scopes", "search_scopes",
+    "get_policies", "search_policies", "get_policy_providers",
+    "get_permissions", "search_permissions", "get_permission_providers",
+))
+
+
+def _query_params(**params) -> dict[str, Any]:
+    """Drop unset query parameters and rename the ones the generated client suffixes with `_`."""
+    return {_PARAM_RENAMES.get(key, key): value for key, value in params.items() if value is not UNSET}
+
+
+def _as_dict(item: dict | Any) -> dict:
+    return item if isinstance(item, dict) else item.to_dict()
+
+
+# Resource server fields that an import resets to their defaults when absent.
+_SERVER_SETTINGS = ("policyEnforcementMode", "decisionStrategy", "allowRemoteResourceManagement")
+
+
+def _server_settings(server: ResourceServerRepresentation | None) -> dict:
+    """Keep only the settings of a resource server, dropping its resources, scopes and policies."""
+    data = server.to_dict() if server is not None else {}
+    return {key: data[key] for key in _SERVER_SETTINGS if key in data}
+
+
+def build_resource_server(
+    resources: Sequence[dict | ResourceRepresentation] = (),
+    scopes: Sequence[dict | ScopeRepresentation] = (),
+    policies: Sequence[dict | PolicyRepresentation] = (),
+    *,
+    settings: dict | ResourceServerRepresentation | None = None
+) -> ResourceServerRepresentation:
+    """Compose a resource server representation suitable for `import_resource_server`.
+
+    Args:
+        resources: Resources to include
+        scopes: Scopes to include
+        policies: Policies and permissions to include; they refer to resources and scopes by name
+        settings: Resource server settings (policy enforcement mode, decision strategy, ...) to start from
+
+    Returns:
+        The combined resource server representation
+    """
+    data = dict(_as_dict(settings)) if settings is not None else {}
+    data["resources"] = [_as_dict(resource) for resource in resources]
+    data["scopes"] = [_as_dict(scope) for scope in scopes]
+    data["policies"] = [_as_dict(policy) for policy in policies]
+    return ResourceServerRepresentation.from_dict(data)
+
+
 class AuthorizationAPI(BaseAPI):
     """Authorization management API methods for resource servers, policies, permissions, and resources."""
+    __slots__ = ()
+
+    async def _aget_pages(self, fetch: Callable[[int, int], Awaitable[list | None]], page_size: int, concurrency: int) -> list:
+        """Fetch `concurrency` pages at a time until one comes back short, and concatenate them."""
+        if page_size < 1 or concurrency < 1:
+            raise ValueError("page_size and concurrency must be at least 1")
+        items = []
+        first = 0
+        while True:
+            pages = await self.gather(*(fetch(first + i * page_size, page_size) for i in range(concurrency)))
+            for page in pages:
+                items.extend(page or ())
+                if not page or len(page) < page_size:
+                    return items
+            first += concurrency * page_size
+
+    @staticmethod
+    def _iter_pages(fetch: Callable[[int, int], list | None], page_size: int) -> Iterator:
+        """Yield items page by page until a page comes back short."""
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        first = 0
+        while True:
+            page = fetch(first, page_size) or []
+            yield from page
+            if len(page) < page_size:
+                return
+            first += page_size
+
+    @staticmethod
+    async def _aiter_pages(fetch: Callable[[int, int], Awaitable[list | None]], page_size: int) -> AsyncIterator:
+        """Yield items page by page until a page comes back short (async)."""
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        first = 0
+        while True:
+            page = await fetch(first, page_size) or []
+            for item in page:
+                yield item
+            if len(page) < page_size:
+                return
+            first += page_size
 
     # Resource Server Management
+    @ttl_cached(ttl=120.0)
     def get_resource_server(self, realm: str | None = None, *, client_uuid: str) -> ResourceServerRepresentation | None:
         """Get resource server settings (sync).
         
@@ -91,6 +192,7 @@ class AuthorizationAPI(BaseAPI):
             client_uuid=client_uuid
         )
 
+    @ttl_cached(ttl=120.0)
     async def aget_resource_server(self, realm: str | None = None, *, client_uuid: str) -> ResourceServerRepresentation | None:
         """Get resource server settings (async).
         
@@ -125,8 +227,8 @@ class AuthorizationAPI(BaseAPI):
             ResourceServerRepresentation,
             client_uuid=client_uuid
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update resource server: {response.status_code}")
+        self._check(response, OK_UPDATE, "update resource server")
+        self.flush_cache(realm or self.realm)
 
     async def aupdate_resource_server(self, realm: str | None = None, *, client_uuid: str, server_data: dict | ResourceServerRepresentation) -> None:
         """Update resource server settings (async).
@@ -146,9 +248,10 @@ class AuthorizationAPI(BaseAPI):
             ResourceServerRepresentation,
             client_uuid=client_uuid
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update resource server: {response.status_code}")
+        self._check(response, OK_UPDATE, "update resource server")
+        self.flush_cache(realm or self.realm)
 
+    @ttl_cached(ttl=120.0)
     def get_resource_server_settings(self, realm: str | None = None, *, client_uuid: str) -> ResourceServerRepresentation | None:
         """Get resource server configuration settings (sync).
         
@@ -165,6 +268,7 @@ class AuthorizationAPI(BaseAPI):
             client_uuid=client_uuid
         )
 
+    @ttl_cached(ttl=120.0)
     async def aget_resource_server_settings(self, realm: str | None = None, *, client_uuid: str) -> ResourceServerRepresentation | None:
         """Get resource server configuration settings (async).
         
@@ -199,8 +303,8 @@ class AuthorizationAPI(BaseAPI):
             ResourceServerRepresentation,
             client_uuid=client_uuid
         )
-        if response.status_code not in (200, 201, 204):
-            raise APIError(f"Failed to import resource server: {response.status_code}")
+        self._check(response, OK_ADD, "import resource server")
+        self.flush_cache(realm or self.realm)
 
     async def aimport_resource_server(self, realm: str | None = None, *, client_uuid: str, import_data: dict | ResourceServerRepresentation) -> None:
         """Import resource server configuration (async).
@@ -220,8 +324,135 @@ class AuthorizationAPI(BaseAPI):
             ResourceServerRepresentation,
             client_uuid=client_uuid
         )
-        if response.status_code not in (200, 201, 204):
-            raise APIError(f"Failed to import resource server: {response.status_code}")
+        self._check(response, OK_ADD, "import resource server")
+        self.flush_cache(realm or self.realm)
+
+    def bulk_provision(
+        self,
+        realm: str | None = None,
+        *,
+        client_uuid: str,
+        resources: Sequence[dict | ResourceRepresentation] = (),
+        scopes: Sequence[dict | ScopeRepresentation] = (),
+        policies: Sequence[dict | PolicyRepresentation] = (),
+        settings: dict | ResourceServerRepresentation | None = None
+    ) -> None:
+        """Provision resources, scopes and policies with a single import request (sync).
+        
+        Keycloak creates every entity server-side, so this replaces one request per
+        create_resource/create_scope/create_policy call with one request in total.
+        The import resets any settings it does not carry, so the current ones are read first
+        unless `settings` is given.
+        
+        Args:
+            realm: The realm name
+            client_uuid: Client UUID
+            resources: Resources to create
+            scopes: Scopes to create
+            policies: Policies and permissions to create
+            settings: Resource server settings to import alongside them; the current settings are kept when omitted
+        
+        Raises:
+            APIError: If import fails
+        """
+        if settings is None:
+            settings = _server_settings(self._sync(
+                get_admin_realms_realm_clients_client_uuid_authz_resource_server.sync,
+                realm,
+                client_uuid=client_uuid
+            ))
+        self.import_resource_server(
+            realm,
+            client_uuid=client_uuid,
+            import_data=build_resource_server(resources, scopes, policies, settings=settings)
+        )
+
+    async def abulk_provision(
+        self,
+        realm: str | None = None,
+        *,
+        client_uuid: str,
+        resources: Sequence[dict | ResourceRepresentation] = (),
+        scopes: Sequence[dict | ScopeRepresentation] = (),
+        policies: Sequence[dict | PolicyRepresentation] = (),
+        settings: dict | ResourceServerRepresentation | None = None
+    ) -> None:
+        """Provision resources, scopes and policies with a single import request (async).
+        
+        Args:
+            realm: The realm name
+            client_uuid: Client UUID
+            resources: Resources to create
+            scopes: Scopes to create
+            policies: Policies and permissions to create
+            settings: Resource server settings to import alongside them; the current settings are kept when omitted
+        
+        Raises:
+            APIError: If import fails
+        """
+        if settings is None:
+            settings = _server_settings(await self._async(
+                get_admin_realms_realm_clients_client_uuid_authz_resource_server.asyncio,
+                realm,
+                client_uuid=client_uuid
+            ))
+        await self.aimport_resource_server(
+            realm,
+            client_uuid=client_uuid,
+            import_data=build_resource_server(resources, scopes, policies, settings=settings)
+        )
+
+    async def aprefetch_common(self, realm: str | None = None, *, client_uuid: str) -> tuple[ResourceServerRepresentation | None, list[ResourceRepresentation] | None, list[ScopeRepresentation] | None, list[AbstractPolicyRepresentation] | None]:
+        """Fetch the resource server with its resources, scopes and policies concurrently (async).
+        
+        The four requests are issued together, so this costs about one round trip. Cached
+        lookups (`aget_resource_server()`, `aget_policies()`) are primed as a side effect.
+        
+        Args:
+            realm: The realm name
+            client_uuid: Client UUID
+        
+        Returns:
+            Tuple of (resource server, resources, scopes, policies)
+        """
+        return tuple(await self.gather(
+            self.aget_resource_server(realm, client_uuid=client_uuid),
+            self.aget_resources(realm, client_uuid=client_uuid),
+            self.aget_scopes(realm, client_uuid=client_uuid),
+            self.aget_policies(realm, client_uuid=client_uuid)
+        ))
+
+    async def abatch_authz(self, realm: str | None = None, *, client_uuid: str, specs: list[tuple[str, dict]], concurrency: int | None = None, return_exceptions: bool = False) -> list:
+        """Run several authorization listings concurrently (async).
+        
+        Example:
+            policies, permissions = await client.authorization.abatch_authz(
+                client_uuid=uuid,
+                specs=[("get_policies", {"type": "role"}), ("search_permissions", {"name": "admin"})]
+            )
+        
+        Args:
+            realm: The realm name
+            client_uuid: Client UUID
+            specs: (method name, filters) pairs; names are the sync read methods, e.g. "get_policies",
+                "search_permissions" or "get_policy_providers"
+            concurrency: Maximum number of requests in flight at once (default: unbounded)
+            return_exceptions: Return failures in place of results instead of raising the first one
+        
+        Returns:
+            Results in the order of `specs`
+        
+        Raises:
+            ValueError: If a spec names an unsupported method
+        """
+        for name, _ in specs:
+            if name not in _BATCH_READS:
+                raise ValueError(f"Unsupported batch read: {name}")
+        return await self.gather(
+            *(getattr(self, f"a{name}")(realm, client_uuid=client_uuid, **filters) for name, filters in specs),
+            return_exceptions=return_exceptions,
+            concurrency=concurrency
+        )
 
     # Resource Management
     def get_resources(
@@ -265,17 +496,19 @@ class AuthorizationAPI(BaseAPI):
             get_admin_realms_realm_clients_client_uuid_authz_resource_server_resource.sync,
             realm,
             client_uuid=client_uuid,
-            field_id=field_id,
-            deep=deep,
-            exact_name=exact_name,
-            first=first,
-            matching_uri=matching_uri,
-            max_=max,
-            name=name,
-            owner=owner,
-            scope=scope,
-            type_=type,
-            uri=uri,
+            **_query_params(
+                field_id=field_id,
+                deep=deep,
+                exact_name=exact_name,
+                first=first,
+                matching_uri=matching_uri,
+                max=max,
+                name=name,
+                owner=owner,
+                scope=scope,
+                type=type,
+                uri=uri
+            )
         )
 
     async def aget_resources(
@@ -319,17 +552,41 @@ class AuthorizationAPI(BaseAPI):
             get_admin_realms_realm_clients_client_uuid_authz_resource_server_resource.asyncio,
             realm,
             client_uuid=client_uuid,
-            field_id=field_id,
-            deep=deep,
-            exact_name=exact_name,
-            first=first,
-            matching_uri=matching_uri,
-            max_=max,
-            name=name,
-            owner=owner,
-            scope=scope,
-            type_=type,
-            uri=uri,
+            **_query_params(
+                field_id=field_id,
+                deep=deep,
+                exact_name=exact_name,
+                first=first,
+                matching_uri=matching_uri,
+                max=max,
+                name=name,
+                owner=owner,
+                scope=scope,
+                type=type,
+                uri=uri
+            )
+        )
+
+    async def aget_all_resources(self, realm: str | None = None, *, client_uuid: str, page_size: int = 100, concurrency: int = 8, **filters) -> list[ResourceRepresentation]:
+        """Get all resources, fetching pages concurrently (async).
+        
+        Pages are requested `concurrency` at a time until one comes back short, so a
+        listing of N pages takes about N / concurrency round trips.
+        
+        Args:
+            realm: The realm name
+            client_uuid: Client UUID
+            page_size: Number of resources per page
+            concurrency: Number of pages requested at once
+            **filters: Additional filters accepted by `aget_resources`
+        
+        Returns:
+            List of all matching resources
+        """
+        return await self._aget_pages(
+            lambda first, max: self.aget_resources(realm, client_uuid=client_uuid, first=first, max=max, **filters),
+            page_size,
+            concurrency
         )
 
     def create_resource(self, realm: str | None = None, *, client_uuid: str, resource_data: dict | ResourceRepresentation) -> ResourceRepresentation:
@@ -353,8 +610,8 @@ class AuthorizationAPI(BaseAPI):
             model_class=ResourceRepresentation,
             client_uuid=client_uuid
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create resource: {response.status_code}")
+        self._check(response, OK_CREATE, "create resource")
+        self.flush_cache(realm or self.realm)
         return response.parsed
 
     async def acreate_resource(self, realm: str | None = None, *, client_uuid: str, resource_data: dict | ResourceRepresentation) -> ResourceRepresentation:
@@ -378,10 +635,33 @@ class AuthorizationAPI(BaseAPI):
             model_class=ResourceRepresentation,
             client_uuid=client_uuid
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create resource: {response.status_code}")
+        self._check(response, OK_CREATE, "create resource")
+        self.flush_cache(realm or self.realm)
         return response.parsed
 
+    async def acreate_resources(self, realm: str | None = None, *, client_uuid: str, resources: list[dict | ResourceRepresentation], concurrency: int | None = 16) -> list[ResourceRepresentation]:
+        """Create several resources concurrently (async).
+        
+        All requests share the client's pooled session; every one is attempted even if some fail.
+        
+        Args:
+            realm: The realm name
+            client_uuid: Client UUID
+            resources: Resource configurations to create
+            concurrency: Maximum number of requests in flight at once (default: 16)
+        
+        Returns:
+            Created resource representations, in the order given
+        
+        Raises:
+            APIError: If any creation fails
+        """
+        return await self._agather_all(
+            "create resources",
+            [self.acreate_resource(realm, client_uuid=client_uuid, resource_data=resource) for resource in resources],
+            concurrency
+        )
+
     def get_resource(self, realm: str | None = None, *, client_uuid: str, resource_id: str) -> ResourceRepresentation | None:
         """Get a resource by ID (sync).
         
@@ -438,8 +718,8 @@ class AuthorizationAPI(BaseAPI):
             client_uuid=client_uuid,
             resource_id=resource_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update resource: {response.status_code}")
+        self._check(response, OK_UPDATE, "update resource")
+        self.flush_cache(realm or self.realm)
 
     async def aupdate_resource(self, realm: str | None = None, *, client_uuid: str, resource_id: str, resource_data: dict | ResourceRepresentation) -> None:
         """Update a resource (async).
@@ -461,8 +741,27 @@ class AuthorizationAPI(BaseAPI):
             client_uuid=client_uuid,
             resource_id=resource_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update resource: {response.status_code}")
+        self._check(response, OK_UPDATE, "update resource")
+        self.flush_cache(realm or self.realm)
+
+    async def aupdate_resources(self, realm: str | None = None, *, client_uuid: str, resources: dict[str, dict | ResourceRepresentation], concurrency: int | None = 16) -> None:
+        """Update several resources concurrently (async).
+        
+        Args:
+            realm: The realm name
+            client_uuid: Client UUID
+            resources: Updated resource configurations, keyed by resource ID
+            concurrency: Maximum number of requests in flight at once (default: 16)
+        
+        Raises:
+            APIError: If any update fails
+        """
+        await self._agather_all(
+            "update resources",
+            [self.aupdate_resource(realm, client_uuid=client_uuid, resource_id=resource_id, resource_data=resource)
+             for resource_id, resource in resources.items()],
+            concurrency
+        )
 
     def delete_resource(
         self,
@@ -508,20 +807,22 @@ class AuthorizationAPI(BaseAPI):
             realm,
             client_uuid=client_uuid,
             resource_id=resource_id,
-            field_id=field_id,
-            deep=deep,
-            exact_name=exact_name,
-            first=first,
-            matching_uri=matching_uri,
-            max_=max,
-            name=name,
-            owner=owner,
-            scope=scope,
-            type_=type,
-            uri=uri
-        )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete resource: {response.status_code}")
+            **_query_params(
+                field_id=field_id,
+                deep=deep,
+                exact_name=exact_name,
+                first=first,
+                matching_uri=matching_uri,
+                max=max,
+                name=name,
+                owner=owner,
+                scope=scope,
+                type=type,
+                uri=uri
+            )
+        )
+        self._check(response, OK_UPDATE, "delete resource")
+        self.flush_cache(realm or self.realm)
 
     async def adelete_resource(
         self,
@@ -567,21 +868,42 @@ class AuthorizationAPI(BaseAPI):
             realm,
             client_uuid=client_uuid,
             resource_id=resource_id,
-            field_id=field_id,
-            deep=deep,
-            exact_name=exact_name,
-            first=first,
-            matching_uri=matching_uri,
-            max_=max,
-            name=name,
-            owner=owner,
-            scope=scope,
-            type_=type,
-            uri=uri
-        )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete resource: {response.status_code}")
+            **_query_params(
+                field_id=field_id,
+                deep=deep,
+                exact_name=exact_name,
+                first=first,
+                matching_uri=matching_uri,
+                max=max,
+                name=name,
+                owner=owner,
+                scope=scope,
+                type=type,
+                uri=uri
+            )
+        )
+        self._check(response, OK_UPDATE, "delete resource")
+        self.flush_cache(realm or self.realm)
+
+    async def adelete_resources(self, realm: str | None = None, *, client_uuid: str, resource_ids: list[str], concurrency: int | None = 16) -> None:
+        """Delete several resources concurrently (async).
+        
+        Args:
+            realm: The realm name
+            client_uuid: Client UUID
+            resource_ids: Resource IDs to delete
+            concurrency: Maximum number of requests in flight at once (default: 16)
+        
+        Raises:
+            APIError: If any deletion fails
+        """
+        await self._agather_all(
+            "delete resources",
+            [self.adelete_resource(realm, client_uuid=client_uuid, resource_id=resource_id) for resource_id in resource_ids],
+            concurrency
+        )
 
+    @ttl_cached(ttl=30.0)
     def search_resources(
         self,
         realm: str | None = None,
@@ -623,19 +945,22 @@ class AuthorizationAPI(BaseAPI):
             get_admin_realms_realm_clients_client_uuid_authz_resource_server_resource_search.sync,
             realm,
             client_uuid=client_uuid,
-            name=name,
-            field_id=field_id,
-            deep=deep,
-            exact_name=exact_name,
-            first=first,
-            matching_uri=matching_uri,
-            max_=max,
-            owner=owner,
-            scope=scope,
-            type_=type,
-            uri=uri,
+            **_query_params(
+                name=name,
+                field_id=field_id,
+                deep=deep,
+                exact_name=exact_name,
+                first=first,
+                matching_uri=matching_uri,
+                max=max,
+                owner=owner,
+                scope=scope,
+                type=type,
+                uri=uri
+            )
         )
 
+    @ttl_cached(ttl=30.0)
     async def asearch_resources(
         self,
         realm: str | None = None,
@@ -677,17 +1002,19 @@ class AuthorizationAPI(BaseAPI):
             get_admin_realms_realm_clients_client_uuid_authz_resource_server_resource_search.asyncio,
             realm,
             client_uuid=client_uuid,
-            name=name,
-            field_id=field_id,
-            deep=deep,
-            exact_name=exact_name,
-            first=first,
-            matching_uri=matching_uri,
-            max_=max,
-            owner=owner,
-            scope=scope,
-            type_=type,
-            uri=uri,
+            **_query_params(
+                name=name,
+                field_id=field_id,
+                deep=deep,
+                exact_name=exact_name,
+                first=first,
+                matching_uri=matching_uri,
+                max=max,
+                owner=owner,
+                scope=scope,
+                type=type,
+                uri=uri
+            )
         )
 
     # Scope Management
@@ -718,10 +1045,12 @@ class AuthorizationAPI(BaseAPI):
             get_admin_realms_realm_clients_client_uuid_authz_resource_server_scope.sync,
             realm,
             client_uuid=client_uuid,
-            first=first,
-            max_=max,
-            name=name,
-            scope_id=scope_id,
+            **_query_params(
+                first=first,
+                max=max,
+                name=name,
+                scope_id=scope_id
+            )
         )
 
     async def aget_scopes(
@@ -751,10 +1080,34 @@ class AuthorizationAPI(BaseAPI):
             get_admin_realms_realm_clients_client_uuid_authz_resource_server_scope.asyncio,
             realm,
             client_uuid=client_uuid,
-            first=first,
-            max_=max,
-            name=name,
-            scope_id=scope_id,
+            **_query_params(
+                first=first,
+                max=max,
+                name=name,
+                scope_id=scope_id
+            )
+        )
+
+    async def aget_all_scopes(self, realm: str | None = None, *, client_uuid: str, page_size: int = 100, concurrency: int = 8, **filters) -> list[ScopeRepresentation]:
+        """Get all scopes, fetching pages concurrently (async).
+        
+        Pages are requested `concurrency` at a time until one comes back short, so a
+        listing of N pages takes about N / concurrency round trips.
+        
+        Args:
+            realm: The realm name
+            client_uuid: Client UUID
+            page_size: Number of scopes per page
+            concurrency: Number of pages requested at once
+            **filters: Additional filters accepted by `aget_scopes`
+        
+        Returns:
+            List of all matching scopes
+        """
+        return await self._aget_pages(
+            lambda first, max: self.aget_scopes(realm, client_uuid=client_uuid, first=first, max=max, **filters),
+            page_size,
+            concurrency
         )
 
     def create_scope(self, realm: str | None = None, *, client_uuid: str, scope_data: dict | ScopeRepresentation) -> ScopeRepresentation:
@@ -778,8 +1131,8 @@ class AuthorizationAPI(BaseAPI):
             model_class=ScopeRepresentation,
             client_uuid=client_uuid
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create scope: {response.status_code}")
+        self._check(response, OK_CREATE, "create scope")
+        self.flush_cache(realm or self.realm)
         return response.parsed
 
     async def acreate_scope(self, realm: str | None = None, *, client_uuid: str, scope_data: dict | ScopeRepresentation) -> ScopeRepresentation:
@@ -803,10 +1156,31 @@ class AuthorizationAPI(BaseAPI):
             model_class=ScopeRepresentation,
             client_uuid=client_uuid
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create scope: {response.status_code}")
+        self._check(response, OK_CREATE, "create scope")
+        self.flush_cache(realm or self.realm)
         return response.parsed
 
+    async def acreate_scopes(self, realm: str | None = None, *, client_uuid: str, scopes: list[dict | ScopeRepresentation], concurrency: int | None = 16) -> list[ScopeRepresentation]:
+        """Create several scopes concurrently (async).
+        
+        Args:
+            realm: The realm name
+            client_uuid: Client UUID
+            scopes: Scope configurations to create
+            concurrency: Maximum number of requests in flight at once (default: 16)
+        
+        Returns:
+            Created scope representations, in the order given
+        
+        Raises:
+            APIError: If any creation fails
+        """
+        return await self._agather_all(
+            "create scopes",
+            [self.acreate_scope(realm, client_uuid=client_uuid, scope_data=scope) for scope in scopes],
+            concurrency
+        )
+
     def get_scope(self, realm: str | None = None, *, client_uuid: str, scope_id: str) -> ScopeRepresentation | None:
         """Get a scope by ID (sync).
         
@@ -863,8 +1237,8 @@ class AuthorizationAPI(BaseAPI):
             client_uuid=client_uuid,
             scope_id=scope_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "update scope")
+        self.flush_cache(realm or self.realm)
 
     async def aupdate_scope(self, realm: str | None = None, *, client_uuid: str, scope_id: str, scope_data: dict | ScopeRepresentation) -> None:
         """Update a scope (async).
@@ -886,8 +1260,8 @@ class AuthorizationAPI(BaseAPI):
             client_uuid=client_uuid,
             scope_id=scope_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "update scope")
+        self.flush_cache(realm or self.realm)
 
     def delete_scope(self, realm: str | None = None, *, client_uuid: str, scope_id: str) -> None:
         """Delete a scope (sync).
@@ -903,8 +1277,8 @@ class AuthorizationAPI(BaseAPI):
             client_uuid=client_uuid,
             scope_id=scope_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete scope")
+        self.flush_cache(realm or self.realm)
 
     async def adelete_scope(self, realm: str | None = None, *, client_uuid: str, scope_id: str) -> None:
         """Delete a scope (async).
@@ -920,9 +1294,28 @@ class AuthorizationAPI(BaseAPI):
             client_uuid=client_uuid,
             scope_id=scope_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete scope")
+        self.flush_cache(realm or self.realm)
 
+    async def adelete_scopes(self, realm: str | None = None, *, client_uuid: str, scope_ids: list[str], concurrency: int | None = 16) -> None:
+        """Delete several scopes concurrently (async).
+        
+        Args:
+            realm: The realm name
+            client_uuid: Client UUID
+            scope_ids: Scope IDs to delete
+            concurrency: Maximum number of requests in flight at once (default: 16)
+        
+        Raises:
+            APIError: If any deletion fails
+        """
+        await self._agather_all(
+            "delete scopes",
+            [self.adelete_scope(realm, client_uuid=client_uuid, scope_id=scope_id) for scope_id in scope_ids],
+            concurrency
+        )
+
+    @ttl_cached(ttl=30.0)
     def search_scopes(
         self,
         realm: str | None = None,
@@ -944,9 +1337,12 @@ class AuthorizationAPI(BaseAPI):
             get_admin_realms_realm_clients_client_uuid_authz_resource_server_scope_search.sync,
             realm,
             client_uuid=client_uuid,
-            name=name,
+            **_query_params(
+                name=name
+            )
         )
 
+    @ttl_cached(ttl=30.0)
     async def asearch_scopes(
         self,
         realm: str | None = None,
@@ -968,10 +1364,13 @@ class AuthorizationAPI(BaseAPI):
             get_admin_realms_realm_clients_client_uuid_authz_resource_server_scope_search.asyncio,
             realm,
             client_uuid=client_uuid,
-            name=name,
+            **_query_params(
+                name=name
+            )
         )
 
     # Policy Management
+    @ttl_cached(ttl=30.0)
     def get_policies(
         self,
         realm: str | None = None,
@@ -1013,19 +1412,22 @@ class AuthorizationAPI(BaseAPI):
             get_admin_realms_realm_clients_client_uuid_authz_resource_server_policy.sync,
             realm,
             client_uuid=client_uuid,
-            fields=fields,
-            first=first,
-            max_=max,
-            name=name,
-            owner=owner,
-            permission=permission,
-            policy_id=policy_id,
-            resource=resource,
-            resource_type=resource_type,
-            scope=scope,
-            type_=type,
+            **_query_params(
+                fields=fields,
+                first=first,
+                max=max,
+                name=name,
+                owner=owner,
+                permission=permission,
+                policy_id=policy_id,
+                resource=resource,
+                resource_type=resource_type,
+                scope=scope,
+                type=type
+            )
         )
 
+    @ttl_cached(ttl=30.0)
     async def aget_policies(
         self,
         realm: str | None = None,
@@ -1067,17 +1469,93 @@ class AuthorizationAPI(BaseAPI):
             get_admin_realms_realm_clients_client_uuid_authz_resource_server_policy.asyncio,
             realm,
             client_uuid=client_uuid,
-            fields=fields,
-            first=first,
-            max_=max,
-            name=name,
-            owner=owner,
-            permission=permission,
-            policy_id=policy_id,
-            resource=resource,
-            resource_type=resource_type,
-            scope=scope,
-            type_=type,
+            **_query_params(
+                fields=fields,
+                first=first,
+                max=max,
+                name=name,
+                owner=owner,
+                permission=permission,
+                policy_id=policy_id,
+                resource=resource,
+                resource_type=resource_type,
+                scope=scope,
+                type=type
+            )
+        )
+
+    async def aget_all_policies(self, realm: str | None = None, *, client_uuid: str, page_size: int = 100, concurrency: int = 8, **filters) -> list[AbstractPolicyRepresentation]:
+        """Get all policies, fetching pages concurrently (async).
+        
+        Pages are requested `concurrency` at a time until one comes back short, so a
+        listing of N pages takes about N / concurrency round trips.
+        
+        Args:
+            realm: The realm name
+            client_uuid: Client UUID
+            page_size: Number of policies per page
+            concurrency: Number of pages requested at once
+            **filters: Additional filters accepted by `aget_policies`
+        
+        Returns:
+            List of all matching policies
+        """
+        return await self._aget_pages(
+            lambda first, max: self._async(
+                get_admin_realms_realm_clients_client_uuid_authz_resource_server_policy.asyncio,
+                realm,
+                client_uuid=client_uuid,
+                **_query_params(first=first, max=max, **filters)
+            ),
+            page_size,
+            concurrency
+        )
+
+    def iter_policies(self, realm: str | None = None, *, client_uuid: str, page_size: int = 100, **filters) -> Iterator[AbstractPolicyRepresentation]:
+        """Iterate over all policies, one page at a time (sync).
+        
+        Only one page is held in memory; the next page is requested once the current one
+        has been consumed.
+        
+        Args:
+            realm: The realm name
+            client_uuid: Client UUID
+            page_size: Number of policies requested per page
+            **filters: Additional filters accepted by `get_policies`
+        
+        Yields:
+            Matching policies
+        """
+        return self._iter_pages(
+            lambda first, max: self._sync(
+                get_admin_realms_realm_clients_client_uuid_authz_resource_server_policy.sync,
+                realm,
+                client_uuid=client_uuid,
+                **_query_params(first=first, max=max, **filters)
+            ),
+            page_size
+        )
+
+    def aiter_policies(self, realm: str | None = None, *, client_uuid: str, page_size: int = 100, **filters) -> AsyncIterator[AbstractPolicyRepresentation]:
+        """Iterate over all policies, one page at a time (async).
+        
+        Args:
+            realm: The realm name
+            client_uuid: Client UUID
+            page_size: Number of policies requested per page
+            **filters: Additional filters accepted by `aget_policies`
+        
+        Yields:
+            Matching policies
+        """
+        return self._aiter_pages(
+            lambda first, max: self._async(
+                get_admin_realms_realm_clients_client_uuid_authz_resource_server_policy.asyncio,
+                realm,
+                client_uuid=client_uuid,
+                **_query_params(first=first, max=max, **filters)
+            ),
+            page_size
         )
 
     def create_policy(self, realm: str | None = None, *, client_uuid: str, policy_data: dict) -> AbstractPolicyRepresentation:
@@ -1100,8 +1578,8 @@ class AuthorizationAPI(BaseAPI):
             client_uuid=client_uuid,
             body=policy_data
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create policy: {response.status_code}")
+        self._check(response, OK_CREATE, "create policy")
+        self.flush_cache(realm or self.realm)
         return response.parsed
 
     async def acreate_policy(self, realm: str | None = None, *, client_uuid: str, policy_data: dict) -> AbstractPolicyRepresentation:
@@ -1124,10 +1602,31 @@ class AuthorizationAPI(BaseAPI):
             client_uuid=client_uuid,
             body=policy_data
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create policy: {response.status_code}")
+        self._check(response, OK_CREATE, "create policy")
+        self.flush_cache(realm or self.realm)
         return response.parsed
 
+    async def acreate_policies(self, realm: str | None = None, *, client_uuid: str, policies: list[dict], concurrency: int | None = 16) -> list[AbstractPolicyRepresentation]:
+        """Create several policies concurrently (async).
+        
+        Args:
+            realm: The realm name
+            client_uuid: Client UUID
+            policies: Policy configurations to create
+            concurrency: Maximum number of requests in flight at once (default: 16)
+        
+        Returns:
+            Created policy representations, in the order given
+        
+        Raises:
+            APIError: If any creation fails
+        """
+        return await self._agather_all(
+            "create policies",
+            [self.acreate_policy(realm, client_uuid=client_uuid, policy_data=policy) for policy in policies],
+            concurrency
+        )
+
     def search_policies(
         self,
         realm: str | None = None,
@@ -1151,8 +1650,10 @@ class AuthorizationAPI(BaseAPI):
             get_admin_realms_realm_clients_client_uuid_authz_resource_server_policy_search.sync,
             realm,
             client_uuid=client_uuid,
-            fields=fields,
-            name=name,
+            **_query_params(
+                fields=fields,
+                name=name
+            )
         )
 
     async def asearch_policies(
@@ -1178,8 +1679,10 @@ class AuthorizationAPI(BaseAPI):
             get_admin_realms_realm_clients_client_uuid_authz_resource_server_policy_search.asyncio,
             realm,
             client_uuid=client_uuid,
-            fields=fields,
-            name=name,
+            **_query_params(
+                fields=fields,
+                name=name
+            )
         )
 
     def get_policy_providers(self, realm: str | None = None, *, client_uuid: str) -> list[PolicyProviderRepresentation] | None:
@@ -1235,8 +1738,7 @@ class AuthorizationAPI(BaseAPI):
             model_class=PolicyEvaluationRequest,
             client_uuid=client_uuid
         )
-        if response.status_code != 200:
-            raise APIError(f"Failed to evaluate policies: {response.status_code}")
+        self._check(response, OK_READ, "evaluate policies")
         return response.parsed
 
     async def aevaluate_policies(self, realm: str | None = None, *, client_uuid: str, evaluation_data: dict | PolicyEvaluationRequest) -> PolicyEvaluationResponse | None:
@@ -1260,8 +1762,7 @@ class AuthorizationAPI(BaseAPI):
             model_class=PolicyEvaluationRequest,
             client_uuid=client_uuid
         )
-        if response.status_code != 200:
-            raise APIError(f"Failed to evaluate policies: {response.status_code}")
+        self._check(response, OK_READ, "evaluate policies")
         return response.parsed
 
     # Permission Management
@@ -1306,17 +1807,19 @@ class AuthorizationAPI(BaseAPI):
             get_admin_realms_realm_clients_client_uuid_authz_resource_server_permission.sync,
             realm,
             client_uuid=client_uuid,
-            fields=fields,
-            first=first,
-            max_=max,
-            name=name,
-            owner=owner,
-            permission=permission,
-            policy_id=policy_id,
-            resource=resource,
-            resource_type=resource_type,
-            scope=scope,
-            type_=type,
+            **_query_params(
+                fields=fields,
+                first=first,
+                max=max,
+                name=name,
+                owner=owner,
+                permission=permission,
+                policy_id=policy_id,
+                resource=resource,
+                resource_type=resource_type,
+                scope=scope,
+                type=type
+            )
         )
 
     async def aget_permissions(
@@ -1360,17 +1863,56 @@ class AuthorizationAPI(BaseAPI):
             get_admin_realms_realm_clients_client_uuid_authz_resource_server_permission.asyncio,
             realm,
             client_uuid=client_uuid,
-            fields=fields,
-            first=first,
-            max_=max,
-            name=name,
-            owner=owner,
-            permission=permission,
-            policy_id=policy_id,
-            resource=resource,
-            resource_type=resource_type,
-            scope=scope,
-            type_=type,
+            **_query_params(
+                fields=fields,
+                first=first,
+                max=max,
+                name=name,
+                owner=owner,
+                permission=permission,
+                policy_id=policy_id,
+                resource=resource,
+                resource_type=resource_type,
+                scope=scope,
+                type=type
+            )
+        )
+
+    def iter_permissions(self, realm: str | None = None, *, client_uuid: str, page_size: int = 100, **filters) -> Iterator[AbstractPolicyRepresentation]:
+        """Iterate over all permissions, one page at a time (sync).
+        
+        Only one page is held in memory; the next page is requested once the current one
+        has been consumed.
+        
+        Args:
+            realm: The realm name
+            client_uuid: Client UUID
+            page_size: Number of permissions requested per page
+            **filters: Additional filters accepted by `get_permissions`
+        
+        Yields:
+            Matching permissions
+        """
+        return self._iter_pages(
+            lambda first, max: self.get_permissions(realm, client_uuid=client_uuid, first=first, max=max, **filters),
+            page_size
+        )
+
+    def aiter_permissions(self, realm: str | None = None, *, client_uuid: str, page_size: int = 100, **filters) -> AsyncIterator[AbstractPolicyRepresentation]:
+        """Iterate over all permissions, one page at a time (async).
+        
+        Args:
+            realm: The realm name
+            client_uuid: Client UUID
+            page_size: Number of permissions requested per page
+            **filters: Additional filters accepted by `aget_permissions`
+        
+        Yields:
+            Matching permissions
+        """
+        return self._aiter_pages(
+            lambda first, max: self.aget_permissions(realm, client_uuid=client_uuid, first=first, max=max, **filters),
+            page_size
         )
 
     def create_permission(self, realm: str | None = None, *, client_uuid: str, permission_data: dict) -> AbstractPolicyRepresentation:
@@ -1393,8 +1935,8 @@ class AuthorizationAPI(BaseAPI):
             client_uuid=client_uuid,
             body=permission_data
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create permission: {response.status_code}")
+        self._check(response, OK_CREATE, "create permission")
+        self.flush_cache(realm or self.realm)
         return response.parsed
 
     async def acreate_permission(self, realm: str | None = None, *, client_uuid: str, permission_data: dict) -> AbstractPolicyRepresentation:
@@ -1417,8 +1959,8 @@ class AuthorizationAPI(BaseAPI):
             client_uuid=client_uuid,
             body=permission_data
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create permission: {response.status_code}")
+        self._check(response, OK_CREATE, "create permission")
+        self.flush_cache(realm or self.realm)
         return response.parsed
 
     def search_permissions(
@@ -1444,8 +1986,10 @@ class AuthorizationAPI(BaseAPI):
             get_admin_realms_realm_clients_client_uuid_authz_resource_server_permission_search.sync,
             realm,
             client_uuid=client_uuid,
-            fields=fields,
-            name=name,
+            **_query_params(
+                fields=fields,
+                name=name
+            )
         )
 
     async def asearch_permissions(
@@ -1471,8 +2015,10 @@ class AuthorizationAPI(BaseAPI):
             get_admin_realms_realm_clients_client_uuid_authz_resource_server_permission_search.asyncio,
             realm,
             client_uuid=client_uuid,
-            fields=fields,
-            name=name,
+            **_query_params(
+                fields=fields,
+                name=name
+            )
         )
 
     def get_permission_providers(self, realm: str | None = None, *, client_uuid: str) -> list[PolicyProviderRepresentation] | None:
@@ -1528,8 +2074,7 @@ class AuthorizationAPI(BaseAPI):
             model_class=PolicyEvaluationRequest,
             client_uuid=client_uuid
         )
-        if response.status_code != 200:
-            raise APIError(f"Failed to evaluate permissions: {response.status_code}")
+        self._check(response, OK_READ, "evaluate permissions")
         return response.parsed
 
     async def aevaluate_permissions(self, realm: str | None = None, *, client_uuid: str, evaluation_data: dict | PolicyEvaluationRequest) -> PolicyEvaluationResponse | None:
@@ -1553,8 +2098,7 @@ class AuthorizationAPI(BaseAPI):
             model_class=PolicyEvaluationRequest,
             client_uuid=client_uuid
         )
-        if response.status_code != 200:
-            raise APIError(f"Failed to evaluate permissions: {response.status_code}")
+        self._check(response, OK_READ, "evaluate permissions")
         return response.parsed
 
     # Resource additional endpoints
@@ -1606,17 +2150,19 @@ class AuthorizationAPI(BaseAPI):
             realm,
             client_uuid=client_uuid,
             resource_id=resource_id,
-            field_id=field_id,
-            deep=deep,
-            exact_name=exact_name,
-            first=first,
-            matching_uri=matching_uri,
-            max_=max,
-            name=name,
-            owner=owner,
-            scope=scope,
-            type_=type,
-            uri=uri,
+            **_query_params(
+                field_id=field_id,
+                deep=deep,
+                exact_name=exact_name,
+                first=first,
+                matching_uri=matching_uri,
+                max=max,
+                name=name,
+                owner=owner,
+                scope=scope,
+                type=type,
+                uri=uri
+            )
         )
         if response.status_code == 200:
             return json.loads(response.content)
@@ -1670,17 +2216,19 @@ class AuthorizationAPI(BaseAPI):
             realm,
             client_uuid=client_uuid,
             resource_id=resource_id,
-            field_id=field_id,
-            deep=deep,
-            exact_name=exact_name,
-            first=first,
-            matching_uri=matching_uri,
-            max_=max,
-            name=name,
-            owner=owner,
-            scope=scope,
-            type_=type,
-            uri=uri,
+            **_query_params(
+                field_id=field_id,
+                deep=deep,
+                exact_name=exact_name,
+                first=first,
+                matching_uri=matching_uri,
+                max=max,
+                name=name,
+                owner=owner,
+                scope=scope,
+                type=type,
+                uri=uri
+            )
         )
         if response.status_code == 200:
             return json.loads(response.content)
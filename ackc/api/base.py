@@ -1,6 +1,14 @@
 """Base for API and client manager classes.
 """
+import asyncio
+import copy
+import importlib.util
+import inspect
 import json
+import sys
+import time
+from functools import wraps
+from types import ModuleType
 from typing import Any, Callable, Protocol, Awaitable, Mapping, Self
 
 from ..exceptions import AuthError, APIError
@@ -14,6 +22,54 @@ __all__ = (
 )
 
 
+OK_CREATE = frozenset((201,))
+"""Status codes accepted from create (POST) endpoints."""
+OK_UPDATE = frozenset((200, 204))
+"""Status codes accepted from update/delete and other bodiless write endpoints."""
+OK_ADD = frozenset((200, 201, 204))
+"""Status codes accepted from endpoints that add or link an existing resource."""
+OK_POST = frozenset((200, 201))
+"""Status codes accepted from POST endpoints that may answer with or without creating a resource."""
+OK_READ = frozenset((200,))
+"""Status codes accepted from read (GET) endpoints."""
+
+
+class JSONBody:
+    """Request body for generated endpoints whose JSON body is declared as a binary file.
+
+    The generated code sends such bodies as `json=body.to_tuple()`; this wrapper makes that
+    expression yield the JSON document itself.
+    """
+    __slots__ = ("data",)
+
+    def __init__(self, data: Any):
+        self.data = data
+
+    def to_tuple(self) -> Any:
+        return self.data
+
+
+def lazy_import(package: str, name: str) -> ModuleType:
+    """Import the `package.name` module lazily.
+
+    The module object is returned right away but its body only runs on first attribute
+    access, so API modules can bind every generated endpoint they wrap without loading
+    the ones that are never called.
+    """
+    fullname = f"{package}.{name}"
+    if (module := sys.modules.get(fullname)) is not None:
+        return module
+
+    spec = importlib.util.find_spec(fullname)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[fullname] = module
+    loader.exec_module(module)
+    setattr(sys.modules[package], name, module)
+    return module
+
+
 class SyncFunctionProtocol[T](Protocol):
     def __call__(self, realm: str, *, client: AuthenticatedClient | Client, **kwds) -> T:
         """Protocol for synchronous functions that take a realm and client.
@@ -60,15 +116,85 @@ class AdditionalPropertiesContainerTypeProtocol[T](Protocol):
         ...
 
 
+def ttl_cached(ttl: float = 60.0, max_size: int = 512):
+    """Cache a read-only `BaseAPI` method's result per API instance for `ttl` seconds.
+
+    Entries are keyed on the method, the resolved realm and keyword arguments. Concurrent
+    misses of an async method share a single in-flight request. Callers get their own copy
+    of a cached value, so mutating it does not affect the cache. A result is not stored if
+    `BaseAPI.flush_cache()` ran while it was being fetched.
+
+    Args:
+        ttl: Seconds a result stays valid
+        max_size: Maximum number of entries kept per API instance (oldest evicted first)
+    """
+    def decorator(func):
+        def lookup(self: "BaseAPI", realm: str | None, kwds: dict) -> tuple[tuple, Any]:
+            key = (func.__name__, realm or self.realm, tuple(sorted(kwds.items())))
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return key, entry
+            return key, None
+
+        def store(self: "BaseAPI", key: tuple, value: Any, generation: int):
+            if generation != self._generation[0]:
+                return
+            if len(self._cache) >= max_size:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[key] = (time.monotonic() + ttl, copy.deepcopy(value))
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(self: "BaseAPI", realm: str | None = None, **kwds):
+                key, entry = lookup(self, realm, kwds)
+                if entry is not None:
+                    return copy.deepcopy(entry[1])
+
+                generation = self._generation[0]
+                task = self._inflight.get(key)
+                if task is None:
+                    task = self._inflight[key] = asyncio.ensure_future(func(self, realm, **kwds))
+                    task.add_done_callback(lambda done: self._inflight.get(key) is done and self._inflight.pop(key))
+
+                value = await asyncio.shield(task)
+                store(self, key, value, generation)
+                return copy.deepcopy(value)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(self: "BaseAPI", realm: str | None = None, **kwds):
+            key, entry = lookup(self, realm, kwds)
+            if entry is not None:
+                return copy.deepcopy(entry[1])
+
+            generation = self._generation[0]
+            value = func(self, realm, **kwds)
+            store(self, key, value, generation)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
 class BaseAPI:
     """Base class that provides common functionality for API classes.
     """
+    __slots__ = ("manager", "_realm", "_cache", "_inflight", "_generation")
+
     manager: "BaseClientManager"
     _realm: str | None
+    _cache: dict[tuple, tuple[float, Any]]
+    _inflight: dict[tuple, asyncio.Future]
+    _generation: list[int]  # flush count, boxed so `for_realm` copies share it
 
     def __init__(self, manager: "BaseClientManager", realm: str | None = None):
         self.manager = manager
         self._realm = realm
+        self._cache = {}
+        self._inflight = {}
+        self._generation = [0]
 
     @property
     def realm(self) -> str:
@@ -78,6 +204,64 @@ class BaseAPI:
     def _client(self) -> AuthenticatedClient:
         return self.manager.client
 
+    def for_realm(self, realm: str) -> Self:
+        """Return this API bound to `realm`, so calls without an explicit realm target it.
+
+        The returned object shares this one's cache, so writes through either invalidate both.
+
+        Example:
+            users = client.users.for_realm("my-realm")
+            for user_id in user_ids:
+                users.delete(user_id=user_id)
+        """
+        api = type(self)(self.manager, realm)
+        api._cache = self._cache
+        api._inflight = self._inflight
+        api._generation = self._generation
+        return api
+
+    def flush_cache(self, realm: str | None = None):
+        """Drop results cached by `ttl_cached` methods.
+
+        Requests still in flight, cached lookups and coalesced GETs alike, are not cached
+        when they complete, and later calls no longer join them.
+
+        Args:
+            realm: Only drop entries for this realm (default: all realms)
+        """
+        self._generation[0] += 1
+        if realm is None:
+            self._cache.clear()
+            self._inflight.clear()
+        else:
+            for key in [key for key in self._cache if key[1] == realm]:
+                del self._cache[key]
+            self._drop_inflight(realm)
+
+    @staticmethod
+    def _check[R](response: R, ok: frozenset[int], action: str) -> R:
+        """Raise `APIError` for `action` unless the response status code is in `ok`.
+
+        The error keeps the response body, and the start of it is shown in the message.
+
+        Returns the response so callers can go on to read headers or the parsed body.
+        """
+        if response.status_code not in ok:
+            raise APIError(action, response.status_code, response.content)
+        return response
+
+    @staticmethod
+    def _coerce[M](body: dict | M, model_class: type[M]) -> M:
+        """Return `body` as a `model_class` instance, converting it if it is a dict."""
+        if body.__class__ is model_class or not isinstance(body, dict):
+            return body
+        return model_class.from_dict(body)
+
+    def _drop_inflight(self, realm: str):
+        """Detach in-flight requests for `realm`, so later calls start their own."""
+        for key in [key for key in self._inflight if key[1] == realm]:
+            del self._inflight[key]
+
     def _sync_any[T](self, func: Callable[..., T], **kwds) -> T:
         return func(client=self._client, **kwds)
 
@@ -85,70 +269,151 @@ class BaseAPI:
         return await func(client=self._client, **kwds)
 
     def _sync[T](self, func: SyncFunctionProtocol[T] | Callable[..., T], realm: str | None, **kwds) -> T:
-        return self._sync_any(func, realm=realm or self.realm, **kwds)
+        result = func(client=self._client, realm=realm or self.realm, **kwds)
+        if not func.__module__.rpartition(".")[2].startswith("get_"):
+            self._drop_inflight(realm or self.realm)
+        return result
 
     def _sync_ap[T](self, func: SyncFunctionProtocol[AdditionalPropertiesContainerTypeProtocol[T]] | Callable[..., AdditionalPropertiesContainerTypeProtocol[T]], realm: str | None, **kwds) -> dict[str, T] | None:
         """Helper for endpoints that return additional properties."""
-        result = self._sync_any(func, realm=realm or self.realm, **kwds)
+        result = func(client=self._client, realm=realm or self.realm, **kwds)
         if result:
             return result.to_dict()
         return result
 
     def _sync_ap_list[T](self, func: SyncFunctionProtocol[list[AdditionalPropertiesContainerTypeProtocol[T]]] | Callable[..., list[AdditionalPropertiesContainerTypeProtocol[T]]], realm: str | None, **kwds) -> list[dict[str, T]] | None:
         """Helper for endpoints that return a list of additional properties."""
-        result = self._sync_any(func, realm=realm or self.realm, **kwds)
+        result = func(client=self._client, realm=realm or self.realm, **kwds)
         if result:
             return [item.to_dict() for item in result]
         return result
 
     def _sync_detailed[T](self, func: SyncDetailedFunctionProtocol[T] | Callable[..., T], realm: str | None, body: Any | None = None, **kwds) -> T:
-        return self._sync_any(func, realm=realm or self.realm, body=body, **kwds)
+        response = func(client=self._client, realm=realm or self.realm, body=body, **kwds)
+        self._drop_inflight(realm or self.realm)
+        return response
     
     def _sync_detailed_json[T](self, func: SyncDetailedFunctionProtocol[T] | Callable[..., T], realm: str | None, body: dict | str, **kwds) -> T:
-        """Helper for endpoints that expect JSON string body."""
-        body_json = json.dumps(body) if isinstance(body, dict) else body
-        return self._sync_any(func, realm=realm or self.realm, body=body_json, **kwds)
+        """Helper for endpoints whose JSON body is declared as a string.
+
+        The generated code passes the body straight to `json=`, so the document is handed over
+        as-is and serialized once by the session; JSON strings are decoded first.
+        """
+        if isinstance(body, str):
+            body = json.loads(body)
+        response = func(client=self._client, realm=realm or self.realm, body=body, **kwds)
+        self._drop_inflight(realm or self.realm)
+        return response
     
     def _sync_detailed_model[T, M](self, func: SyncDetailedFunctionProtocol[T] | Callable[..., T], realm: str | None, body: dict | M, model_class: type[M], **kwds) -> T:
         """Helper for endpoints that expect model objects, accepting either dict or model instance."""
-        if isinstance(body, dict):
-            body_obj = model_class.from_dict(body)
-        else:
-            body_obj = body
-        return self._sync_any(func, realm=realm or self.realm, body=body_obj, **kwds)
+        response = func(client=self._client, realm=realm or self.realm, body=self._coerce(body, model_class), **kwds)
+        self._drop_inflight(realm or self.realm)
+        return response
+
+    async def _async_read[T](self, func: Callable[..., Awaitable[T]], **kwds) -> T:
+        """Await a generated endpoint, sharing one request among concurrent identical GETs.
+
+        Only endpoints from generated `get_*` modules are coalesced, and callers that join a
+        request receive their own copy of its result. Any other endpoint is a write: once it
+        completes, GETs in flight for its realm are detached so later calls see the change.
+        """
+        if not func.__module__.rpartition(".")[2].startswith("get_"):
+            result = await func(client=self._client, **kwds)
+            self._drop_inflight(kwds["realm"])
+            return result
+
+        try:
+            key = (func.__module__, kwds["realm"], func.__name__, tuple(sorted(kwds.items())))
+            task = self._inflight.get(key)
+        except TypeError:
+            return await func(client=self._client, **kwds)
+
+        if task is None:
+            task = self._inflight[key] = asyncio.ensure_future(func(client=self._client, **kwds))
+            task.add_done_callback(lambda done: self._inflight.get(key) is done and self._inflight.pop(key))
+            return await asyncio.shield(task)
+
+        return copy.deepcopy(await asyncio.shield(task))
 
     async def _async[T](self, func: AsyncFunctionProtocol[T] | Callable[..., Awaitable[T]], realm: str | None, **kwds) -> T:
-        return await self._async_any(func, realm=realm or self.realm, **kwds)
+        return await self._async_read(func, realm=realm or self.realm, **kwds)
 
     async def _async_ap[T](self, func: AsyncFunctionProtocol[AdditionalPropertiesContainerTypeProtocol[T]] | Callable[..., Awaitable[AdditionalPropertiesContainerTypeProtocol[T]]], realm: str | None, **kwds) -> dict[str, T] | None:
         """Helper for endpoints that return additional properties."""
-        result = await self._async_any(func, realm=realm or self.realm, **kwds)
+        result = await self._async_read(func, realm=realm or self.realm, **kwds)
         if result:
             return result.to_dict()
         return result
 
     async def _async_ap_list[T](self, func: AsyncFunctionProtocol[list[AdditionalPropertiesContainerTypeProtocol[T]]] | Callable[..., Awaitable[list[AdditionalPropertiesContainerTypeProtocol[T]]]], realm: str | None, **kwds) -> list[dict[str, T]] | None:
         """Helper for endpoints that return a list of additional properties."""
-        result = await self._async_any(func, realm=realm or self.realm, **kwds)
+        result = await self._async_read(func, realm=realm or self.realm, **kwds)
         if result:
             return [item.to_dict() for item in result]
         return result
 
     async def _async_detailed[T](self, func: AsyncDetailedFunctionProtocol[T] | Callable[..., Awaitable[T]], realm: str | None, body: Any | None = None, **kwds) -> T:
-        return await self._async_any(func, realm=realm or self.realm, body=body, **kwds)
+        response = await func(client=self._client, realm=realm or self.realm, body=body, **kwds)
+        self._drop_inflight(realm or self.realm)
+        return response
     
     async def _async_detailed_json[T](self, func: AsyncDetailedFunctionProtocol[T] | Callable[..., Awaitable[T]], realm: str | None, body: dict | str, **kwds) -> T:
-        """Helper for endpoints that expect JSON string body."""
-        body_json = json.dumps(body) if isinstance(body, dict) else body
-        return await self._async_any(func, realm=realm or self.realm, body=body_json, **kwds)
+        """Helper for endpoints whose JSON body is declared as a string.
+
+        The generated code passes the body straight to `json=`, so the document is handed over
+        as-is and serialized once by the session; JSON strings are decoded first.
+        """
+        if isinstance(body, str):
+            body = json.loads(body)
+        response = await func(client=self._client, realm=realm or self.realm, body=body, **kwds)
+        self._drop_inflight(realm or self.realm)
+        return response
     
     async def _async_detailed_model[T, M](self, func: AsyncDetailedFunctionProtocol[T] | Callable[..., Awaitable[T]], realm: str | None, body: dict | M, model_class: type[M], **kwds) -> T:
         """Helper for endpoints that expect model objects, accepting either dict or model instance."""
-        if isinstance(body, dict):
-            body_obj = model_class.from_dict(body)
-        else:
-            body_obj = body
-        return await self._async_any(func, realm=realm or self.realm, body=body_obj, **kwds)
+        response = await func(client=self._client, realm=realm or self.realm, body=self._coerce(body, model_class), **kwds)
+        self._drop_inflight(realm or self.realm)
+        return response
+
+    async def gather[T](self, *aws: Awaitable[T], return_exceptions: bool = False, concurrency: int | None = None) -> list[T]:
+        """Run multiple API calls concurrently.
+
+        The manager's client holds a single multiplexed session, so concurrent calls share
+        one connection (HTTP/2 streams when available) instead of waiting on each other.
+
+        Example:
+            flows = await client.authentication.aget_flows()
+            executions = await client.authentication.gather(
+                *(client.authentication.aget_executions(flow_alias=f.alias) for f in flows)
+            )
+
+        Args:
+            *aws: Awaitables returned by async API methods (`a*` variants)
+            return_exceptions: Return exceptions in the result list instead of raising the first one
+            concurrency: Maximum number of calls in flight at once (default: unbounded)
+
+        Returns:
+            Results in the same order as the given awaitables
+        """
+        if concurrency:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def bounded(aw: Awaitable[T]) -> T:
+                async with semaphore:
+                    return await aw
+
+            aws = tuple(bounded(aw) for aw in aws)
+
+        return list(await asyncio.gather(*aws, return_exceptions=return_exceptions))
+
+    async def _agather_all(self, action: str, aws: list, concurrency: int | None) -> list:
+        """Run request coroutines concurrently and raise one error if any of them failed."""
+        results = await self.gather(*aws, return_exceptions=True, concurrency=concurrency)
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            raise APIError(f"Failed to {action}: {len(errors)}/{len(results)} failed") from errors[0]
+        return results
 
 
 class BaseClientManager:
@@ -183,6 +448,24 @@ class BaseClientManager:
     async def _ensure_authenticated_async(self):
         raise NotImplementedError("Subclasses must implement _ensure_authenticated_async()")
 
+    def close(self):
+        """Close the client's sync session, for use outside of a `with` block.
+
+        Does nothing if no session is open; a later request opens a new one.
+        """
+        if self._client and self._client._client is not None:
+            self._client.__exit__(None, None, None)
+            self._client._client = None
+
+    async def aclose(self):
+        """Close the client's async session, for use outside of an `async with` block.
+
+        Does nothing if no session is open; a later request opens a new one.
+        """
+        if self._client and self._client._async_client is not None:
+            await self._client.__aexit__(None, None, None)
+            self._client._async_client = None
+
     def __enter__(self):
         """Enter sync context."""
         self._in_async_context = False
@@ -1,17 +1,18 @@
 """Client attribute certificate API methods."""
 from functools import cached_property
 
-from .base import BaseAPI
-from ..generated.api.client_attribute_certificate import (
-    get_admin_realms_realm_clients_client_uuid_certificates_attr,
-    post_admin_realms_realm_clients_client_uuid_certificates_attr_download,
-    post_admin_realms_realm_clients_client_uuid_certificates_attr_generate,
-    post_admin_realms_realm_clients_client_uuid_certificates_attr_generate_and_download,
-    post_admin_realms_realm_clients_client_uuid_certificates_attr_upload,
-    post_admin_realms_realm_clients_client_uuid_certificates_attr_upload_certificate,
-)
+from .base import BaseAPI, lazy_import, ttl_cached
 from ..generated.models import CertificateRepresentation, KeyStoreConfig
 
+_ENDPOINTS = "ackc.generated.api.client_attribute_certificate"
+
+get_admin_realms_realm_clients_client_uuid_certificates_attr = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_certificates_attr")
+post_admin_realms_realm_clients_client_uuid_certificates_attr_download = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients_client_uuid_certificates_attr_download")
+post_admin_realms_realm_clients_client_uuid_certificates_attr_generate = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients_client_uuid_certificates_attr_generate")
+post_admin_realms_realm_clients_client_uuid_certificates_attr_generate_and_download = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients_client_uuid_certificates_attr_generate_and_download")
+post_admin_realms_realm_clients_client_uuid_certificates_attr_upload = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients_client_uuid_certificates_attr_upload")
+post_admin_realms_realm_clients_client_uuid_certificates_attr_upload_certificate = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients_client_uuid_certificates_attr_upload_certificate")
+
 __all__ = (
     "ClientAttributeCertificateAPI",
     "ClientAttributeCertificateClientMixin",
@@ -22,7 +23,9 @@ __all__ = (
 
 class ClientAttributeCertificateAPI(BaseAPI):
     """Client attribute certificate API methods."""
+    __slots__ = ()
 
+    @ttl_cached(ttl=30.0)
     def get_certificate(self, realm: str | None = None, *, client_uuid: str, attr: str) -> CertificateRepresentation | None:
         """Get key info for a client certificate (sync).
         
@@ -41,6 +44,7 @@ class ClientAttributeCertificateAPI(BaseAPI):
             attr=attr
         )
 
+    @ttl_cached(ttl=30.0)
     async def aget_certificate(self, realm: str | None = None, *, client_uuid: str, attr: str) -> CertificateRepresentation | None:
         """Get key info for a client certificate (async).
         
@@ -59,6 +63,22 @@ class ClientAttributeCertificateAPI(BaseAPI):
             attr=attr
         )
 
+    async def aget_certificates(self, realm: str | None = None, *, certificates: list[tuple[str, str]], concurrency: int | None = 16) -> list[CertificateRepresentation | None]:
+        """Get key info for several client certificates concurrently (async).
+        
+        Args:
+            realm: The realm name
+            certificates: (client UUID, attribute name) pairs to look up
+            concurrency: Maximum number of requests in flight at once (default: 16)
+        
+        Returns:
+            Certificate representations, in the order given
+        """
+        return await self.gather(
+            *(self.aget_certificate(realm, client_uuid=client_uuid, attr=attr) for client_uuid, attr in certificates),
+            concurrency=concurrency
+        )
+
     def download_certificate(self, realm: str | None = None, *, client_uuid: str, attr: str, config: dict | KeyStoreConfig) -> bytes | None:
         """Download a client certificate and private key (sync).
         
@@ -106,6 +126,9 @@ class ClientAttributeCertificateAPI(BaseAPI):
     def generate_certificate(self, realm: str | None = None, *, client_uuid: str, attr: str) -> CertificateRepresentation | None:
         """Generate a new certificate with new key pair (sync).
         
+        To also download the new keystore, use `generate_and_download_certificate()`, which does both
+        in a single request instead of following this call with a download.
+        
         Args:
             realm: The realm name
             client_uuid: Client UUID
@@ -114,16 +137,21 @@ class ClientAttributeCertificateAPI(BaseAPI):
         Returns:
             New certificate representation
         """
-        return self._sync(
+        result = self._sync(
             post_admin_realms_realm_clients_client_uuid_certificates_attr_generate.sync,
             realm,
             client_uuid=client_uuid,
             attr=attr
         )
+        self.flush_cache(realm or self.realm)
+        return result
 
     async def agenerate_certificate(self, realm: str | None = None, *, client_uuid: str, attr: str) -> CertificateRepresentation | None:
         """Generate a new certificate with new key pair (async).
         
+        To also download the new keystore, use `agenerate_and_download_certificate()`, which does both
+        in a single request instead of following this call with a download.
+        
         Args:
             realm: The realm name
             client_uuid: Client UUID
@@ -132,12 +160,14 @@ class ClientAttributeCertificateAPI(BaseAPI):
         Returns:
             New certificate representation
         """
-        return await self._async(
+        result = await self._async(
             post_admin_realms_realm_clients_client_uuid_certificates_attr_generate.asyncio,
             realm,
             client_uuid=client_uuid,
             attr=attr
         )
+        self.flush_cache(realm or self.realm)
+        return result
 
     def generate_and_download_certificate(self, realm: str | None = None, *, client_uuid: str, attr: str, config: dict | KeyStoreConfig) -> bytes | None:
         """Generate a new certificate and download it (sync).
@@ -159,6 +189,7 @@ class ClientAttributeCertificateAPI(BaseAPI):
             client_uuid=client_uuid,
             attr=attr
         )
+        self.flush_cache(realm or self.realm)
         return response.parsed
 
     async def agenerate_and_download_certificate(self, realm: str | None = None, *, client_uuid: str, attr: str, config: dict | KeyStoreConfig) -> bytes | None:
@@ -181,6 +212,7 @@ class ClientAttributeCertificateAPI(BaseAPI):
             client_uuid=client_uuid,
             attr=attr
         )
+        self.flush_cache(realm or self.realm)
         return response.parsed
 
     def upload_certificate(self, realm: str | None = None, *, client_uuid: str, attr: str, file: bytes) -> CertificateRepresentation | None:
@@ -200,12 +232,14 @@ class ClientAttributeCertificateAPI(BaseAPI):
         Returns:
             Uploaded certificate representation
         """
-        return self._sync(
+        result = self._sync(
             post_admin_realms_realm_clients_client_uuid_certificates_attr_upload.sync,
             realm,
             client_uuid=client_uuid,
             attr=attr
         )
+        self.flush_cache(realm or self.realm)
+        return result
 
     async def aupload_certificate(self, realm: str | None = None, *, client_uuid: str, attr: str, file: bytes) -> CertificateRepresentation | None:
         """Upload a certificate and optionally private key (async).
@@ -224,12 +258,14 @@ class ClientAttributeCertificateAPI(BaseAPI):
         Returns:
             Uploaded certificate representation
         """
-        return await self._async(
+        result = await self._async(
             post_admin_realms_realm_clients_client_uuid_certificates_attr_upload.asyncio,
             realm,
             client_uuid=client_uuid,
             attr=attr
         )
+        self.flush_cache(realm or self.realm)
+        return result
 
     def upload_certificate_only(self, realm: str | None = None, *, client_uuid: str, attr: str, file: bytes) -> CertificateRepresentation | None:
         """Upload only certificate, no private key (sync).
@@ -248,12 +284,14 @@ class ClientAttributeCertificateAPI(BaseAPI):
         Returns:
             Uploaded certificate representation
         """
-        return self._sync(
+        result = self._sync(
             post_admin_realms_realm_clients_client_uuid_certificates_attr_upload_certificate.sync,
             realm,
             client_uuid=client_uuid,
             attr=attr
         )
+        self.flush_cache(realm or self.realm)
+        return result
 
     async def aupload_certificate_only(self, realm: str | None = None, *, client_uuid: str, attr: str, file: bytes) -> CertificateRepresentation | None:
         """Upload only certificate, no private key (async).
@@ -272,12 +310,14 @@ class ClientAttributeCertificateAPI(BaseAPI):
         Returns:
             Uploaded certificate representation
         """
-        return await self._async(
+        result = await self._async(
             post_admin_realms_realm_clients_client_uuid_certificates_attr_upload_certificate.asyncio,
             realm,
             client_uuid=client_uuid,
             attr=attr
         )
+        self.flush_cache(realm or self.realm)
+        return result
 
 
 class ClientAttributeCertificateClientMixin:
@@ -1,15 +1,15 @@
 """Client initial access API methods."""
 from functools import cached_property
 
-from .base import BaseAPI
-from ..exceptions import APIError
-from ..generated.api.client_initial_access import (
-    get_admin_realms_realm_clients_initial_access,
-    post_admin_realms_realm_clients_initial_access,
-    delete_admin_realms_realm_clients_initial_access_id,
-)
+from .base import BaseAPI, OK_UPDATE, lazy_import
 from ..generated.models import ClientInitialAccessPresentation, ClientInitialAccessCreatePresentation
 
+_ENDPOINTS = "ackc.generated.api.client_initial_access"
+
+get_admin_realms_realm_clients_initial_access = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_initial_access")
+post_admin_realms_realm_clients_initial_access = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients_initial_access")
+delete_admin_realms_realm_clients_initial_access_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_clients_initial_access_id")
+
 __all__ = (
     "ClientInitialAccessAPI",
     "ClientInitialAccessClientMixin",
@@ -20,6 +20,7 @@ __all__ = (
 
 class ClientInitialAccessAPI(BaseAPI):
     """Client initial access API methods."""
+    __slots__ = ()
 
     def get_all(self, realm: str | None = None) -> list[ClientInitialAccessPresentation] | None:
         """Get all client initial access tokens.
@@ -49,6 +50,22 @@ class ClientInitialAccessAPI(BaseAPI):
             realm
         )
 
+    async def aget_all_for_realms(self, realms: list[str], *, concurrency: int | None = None) -> dict[str, list[ClientInitialAccessPresentation] | None]:
+        """Get client initial access tokens for several realms concurrently (async).
+        
+        Args:
+            realms: Realm names to fetch tokens for
+            concurrency: Maximum number of requests in flight at once (default: unbounded)
+        
+        Returns:
+            Mapping of realm name to its list of initial access tokens
+        """
+        results = await self.gather(
+            *(self.aget_all(realm) for realm in realms),
+            concurrency=concurrency
+        )
+        return dict(zip(realms, results))
+
     def create(self, realm: str | None = None, *, config: dict | ClientInitialAccessCreatePresentation) -> ClientInitialAccessPresentation | None:
         """Create a new client initial access token.
         
@@ -104,8 +121,7 @@ class ClientInitialAccessAPI(BaseAPI):
             realm,
             id=id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete client initial access token: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete client initial access token")
 
     async def adelete(self, realm: str | None = None, *, id: str) -> None:
         """Delete a client initial access token (async).
@@ -122,8 +138,7 @@ class ClientInitialAccessAPI(BaseAPI):
             realm,
             id=id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete client initial access token: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete client initial access token")
 
 
 class ClientInitialAccessClientMixin:
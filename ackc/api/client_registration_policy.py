@@ -1,17 +1,19 @@
 """Client registration policy API methods."""
 from functools import cached_property
 
-from .base import BaseAPI
-from ..generated.api.client_registration_policy import (
-    get_admin_realms_realm_client_registration_policy_providers,
-)
+from .base import BaseAPI, lazy_import
 from ..generated.models import ComponentTypeRepresentation
 
+_ENDPOINTS = "ackc.generated.api.client_registration_policy"
+
+get_admin_realms_realm_client_registration_policy_providers = lazy_import(_ENDPOINTS, "get_admin_realms_realm_client_registration_policy_providers")
+
 __all__ = "ClientRegistrationPolicyAPI", "ClientRegistrationPolicyClientMixin"
 
 
 class ClientRegistrationPolicyAPI(BaseAPI):
     """Client registration policy API methods."""
+    __slots__ = ()
 
     def get_providers(self, realm: str | None = None) -> list[ComponentTypeRepresentation] | None:
         """Get client registration policy providers.
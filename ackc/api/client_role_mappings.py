@@ -1,28 +1,29 @@
 """Client role mappings API methods."""
 from functools import cached_property
 
-from .base import BaseAPI
-from ..exceptions import APIError
-from ..generated.api.client_role_mappings import (
-    get_admin_realms_realm_users_user_id_role_mappings_clients_client_id,
-    get_admin_realms_realm_users_user_id_role_mappings_clients_client_id_available,
-    get_admin_realms_realm_users_user_id_role_mappings_clients_client_id_composite,
-    post_admin_realms_realm_users_user_id_role_mappings_clients_client_id,
-    delete_admin_realms_realm_users_user_id_role_mappings_clients_client_id,
-    get_admin_realms_realm_groups_group_id_role_mappings_clients_client_id,
-    get_admin_realms_realm_groups_group_id_role_mappings_clients_client_id_available,
-    get_admin_realms_realm_groups_group_id_role_mappings_clients_client_id_composite,
-    post_admin_realms_realm_groups_group_id_role_mappings_clients_client_id,
-    delete_admin_realms_realm_groups_group_id_role_mappings_clients_client_id,
-)
+from .base import BaseAPI, OK_UPDATE, lazy_import
 from ..generated.models import RoleRepresentation
-from ..generated.types import UNSET, Unset
+from ..generated.types import Unset
+
+_ENDPOINTS = "ackc.generated.api.client_role_mappings"
+
+get_admin_realms_realm_users_user_id_role_mappings_clients_client_id = lazy_import(_ENDPOINTS, "get_admin_realms_realm_users_user_id_role_mappings_clients_client_id")
+get_admin_realms_realm_users_user_id_role_mappings_clients_client_id_available = lazy_import(_ENDPOINTS, "get_admin_realms_realm_users_user_id_role_mappings_clients_client_id_available")
+get_admin_realms_realm_users_user_id_role_mappings_clients_client_id_composite = lazy_import(_ENDPOINTS, "get_admin_realms_realm_users_user_id_role_mappings_clients_client_id_composite")
+post_admin_realms_realm_users_user_id_role_mappings_clients_client_id = lazy_import(_ENDPOINTS, "post_admin_realms_realm_users_user_id_role_mappings_clients_client_id")
+delete_admin_realms_realm_users_user_id_role_mappings_clients_client_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_users_user_id_role_mappings_clients_client_id")
+get_admin_realms_realm_groups_group_id_role_mappings_clients_client_id = lazy_import(_ENDPOINTS, "get_admin_realms_realm_groups_group_id_role_mappings_clients_client_id")
+get_admin_realms_realm_groups_group_id_role_mappings_clients_client_id_available = lazy_import(_ENDPOINTS, "get_admin_realms_realm_groups_group_id_role_mappings_clients_client_id_available")
+get_admin_realms_realm_groups_group_id_role_mappings_clients_client_id_composite = lazy_import(_ENDPOINTS, "get_admin_realms_realm_groups_group_id_role_mappings_clients_client_id_composite")
+post_admin_realms_realm_groups_group_id_role_mappings_clients_client_id = lazy_import(_ENDPOINTS, "post_admin_realms_realm_groups_group_id_role_mappings_clients_client_id")
+delete_admin_realms_realm_groups_group_id_role_mappings_clients_client_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_groups_group_id_role_mappings_clients_client_id")
 
 __all__ = "ClientRoleMappingsAPI", "ClientRoleMappingsClientMixin"
 
 
 class ClientRoleMappingsAPI(BaseAPI):
     """Client role mappings API methods."""
+    __slots__ = ()
 
     def get_user_client_role_mappings(self, realm: str | None = None, *, user_id: str, client_id: str) -> list[RoleRepresentation] | None:
         """Get client-level role mappings for a user.
@@ -159,8 +160,7 @@ class ClientRoleMappingsAPI(BaseAPI):
             client_id=client_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add client role mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "add client role mappings")
 
     async def aadd_user_client_role_mappings(self, realm: str | None = None, *, user_id: str, client_id: str, roles: list[RoleRepresentation]) -> None:
         """Add client-level role mappings to a user (async).
@@ -181,8 +181,7 @@ class ClientRoleMappingsAPI(BaseAPI):
             client_id=client_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add client role mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "add client role mappings")
 
     def remove_user_client_role_mappings(self, realm: str | None = None, *, user_id: str, client_id: str, roles: list[RoleRepresentation]) -> None:
         """Remove client-level role mappings from a user.
@@ -203,8 +202,7 @@ class ClientRoleMappingsAPI(BaseAPI):
             client_id=client_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove client role mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove client role mappings")
 
     async def aremove_user_client_role_mappings(self, realm: str | None = None, *, user_id: str, client_id: str, roles: list[RoleRepresentation]) -> None:
         """Remove client-level role mappings from a user (async).
@@ -225,8 +223,7 @@ class ClientRoleMappingsAPI(BaseAPI):
             client_id=client_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove client role mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove client role mappings")
 
     def get_group_client_role_mappings(self, realm: str | None = None, *, group_id: str, client_id: str) -> list[RoleRepresentation] | None:
         """Get client-level role mappings for a group.
@@ -363,8 +360,7 @@ class ClientRoleMappingsAPI(BaseAPI):
             client_id=client_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add client role mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "add client role mappings")
 
     async def aadd_group_client_role_mappings(self, realm: str | None = None, *, group_id: str, client_id: str, roles: list[RoleRepresentation]) -> None:
         """Add client-level role mappings to a group (async).
@@ -385,8 +381,7 @@ class ClientRoleMappingsAPI(BaseAPI):
             client_id=client_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add client role mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "add client role mappings")
 
     def remove_group_client_role_mappings(self, realm: str | None = None, *, group_id: str, client_id: str, roles: list[RoleRepresentation]) -> None:
         """Remove client-level role mappings from a group.
@@ -407,8 +402,7 @@ class ClientRoleMappingsAPI(BaseAPI):
             client_id=client_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove client role mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove client role mappings")
 
     async def aremove_group_client_role_mappings(self, realm: str | None = None, *, group_id: str, client_id: str, roles: list[RoleRepresentation]) -> None:
         """Remove client-level role mappings from a group (async).
@@ -429,8 +423,7 @@ class ClientRoleMappingsAPI(BaseAPI):
             client_id=client_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove client role mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove client role mappings")
 
 
 class ClientRoleMappingsClientMixin:
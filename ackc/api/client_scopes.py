@@ -1,22 +1,23 @@
 """Client scope management API methods."""
 from functools import cached_property
 
-from .base import BaseAPI
-from ..exceptions import APIError
-from ..generated.api.client_scopes import (
-    get_admin_realms_realm_client_scopes,
-    post_admin_realms_realm_client_scopes,
-    get_admin_realms_realm_client_scopes_client_scope_id,
-    put_admin_realms_realm_client_scopes_client_scope_id,
-    delete_admin_realms_realm_client_scopes_client_scope_id,
-)
+from .base import BaseAPI, OK_CREATE, OK_UPDATE, lazy_import
 from ..generated.models import ClientScopeRepresentation
 
+_ENDPOINTS = "ackc.generated.api.client_scopes"
+
+get_admin_realms_realm_client_scopes = lazy_import(_ENDPOINTS, "get_admin_realms_realm_client_scopes")
+post_admin_realms_realm_client_scopes = lazy_import(_ENDPOINTS, "post_admin_realms_realm_client_scopes")
+get_admin_realms_realm_client_scopes_client_scope_id = lazy_import(_ENDPOINTS, "get_admin_realms_realm_client_scopes_client_scope_id")
+put_admin_realms_realm_client_scopes_client_scope_id = lazy_import(_ENDPOINTS, "put_admin_realms_realm_client_scopes_client_scope_id")
+delete_admin_realms_realm_client_scopes_client_scope_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_client_scopes_client_scope_id")
+
 __all__ = "ClientScopesAPI", "ClientScopesClientMixin", "ClientScopeRepresentation"
 
 
 class ClientScopesAPI(BaseAPI):
     """Client scope management API methods."""
+    __slots__ = ()
 
     def get_all(self, realm: str | None = None) -> list[ClientScopeRepresentation] | None:
         """List client scopes in a realm (sync).
@@ -63,10 +64,9 @@ class ClientScopesAPI(BaseAPI):
             scope_data,
             ClientScopeRepresentation
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create client scope: {response.status_code}")
+        self._check(response, OK_CREATE, "create client scope")
         location = response.headers.get("Location", "")
-        return location.split("/")[-1] if location else ""
+        return location.rpartition("/")[2]
 
     async def acreate(self, realm: str | None = None, *, scope_data: dict | ClientScopeRepresentation) -> str:
         """Create a client scope (async).
@@ -87,10 +87,9 @@ class ClientScopesAPI(BaseAPI):
             scope_data,
             ClientScopeRepresentation
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create client scope: {response.status_code}")
+        self._check(response, OK_CREATE, "create client scope")
         location = response.headers.get("Location", "")
-        return location.split("/")[-1] if location else ""
+        return location.rpartition("/")[2]
 
     def get(self, realm: str | None = None, *, client_scope_id: str) -> ClientScopeRepresentation | None:
         """Get a client scope by ID (sync).
@@ -124,6 +123,22 @@ class ClientScopesAPI(BaseAPI):
             client_scope_id=client_scope_id
         )
 
+    async def aget_many(self, realm: str | None = None, *, client_scope_ids: list[str], concurrency: int | None = 16) -> list[ClientScopeRepresentation | None]:
+        """Get several client scopes by ID concurrently (async).
+        
+        Args:
+            realm: The realm name
+            client_scope_ids: Client scope IDs
+            concurrency: Maximum number of requests in flight at once (default: 16)
+        
+        Returns:
+            Client scope representations, in the order given
+        """
+        return await self.gather(
+            *(self.aget(realm, client_scope_id=client_scope_id) for client_scope_id in client_scope_ids),
+            concurrency=concurrency
+        )
+
     def update(self, realm: str | None = None, *, client_scope_id: str,
                scope_data: dict | ClientScopeRepresentation) -> None:
         """Update a client scope (sync).
@@ -143,8 +158,7 @@ class ClientScopesAPI(BaseAPI):
             ClientScopeRepresentation,
             client_scope_id=client_scope_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update client scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "update client scope")
 
     async def aupdate(self, realm: str | None = None, *, client_scope_id: str,
                       scope_data: dict | ClientScopeRepresentation) -> None:
@@ -165,8 +179,7 @@ class ClientScopesAPI(BaseAPI):
             ClientScopeRepresentation,
             client_scope_id=client_scope_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update client scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "update client scope")
 
     def delete(self, realm: str | None = None, *, client_scope_id: str) -> None:
         """Delete a client scope (sync).
@@ -183,8 +196,7 @@ class ClientScopesAPI(BaseAPI):
             realm,
             client_scope_id=client_scope_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete client scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete client scope")
 
     async def adelete(self, realm: str | None = None, *, client_scope_id: str) -> None:
         """Delete a client scope (async).
@@ -201,8 +213,7 @@ class ClientScopesAPI(BaseAPI):
             realm,
             client_scope_id=client_scope_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete client scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete client scope")
 
 
 class ClientScopesClientMixin:
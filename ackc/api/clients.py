@@ -1,35 +1,7 @@
 """Client (application) management API methods."""
 from functools import cached_property
 
-from .base import BaseAPI
-from ..exceptions import APIError
-from ..generated.api.clients import (
-    get_admin_realms_realm_clients,
-    post_admin_realms_realm_clients,
-    get_admin_realms_realm_clients_client_uuid,
-    put_admin_realms_realm_clients_client_uuid,
-    delete_admin_realms_realm_clients_client_uuid,
-    get_admin_realms_realm_clients_client_uuid_client_secret,
-    post_admin_realms_realm_clients_client_uuid_client_secret,
-    get_admin_realms_realm_clients_client_uuid_service_account_user,
-    get_admin_realms_realm_clients_client_uuid_session_count,
-    get_admin_realms_realm_clients_client_uuid_offline_session_count,
-    get_admin_realms_realm_clients_client_uuid_user_sessions,
-    get_admin_realms_realm_clients_client_uuid_offline_sessions,
-    get_admin_realms_realm_clients_client_uuid_default_client_scopes,
-    put_admin_realms_realm_clients_client_uuid_default_client_scopes_client_scope_id,
-    delete_admin_realms_realm_clients_client_uuid_default_client_scopes_client_scope_id,
-    get_admin_realms_realm_clients_client_uuid_optional_client_scopes,
-    put_admin_realms_realm_clients_client_uuid_optional_client_scopes_client_scope_id,
-    delete_admin_realms_realm_clients_client_uuid_optional_client_scopes_client_scope_id,
-    post_admin_realms_realm_clients_client_uuid_push_revocation,
-    post_admin_realms_realm_clients_client_uuid_registration_access_token,
-    get_admin_realms_realm_clients_client_uuid_management_permissions,
-    put_admin_realms_realm_clients_client_uuid_management_permissions,
-    post_admin_realms_realm_clients_client_uuid_nodes,
-    delete_admin_realms_realm_clients_client_uuid_nodes_node,
-    get_admin_realms_realm_clients_client_uuid_test_nodes_available,
-)
+from .base import BaseAPI, OK_CREATE, OK_UPDATE, lazy_import
 from ..generated.models import (
     ClientRepresentation,
     ClientScopeRepresentation,
@@ -42,6 +14,34 @@ from ..generated.models import (
 )
 from ..generated.types import UNSET, Unset
 
+_ENDPOINTS = "ackc.generated.api.clients"
+
+get_admin_realms_realm_clients = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients")
+post_admin_realms_realm_clients = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients")
+get_admin_realms_realm_clients_client_uuid = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid")
+put_admin_realms_realm_clients_client_uuid = lazy_import(_ENDPOINTS, "put_admin_realms_realm_clients_client_uuid")
+delete_admin_realms_realm_clients_client_uuid = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_clients_client_uuid")
+get_admin_realms_realm_clients_client_uuid_client_secret = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_client_secret")
+post_admin_realms_realm_clients_client_uuid_client_secret = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients_client_uuid_client_secret")
+get_admin_realms_realm_clients_client_uuid_service_account_user = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_service_account_user")
+get_admin_realms_realm_clients_client_uuid_session_count = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_session_count")
+get_admin_realms_realm_clients_client_uuid_offline_session_count = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_offline_session_count")
+get_admin_realms_realm_clients_client_uuid_user_sessions = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_user_sessions")
+get_admin_realms_realm_clients_client_uuid_offline_sessions = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_offline_sessions")
+get_admin_realms_realm_clients_client_uuid_default_client_scopes = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_default_client_scopes")
+put_admin_realms_realm_clients_client_uuid_default_client_scopes_client_scope_id = lazy_import(_ENDPOINTS, "put_admin_realms_realm_clients_client_uuid_default_client_scopes_client_scope_id")
+delete_admin_realms_realm_clients_client_uuid_default_client_scopes_client_scope_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_clients_client_uuid_default_client_scopes_client_scope_id")
+get_admin_realms_realm_clients_client_uuid_optional_client_scopes = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_optional_client_scopes")
+put_admin_realms_realm_clients_client_uuid_optional_client_scopes_client_scope_id = lazy_import(_ENDPOINTS, "put_admin_realms_realm_clients_client_uuid_optional_client_scopes_client_scope_id")
+delete_admin_realms_realm_clients_client_uuid_optional_client_scopes_client_scope_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_clients_client_uuid_optional_client_scopes_client_scope_id")
+post_admin_realms_realm_clients_client_uuid_push_revocation = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients_client_uuid_push_revocation")
+post_admin_realms_realm_clients_client_uuid_registration_access_token = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients_client_uuid_registration_access_token")
+get_admin_realms_realm_clients_client_uuid_management_permissions = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_management_permissions")
+put_admin_realms_realm_clients_client_uuid_management_permissions = lazy_import(_ENDPOINTS, "put_admin_realms_realm_clients_client_uuid_management_permissions")
+post_admin_realms_realm_clients_client_uuid_nodes = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients_client_uuid_nodes")
+delete_admin_realms_realm_clients_client_uuid_nodes_node = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_clients_client_uuid_nodes_node")
+get_admin_realms_realm_clients_client_uuid_test_nodes_available = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_test_nodes_available")
+
 __all__ = (
     "ClientsAPI",
     "ClientsClientMixin",
@@ -54,6 +54,7 @@ __all__ = (
 
 class ClientsAPI(BaseAPI):
     """Client (application) management API methods."""
+    __slots__ = ()
 
     def get_all(
         self,
@@ -146,10 +147,9 @@ class ClientsAPI(BaseAPI):
             client_data,
             ClientRepresentation
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create client: {response.status_code}")
+        self._check(response, OK_CREATE, "create client")
         location = response.headers.get("Location", "")
-        return location.split("/")[-1] if location else ""
+        return location.rpartition("/")[2]
 
     async def acreate(self, realm: str | None = None, *, client_data: dict | ClientRepresentation) -> str:
         """Create a client (async).
@@ -170,10 +170,9 @@ class ClientsAPI(BaseAPI):
             client_data,
             ClientRepresentation
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create client: {response.status_code}")
+        self._check(response, OK_CREATE, "create client")
         location = response.headers.get("Location", "")
-        return location.split("/")[-1] if location else ""
+        return location.rpartition("/")[2]
 
     def get(self, realm: str | None = None, *, client_uuid: str) -> ClientRepresentation | None:
         """Get a client by UUID (sync).
@@ -225,8 +224,7 @@ class ClientsAPI(BaseAPI):
             ClientRepresentation,
             client_uuid=client_uuid
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update client: {response.status_code}")
+        self._check(response, OK_UPDATE, "update client")
 
     async def aupdate(self, realm: str | None = None, *, client_uuid: str, client_data: dict | ClientRepresentation) -> None:
         """Update a client (async).
@@ -246,8 +244,7 @@ class ClientsAPI(BaseAPI):
             ClientRepresentation,
             client_uuid=client_uuid
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update client: {response.status_code}")
+        self._check(response, OK_UPDATE, "update client")
 
     def delete(self, realm: str | None = None, *, client_uuid: str) -> None:
         """Delete a client (sync).
@@ -264,8 +261,7 @@ class ClientsAPI(BaseAPI):
             realm,
             client_uuid=client_uuid
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete client: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete client")
 
     async def adelete(self, realm: str | None = None, *, client_uuid: str) -> None:
         """Delete a client (async).
@@ -282,8 +278,7 @@ class ClientsAPI(BaseAPI):
             realm,
             client_uuid=client_uuid
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete client: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete client")
 
     def get_secret(self, realm: str | None = None, *, client_uuid: str) -> CredentialRepresentation | None:
         """Get client secret (sync).
@@ -616,8 +611,7 @@ class ClientsAPI(BaseAPI):
             client_uuid=client_uuid,
             client_scope_id=client_scope_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add default client scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "add default client scope")
 
     async def aadd_default_client_scope(self, realm: str | None = None, *, client_uuid: str, client_scope_id: str) -> None:
         """Add default client scope (async).
@@ -638,8 +632,7 @@ class ClientsAPI(BaseAPI):
             client_uuid=client_uuid,
             client_scope_id=client_scope_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add default client scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "add default client scope")
 
     def remove_default_client_scope(self, realm: str | None = None, *, client_uuid: str, client_scope_id: str) -> None:
         """Remove default client scope (sync).
@@ -658,8 +651,7 @@ class ClientsAPI(BaseAPI):
             client_uuid=client_uuid,
             client_scope_id=client_scope_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove default client scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove default client scope")
 
     async def aremove_default_client_scope(self, realm: str | None = None, *, client_uuid: str, client_scope_id: str) -> None:
         """Remove default client scope (async).
@@ -678,8 +670,7 @@ class ClientsAPI(BaseAPI):
             client_uuid=client_uuid,
             client_scope_id=client_scope_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove default client scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove default client scope")
 
     def get_optional_client_scopes(self, realm: str | None = None, *, client_uuid: str) -> list[ClientScopeRepresentation] | None:
         """Get optional client scopes (sync).
@@ -734,8 +725,7 @@ class ClientsAPI(BaseAPI):
             client_uuid=client_uuid,
             client_scope_id=client_scope_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add optional client scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "add optional client scope")
 
     async def aadd_optional_client_scope(self, realm: str | None = None, *, client_uuid: str, client_scope_id: str) -> None:
         """Add optional client scope (async).
@@ -754,8 +744,7 @@ class ClientsAPI(BaseAPI):
             client_uuid=client_uuid,
             client_scope_id=client_scope_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add optional client scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "add optional client scope")
 
     def remove_optional_client_scope(self, realm: str | None = None, *, client_uuid: str, client_scope_id: str) -> None:
         """Remove optional client scope (sync).
@@ -774,8 +763,7 @@ class ClientsAPI(BaseAPI):
             client_uuid=client_uuid,
             client_scope_id=client_scope_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove optional client scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove optional client scope")
 
     async def aremove_optional_client_scope(self, realm: str | None = None, *, client_uuid: str, client_scope_id: str) -> None:
         """Remove optional client scope (async).
@@ -794,8 +782,7 @@ class ClientsAPI(BaseAPI):
             client_uuid=client_uuid,
             client_scope_id=client_scope_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove optional client scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove optional client scope")
 
     def push_revocation(self, realm: str | None = None, *, client_uuid: str) -> None:
         """Push revocation policy to client (sync).
@@ -814,8 +801,7 @@ class ClientsAPI(BaseAPI):
             realm,
             client_uuid=client_uuid
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to push revocation: {response.status_code}")
+        self._check(response, OK_UPDATE, "push revocation")
 
     async def apush_revocation(self, realm: str | None = None, *, client_uuid: str) -> None:
         """Push revocation policy to client (async).
@@ -834,8 +820,7 @@ class ClientsAPI(BaseAPI):
             realm,
             client_uuid=client_uuid
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to push revocation: {response.status_code}")
+        self._check(response, OK_UPDATE, "push revocation")
 
     def regenerate_registration_token(self, realm: str | None = None, *, client_uuid: str) -> ClientRepresentation | None:
         """Regenerate registration access token (sync).
@@ -927,8 +912,7 @@ class ClientsAPI(BaseAPI):
             ManagementPermissionReference,
             client_uuid=client_uuid
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update management permissions: {response.status_code}")
+        self._check(response, OK_UPDATE, "update management permissions")
         return response.parsed
 
     async def aupdate_management_permissions(self, realm: str | None = None, *, client_uuid: str, permissions: dict | ManagementPermissionReference) -> ManagementPermissionReference | None:
@@ -949,8 +933,7 @@ class ClientsAPI(BaseAPI):
             ManagementPermissionReference,
             client_uuid=client_uuid
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update management permissions: {response.status_code}")
+        self._check(response, OK_UPDATE, "update management permissions")
         return response.parsed
 
     def register_node(self, realm: str | None = None, *, client_uuid: str, node_data: dict | PostAdminRealmsRealmClientsClientUuidNodesBody) -> None:
@@ -971,8 +954,7 @@ class ClientsAPI(BaseAPI):
             PostAdminRealmsRealmClientsClientUuidNodesBody,
             client_uuid=client_uuid
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to register node: {response.status_code}")
+        self._check(response, OK_UPDATE, "register node")
 
     async def aregister_node(self, realm: str | None = None, *, client_uuid: str, node_data: dict | PostAdminRealmsRealmClientsClientUuidNodesBody) -> None:
         """Register a cluster node with the client (async).
@@ -992,8 +974,7 @@ class ClientsAPI(BaseAPI):
             PostAdminRealmsRealmClientsClientUuidNodesBody,
             client_uuid=client_uuid
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to register node: {response.status_code}")
+        self._check(response, OK_UPDATE, "register node")
 
     def unregister_node(self, realm: str | None = None, *, client_uuid: str, node: str) -> None:
         """Unregister a cluster node from the client (sync).
@@ -1012,8 +993,7 @@ class ClientsAPI(BaseAPI):
             client_uuid=client_uuid,
             node=node
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to unregister node: {response.status_code}")
+        self._check(response, OK_UPDATE, "unregister node")
 
     async def aunregister_node(self, realm: str | None = None, *, client_uuid: str, node: str) -> None:
         """Unregister a cluster node from the client (async).
@@ -1032,8 +1012,7 @@ class ClientsAPI(BaseAPI):
             client_uuid=client_uuid,
             node=node
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to unregister node: {response.status_code}")
+        self._check(response, OK_UPDATE, "unregister node")
 
     def test_nodes_available(self, realm: str | None = None, *, client_uuid: str) -> GlobalRequestResult | None:
         """Test if registered cluster nodes are available (sync).
@@ -1,24 +1,25 @@
 """Component management API methods."""
 from functools import cached_property
 
-from .base import BaseAPI
-from ..exceptions import APIError
-from ..generated.api.component import (
-    get_admin_realms_realm_components,
-    post_admin_realms_realm_components,
-    get_admin_realms_realm_components_id,
-    put_admin_realms_realm_components_id,
-    delete_admin_realms_realm_components_id,
-    get_admin_realms_realm_components_id_sub_component_types,
-)
+from .base import BaseAPI, OK_CREATE, OK_UPDATE, lazy_import
 from ..generated.models import ComponentRepresentation, ComponentTypeRepresentation
 from ..generated.types import UNSET, Unset
 
+_ENDPOINTS = "ackc.generated.api.component"
+
+get_admin_realms_realm_components = lazy_import(_ENDPOINTS, "get_admin_realms_realm_components")
+post_admin_realms_realm_components = lazy_import(_ENDPOINTS, "post_admin_realms_realm_components")
+get_admin_realms_realm_components_id = lazy_import(_ENDPOINTS, "get_admin_realms_realm_components_id")
+put_admin_realms_realm_components_id = lazy_import(_ENDPOINTS, "put_admin_realms_realm_components_id")
+delete_admin_realms_realm_components_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_components_id")
+get_admin_realms_realm_components_id_sub_component_types = lazy_import(_ENDPOINTS, "get_admin_realms_realm_components_id_sub_component_types")
+
 __all__ = "ComponentsAPI", "ComponentsClientMixin", "ComponentRepresentation", "ComponentTypeRepresentation"
 
 
 class ComponentsAPI(BaseAPI):
     """Component management API methods."""
+    __slots__ = ()
 
     def get_all(
         self,
@@ -95,10 +96,9 @@ class ComponentsAPI(BaseAPI):
             component_data,
             ComponentRepresentation
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create component: {response.status_code}")
+        self._check(response, OK_CREATE, "create component")
         location = response.headers.get("Location", "")
-        return location.split("/")[-1] if location else ""
+        return location.rpartition("/")[2]
 
     async def acreate(self, realm: str | None = None, *, component_data: dict | ComponentRepresentation) -> str:
         """Create a component (async).
@@ -121,10 +121,9 @@ class ComponentsAPI(BaseAPI):
             component_data,
             ComponentRepresentation
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create component: {response.status_code}")
+        self._check(response, OK_CREATE, "create component")
         location = response.headers.get("Location", "")
-        return location.split("/")[-1] if location else ""
+        return location.rpartition("/")[2]
 
     def get(self, realm: str | None = None, *, component_id: str) -> ComponentRepresentation | None:
         """Get a component by ID (sync).
@@ -176,8 +175,7 @@ class ComponentsAPI(BaseAPI):
             ComponentRepresentation,
             id=component_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update component: {response.status_code}")
+        self._check(response, OK_UPDATE, "update component")
 
     async def aupdate(self, realm: str | None = None, *, component_id: str, component_data: dict | ComponentRepresentation) -> None:
         """Update a component (async).
@@ -197,8 +195,7 @@ class ComponentsAPI(BaseAPI):
             ComponentRepresentation,
             id=component_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update component: {response.status_code}")
+        self._check(response, OK_UPDATE, "update component")
 
     def delete(self, realm: str | None = None, *, component_id: str) -> None:
         """Delete a component (sync).
@@ -215,8 +212,7 @@ class ComponentsAPI(BaseAPI):
             realm,
             id=component_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete component: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete component")
 
     async def adelete(self, realm: str | None = None, *, component_id: str) -> None:
         """Delete a component (async).
@@ -233,8 +229,7 @@ class ComponentsAPI(BaseAPI):
             realm,
             id=component_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete component: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete component")
 
     def get_sub_component_types(self, realm: str | None = None, *, component_id: str, type: Unset | str = UNSET) -> list[ComponentTypeRepresentation] | None:
         """Get sub-component types (sync).
@@ -2,16 +2,7 @@
 from datetime import datetime
 from functools import cached_property
 
-from .base import BaseAPI
-from ..exceptions import APIError
-from ..generated.api.realms_admin import (
-    get_admin_realms_realm_events,
-    delete_admin_realms_realm_events,
-    get_admin_realms_realm_admin_events,
-    delete_admin_realms_realm_admin_events,
-    get_admin_realms_realm_events_config,
-    put_admin_realms_realm_events_config,
-)
+from .base import BaseAPI, OK_UPDATE, lazy_import
 from ..generated.models import (
     RealmEventsConfigRepresentation,
     EventRepresentation,
@@ -19,6 +10,15 @@ from ..generated.models import (
 )
 from ..generated.types import UNSET, Unset
 
+_ENDPOINTS = "ackc.generated.api.realms_admin"
+
+get_admin_realms_realm_events = lazy_import(_ENDPOINTS, "get_admin_realms_realm_events")
+delete_admin_realms_realm_events = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_events")
+get_admin_realms_realm_admin_events = lazy_import(_ENDPOINTS, "get_admin_realms_realm_admin_events")
+delete_admin_realms_realm_admin_events = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_admin_events")
+get_admin_realms_realm_events_config = lazy_import(_ENDPOINTS, "get_admin_realms_realm_events_config")
+put_admin_realms_realm_events_config = lazy_import(_ENDPOINTS, "put_admin_realms_realm_events_config")
+
 __all__ = (
     "EventsAPI", 
     "EventsClientMixin",
@@ -30,6 +30,7 @@ __all__ = (
 
 class EventsAPI(BaseAPI):
     """Events management API methods for auditing user and admin actions."""
+    __slots__ = ()
 
     def get_events(
         self, 
@@ -148,8 +149,7 @@ class EventsAPI(BaseAPI):
             delete_admin_realms_realm_events.sync_detailed,
             realm
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete events: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete events")
 
     async def adelete_events(self, realm: str | None = None) -> None:
         """Delete all user events (async).
@@ -164,8 +164,7 @@ class EventsAPI(BaseAPI):
             delete_admin_realms_realm_events.asyncio_detailed,
             realm
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete events: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete events")
 
     def get_admin_events(
         self, 
@@ -310,8 +309,7 @@ class EventsAPI(BaseAPI):
             delete_admin_realms_realm_admin_events.sync_detailed,
             realm
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete admin events: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete admin events")
 
     async def adelete_admin_events(self, realm: str | None = None) -> None:
         """Delete all admin events (async).
@@ -326,8 +324,7 @@ class EventsAPI(BaseAPI):
             delete_admin_realms_realm_admin_events.asyncio_detailed,
             realm
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete admin events: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete admin events")
 
     def get_events_config(self, realm: str | None = None) -> RealmEventsConfigRepresentation | None:
         """Get events configuration (sync).
@@ -375,8 +372,7 @@ class EventsAPI(BaseAPI):
             config,
             RealmEventsConfigRepresentation
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update events config: {response.status_code}")
+        self._check(response, OK_UPDATE, "update events config")
 
     async def aupdate_events_config(self, realm: str | None = None, *, config: dict | RealmEventsConfigRepresentation) -> None:
         """Update events configuration (async).
@@ -402,8 +398,7 @@ class EventsAPI(BaseAPI):
             config,
             RealmEventsConfigRepresentation
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update events config: {response.status_code}")
+        self._check(response, OK_UPDATE, "update events config")
 
 
 class EventsClientMixin:
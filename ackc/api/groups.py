@@ -1,29 +1,30 @@
 """Group management API methods."""
 from functools import cached_property
 
-from .base import BaseAPI
-from ..exceptions import APIError
-from ..generated.api.groups import (
-    get_admin_realms_realm_groups,
-    get_admin_realms_realm_groups_count,
-    post_admin_realms_realm_groups,
-    get_admin_realms_realm_groups_group_id,
-    put_admin_realms_realm_groups_group_id,
-    delete_admin_realms_realm_groups_group_id,
-    get_admin_realms_realm_groups_group_id_members,
-    get_admin_realms_realm_groups_group_id_children,
-    post_admin_realms_realm_groups_group_id_children,
-    get_admin_realms_realm_groups_group_id_management_permissions,
-    put_admin_realms_realm_groups_group_id_management_permissions,
-)
+from .base import BaseAPI, OK_CREATE, OK_UPDATE, lazy_import
 from ..generated.models import GroupRepresentation, ManagementPermissionReference, UserRepresentation
 from ..generated.types import UNSET, Unset
 
+_ENDPOINTS = "ackc.generated.api.groups"
+
+get_admin_realms_realm_groups = lazy_import(_ENDPOINTS, "get_admin_realms_realm_groups")
+get_admin_realms_realm_groups_count = lazy_import(_ENDPOINTS, "get_admin_realms_realm_groups_count")
+post_admin_realms_realm_groups = lazy_import(_ENDPOINTS, "post_admin_realms_realm_groups")
+get_admin_realms_realm_groups_group_id = lazy_import(_ENDPOINTS, "get_admin_realms_realm_groups_group_id")
+put_admin_realms_realm_groups_group_id = lazy_import(_ENDPOINTS, "put_admin_realms_realm_groups_group_id")
+delete_admin_realms_realm_groups_group_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_groups_group_id")
+get_admin_realms_realm_groups_group_id_members = lazy_import(_ENDPOINTS, "get_admin_realms_realm_groups_group_id_members")
+get_admin_realms_realm_groups_group_id_children = lazy_import(_ENDPOINTS, "get_admin_realms_realm_groups_group_id_children")
+post_admin_realms_realm_groups_group_id_children = lazy_import(_ENDPOINTS, "post_admin_realms_realm_groups_group_id_children")
+get_admin_realms_realm_groups_group_id_management_permissions = lazy_import(_ENDPOINTS, "get_admin_realms_realm_groups_group_id_management_permissions")
+put_admin_realms_realm_groups_group_id_management_permissions = lazy_import(_ENDPOINTS, "put_admin_realms_realm_groups_group_id_management_permissions")
+
 __all__ = "GroupsAPI", "GroupsClientMixin", "GroupRepresentation"
 
 
 class GroupsAPI(BaseAPI):
     """Group management API methods."""
+    __slots__ = ()
 
     def get_all(
         self,
@@ -128,10 +129,9 @@ class GroupsAPI(BaseAPI):
             group_data,
             GroupRepresentation
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create group: {response.status_code}")
+        self._check(response, OK_CREATE, "create group")
         location = response.headers.get("Location", "")
-        return location.split("/")[-1] if location else ""
+        return location.rpartition("/")[2]
 
     async def acreate(self, realm: str | None = None, *, group_data: dict | GroupRepresentation) -> str:
         """Create a group (async).
@@ -152,10 +152,9 @@ class GroupsAPI(BaseAPI):
             group_data,
             GroupRepresentation
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create group: {response.status_code}")
+        self._check(response, OK_CREATE, "create group")
         location = response.headers.get("Location", "")
-        return location.split("/")[-1] if location else ""
+        return location.rpartition("/")[2]
 
     def get(self, realm: str | None = None, *, group_id: str) -> GroupRepresentation | None:
         """Get a group by ID (sync).
@@ -207,8 +206,7 @@ class GroupsAPI(BaseAPI):
             GroupRepresentation,
             group_id=group_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update group: {response.status_code}")
+        self._check(response, OK_UPDATE, "update group")
 
     async def aupdate(self, realm: str | None = None, *, group_id: str, group_data: dict | GroupRepresentation) -> None:
         """Update a group (async).
@@ -228,8 +226,7 @@ class GroupsAPI(BaseAPI):
             GroupRepresentation,
             group_id=group_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update group: {response.status_code}")
+        self._check(response, OK_UPDATE, "update group")
 
     def delete(self, realm: str | None = None, *, group_id: str) -> None:
         """Delete a group (sync).
@@ -246,8 +243,7 @@ class GroupsAPI(BaseAPI):
             realm,
             group_id=group_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete group: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete group")
 
     async def adelete(self, realm: str | None = None, *, group_id: str) -> None:
         """Delete a group (async).
@@ -264,8 +260,7 @@ class GroupsAPI(BaseAPI):
             realm,
             group_id=group_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete group: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete group")
 
     def get_members(
         self,
@@ -444,10 +439,9 @@ class GroupsAPI(BaseAPI):
             GroupRepresentation,
             group_id=group_id
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to add child group: {response.status_code}")
+        self._check(response, OK_CREATE, "add child group")
         location = response.headers.get("Location", "")
-        return location.split("/")[-1] if location else ""
+        return location.rpartition("/")[2]
 
     async def aadd_child(self, realm: str | None = None, *, group_id: str, child_data: dict | GroupRepresentation) -> str:
         """Add a child group (async).
@@ -472,10 +466,9 @@ class GroupsAPI(BaseAPI):
             GroupRepresentation,
             group_id=group_id
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to add child group: {response.status_code}")
+        self._check(response, OK_CREATE, "add child group")
         location = response.headers.get("Location", "")
-        return location.split("/")[-1] if location else ""
+        return location.rpartition("/")[2]
 
     def get_management_permissions(self, realm: str | None = None, *, group_id: str) -> ManagementPermissionReference | None:
         """Get management permissions for group (sync).
@@ -531,8 +524,7 @@ class GroupsAPI(BaseAPI):
             ManagementPermissionReference,
             group_id=group_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update management permissions: {response.status_code}")
+        self._check(response, OK_UPDATE, "update management permissions")
         return response.parsed
 
     async def aupdate_management_permissions(self, realm: str | None = None, *, group_id: str, permissions: dict | ManagementPermissionReference) -> ManagementPermissionReference | None:
@@ -553,8 +545,7 @@ class GroupsAPI(BaseAPI):
             ManagementPermissionReference,
             group_id=group_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update management permissions: {response.status_code}")
+        self._check(response, OK_UPDATE, "update management permissions")
         return response.parsed
 
 
@@ -3,30 +3,31 @@ import json
 from functools import cached_property
 from typing import Any
 
-from .base import BaseAPI
-from ..exceptions import APIError
-from ..generated.api.identity_providers import (
-    get_admin_realms_realm_identity_provider_instances,
-    post_admin_realms_realm_identity_provider_instances,
-    get_admin_realms_realm_identity_provider_instances_alias,
-    put_admin_realms_realm_identity_provider_instances_alias,
-    delete_admin_realms_realm_identity_provider_instances_alias,
-    get_admin_realms_realm_identity_provider_instances_alias_mappers,
-    post_admin_realms_realm_identity_provider_instances_alias_mappers,
-    get_admin_realms_realm_identity_provider_instances_alias_mappers_id,
-    put_admin_realms_realm_identity_provider_instances_alias_mappers_id,
-    delete_admin_realms_realm_identity_provider_instances_alias_mappers_id,
-    get_admin_realms_realm_identity_provider_instances_alias_mapper_types,
-    get_admin_realms_realm_identity_provider_instances_alias_export,
-    post_admin_realms_realm_identity_provider_import_config,
-)
+from .base import BaseAPI, OK_CREATE, OK_UPDATE, lazy_import
 from ..generated.models import IdentityProviderRepresentation, IdentityProviderMapperRepresentation
 
+_ENDPOINTS = "ackc.generated.api.identity_providers"
+
+get_admin_realms_realm_identity_provider_instances = lazy_import(_ENDPOINTS, "get_admin_realms_realm_identity_provider_instances")
+post_admin_realms_realm_identity_provider_instances = lazy_import(_ENDPOINTS, "post_admin_realms_realm_identity_provider_instances")
+get_admin_realms_realm_identity_provider_instances_alias = lazy_import(_ENDPOINTS, "get_admin_realms_realm_identity_provider_instances_alias")
+put_admin_realms_realm_identity_provider_instances_alias = lazy_import(_ENDPOINTS, "put_admin_realms_realm_identity_provider_instances_alias")
+delete_admin_realms_realm_identity_provider_instances_alias = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_identity_provider_instances_alias")
+get_admin_realms_realm_identity_provider_instances_alias_mappers = lazy_import(_ENDPOINTS, "get_admin_realms_realm_identity_provider_instances_alias_mappers")
+post_admin_realms_realm_identity_provider_instances_alias_mappers = lazy_import(_ENDPOINTS, "post_admin_realms_realm_identity_provider_instances_alias_mappers")
+get_admin_realms_realm_identity_provider_instances_alias_mappers_id = lazy_import(_ENDPOINTS, "get_admin_realms_realm_identity_provider_instances_alias_mappers_id")
+put_admin_realms_realm_identity_provider_instances_alias_mappers_id = lazy_import(_ENDPOINTS, "put_admin_realms_realm_identity_provider_instances_alias_mappers_id")
+delete_admin_realms_realm_identity_provider_instances_alias_mappers_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_identity_provider_instances_alias_mappers_id")
+get_admin_realms_realm_identity_provider_instances_alias_mapper_types = lazy_import(_ENDPOINTS, "get_admin_realms_realm_identity_provider_instances_alias_mapper_types")
+get_admin_realms_realm_identity_provider_instances_alias_export = lazy_import(_ENDPOINTS, "get_admin_realms_realm_identity_provider_instances_alias_export")
+post_admin_realms_realm_identity_provider_import_config = lazy_import(_ENDPOINTS, "post_admin_realms_realm_identity_provider_import_config")
+
 __all__ = "IdentityProvidersAPI", "IdentityProvidersClientMixin", "IdentityProviderRepresentation"
 
 
 class IdentityProvidersAPI(BaseAPI):
     """Identity provider management API methods."""
+    __slots__ = ()
 
     def get_all(self, realm: str | None = None) -> list[IdentityProviderRepresentation] | None:
         """List identity providers in a realm (sync).
@@ -66,8 +67,7 @@ class IdentityProvidersAPI(BaseAPI):
             provider_data,
             IdentityProviderRepresentation
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create identity provider: {response.status_code}")
+        self._check(response, OK_CREATE, "create identity provider")
 
     async def acreate(self, realm: str | None = None, *, provider_data: dict | IdentityProviderRepresentation) -> None:
         """Create an identity provider (async).
@@ -85,8 +85,7 @@ class IdentityProvidersAPI(BaseAPI):
             provider_data,
             IdentityProviderRepresentation
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create identity provider: {response.status_code}")
+        self._check(response, OK_CREATE, "create identity provider")
 
     def get(self, realm: str | None = None, *, alias: str) -> IdentityProviderRepresentation | None:
         """Get an identity provider by alias (sync).
@@ -138,8 +137,7 @@ class IdentityProvidersAPI(BaseAPI):
             IdentityProviderRepresentation,
             alias=alias
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update identity provider: {response.status_code}")
+        self._check(response, OK_UPDATE, "update identity provider")
 
     async def aupdate(self, realm: str | None = None, *, alias: str, provider_data: dict | IdentityProviderRepresentation) -> None:
         """Update an identity provider (async).
@@ -159,8 +157,7 @@ class IdentityProvidersAPI(BaseAPI):
             IdentityProviderRepresentation,
             alias=alias
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update identity provider: {response.status_code}")
+        self._check(response, OK_UPDATE, "update identity provider")
 
     def delete(self, realm: str | None = None, *, alias: str) -> None:
         """Delete an identity provider (sync).
@@ -177,8 +174,7 @@ class IdentityProvidersAPI(BaseAPI):
             realm,
             alias=alias
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete identity provider: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete identity provider")
 
     async def adelete(self, realm: str | None = None, *, alias: str) -> None:
         """Delete an identity provider (async).
@@ -195,8 +191,7 @@ class IdentityProvidersAPI(BaseAPI):
             realm,
             alias=alias
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete identity provider: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete identity provider")
 
     def get_mappers(self, realm: str | None = None, *, alias: str) -> list[IdentityProviderMapperRepresentation] | None:
         """Get identity provider mappers (sync).
@@ -261,10 +256,9 @@ class IdentityProvidersAPI(BaseAPI):
             IdentityProviderMapperRepresentation,
             alias=alias
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create mapper: {response.status_code}")
+        self._check(response, OK_CREATE, "create mapper")
         location = response.headers.get("Location", "")
-        return location.split("/")[-1] if location else ""
+        return location.rpartition("/")[2]
 
     async def acreate_mapper(
         self,
@@ -293,10 +287,9 @@ class IdentityProvidersAPI(BaseAPI):
             IdentityProviderMapperRepresentation,
             alias=alias
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create mapper: {response.status_code}")
+        self._check(response, OK_CREATE, "create mapper")
         location = response.headers.get("Location", "")
-        return location.split("/")[-1] if location else ""
+        return location.rpartition("/")[2]
 
     def get_mapper(self, realm: str | None = None, *, alias: str, mapper_id: str) -> IdentityProviderMapperRepresentation | None:
         """Get identity provider mapper (sync).
@@ -361,8 +354,7 @@ class IdentityProvidersAPI(BaseAPI):
             alias=alias,
             id=mapper_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update mapper: {response.status_code}")
+        self._check(response, OK_UPDATE, "update mapper")
 
     async def aupdate_mapper(
         self,
@@ -391,8 +383,7 @@ class IdentityProvidersAPI(BaseAPI):
             alias=alias,
             id=mapper_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update mapper: {response.status_code}")
+        self._check(response, OK_UPDATE, "update mapper")
 
     def delete_mapper(self, realm: str | None = None, *, alias: str, mapper_id: str) -> None:
         """Delete identity provider mapper (sync).
@@ -411,8 +402,7 @@ class IdentityProvidersAPI(BaseAPI):
             alias=alias,
             id=mapper_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete mapper: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete mapper")
 
     async def adelete_mapper(self, realm: str | None = None, *, alias: str, mapper_id: str) -> None:
         """Delete identity provider mapper (async).
@@ -431,8 +421,7 @@ class IdentityProvidersAPI(BaseAPI):
             alias=alias,
             id=mapper_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete mapper: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete mapper")
 
     def get_mapper_types(self, realm: str | None = None, *, alias: str) -> dict[str, Any] | None:
         """Get available mapper types (sync).
@@ -1,15 +1,19 @@
 """Key management API methods."""
 from functools import cached_property
 
-from .base import BaseAPI
-from ..generated.api.key import get_admin_realms_realm_keys
+from .base import BaseAPI, lazy_import
 from ..generated.models import KeysMetadataRepresentation
 
+_ENDPOINTS = "ackc.generated.api.key"
+
+get_admin_realms_realm_keys = lazy_import(_ENDPOINTS, "get_admin_realms_realm_keys")
+
 __all__ = "KeysAPI", "KeysClientMixin", "KeysMetadataRepresentation"
 
 
 class KeysAPI(BaseAPI):
     """Key management API methods for realm cryptographic keys."""
+    __slots__ = ()
 
     def get_keys(self, realm: str | None = None) -> KeysMetadataRepresentation | None:
         """Get keys metadata for a realm (sync).
@@ -1,29 +1,7 @@
 """Organization management API methods."""
 from functools import cached_property
 
-from .base import BaseAPI
-from ..exceptions import APIError
-from ..generated.api.organizations import (
-    get_admin_realms_realm_organizations,
-    post_admin_realms_realm_organizations,
-    get_admin_realms_realm_organizations_org_id,
-    put_admin_realms_realm_organizations_org_id,
-    delete_admin_realms_realm_organizations_org_id,
-    get_admin_realms_realm_organizations_count,
-    get_admin_realms_realm_organizations_org_id_members,
-    get_admin_realms_realm_organizations_org_id_members_count,
-    get_admin_realms_realm_organizations_org_id_members_member_id,
-    post_admin_realms_realm_organizations_org_id_members,
-    delete_admin_realms_realm_organizations_org_id_members_member_id,
-    post_admin_realms_realm_organizations_org_id_members_invite_existing_user,
-    post_admin_realms_realm_organizations_org_id_members_invite_user,
-    get_admin_realms_realm_organizations_org_id_identity_providers,
-    get_admin_realms_realm_organizations_org_id_identity_providers_alias,
-    post_admin_realms_realm_organizations_org_id_identity_providers,
-    delete_admin_realms_realm_organizations_org_id_identity_providers_alias,
-    get_admin_realms_realm_organizations_members_member_id_organizations,
-    get_admin_realms_realm_organizations_org_id_members_member_id_organizations,
-)
+from .base import BaseAPI, OK_CREATE, OK_UPDATE, OK_ADD, lazy_import
 from ..generated.models import (
     OrganizationRepresentation,
     MemberRepresentation,
@@ -33,6 +11,28 @@ from ..generated.models import (
 )
 from ..generated.types import UNSET, Unset
 
+_ENDPOINTS = "ackc.generated.api.organizations"
+
+get_admin_realms_realm_organizations = lazy_import(_ENDPOINTS, "get_admin_realms_realm_organizations")
+post_admin_realms_realm_organizations = lazy_import(_ENDPOINTS, "post_admin_realms_realm_organizations")
+get_admin_realms_realm_organizations_org_id = lazy_import(_ENDPOINTS, "get_admin_realms_realm_organizations_org_id")
+put_admin_realms_realm_organizations_org_id = lazy_import(_ENDPOINTS, "put_admin_realms_realm_organizations_org_id")
+delete_admin_realms_realm_organizations_org_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_organizations_org_id")
+get_admin_realms_realm_organizations_count = lazy_import(_ENDPOINTS, "get_admin_realms_realm_organizations_count")
+get_admin_realms_realm_organizations_org_id_members = lazy_import(_ENDPOINTS, "get_admin_realms_realm_organizations_org_id_members")
+get_admin_realms_realm_organizations_org_id_members_count = lazy_import(_ENDPOINTS, "get_admin_realms_realm_organizations_org_id_members_count")
+get_admin_realms_realm_organizations_org_id_members_member_id = lazy_import(_ENDPOINTS, "get_admin_realms_realm_organizations_org_id_members_member_id")
+post_admin_realms_realm_organizations_org_id_members = lazy_import(_ENDPOINTS, "post_admin_realms_realm_organizations_org_id_members")
+delete_admin_realms_realm_organizations_org_id_members_member_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_organizations_org_id_members_member_id")
+post_admin_realms_realm_organizations_org_id_members_invite_existing_user = lazy_import(_ENDPOINTS, "post_admin_realms_realm_organizations_org_id_members_invite_existing_user")
+post_admin_realms_realm_organizations_org_id_members_invite_user = lazy_import(_ENDPOINTS, "post_admin_realms_realm_organizations_org_id_members_invite_user")
+get_admin_realms_realm_organizations_org_id_identity_providers = lazy_import(_ENDPOINTS, "get_admin_realms_realm_organizations_org_id_identity_providers")
+get_admin_realms_realm_organizations_org_id_identity_providers_alias = lazy_import(_ENDPOINTS, "get_admin_realms_realm_organizations_org_id_identity_providers_alias")
+post_admin_realms_realm_organizations_org_id_identity_providers = lazy_import(_ENDPOINTS, "post_admin_realms_realm_organizations_org_id_identity_providers")
+delete_admin_realms_realm_organizations_org_id_identity_providers_alias = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_organizations_org_id_identity_providers_alias")
+get_admin_realms_realm_organizations_members_member_id_organizations = lazy_import(_ENDPOINTS, "get_admin_realms_realm_organizations_members_member_id_organizations")
+get_admin_realms_realm_organizations_org_id_members_member_id_organizations = lazy_import(_ENDPOINTS, "get_admin_realms_realm_organizations_org_id_members_member_id_organizations")
+
 __all__ = (
     "OrganizationsAPI",
     "OrganizationsClientMixin",
@@ -44,6 +44,7 @@ __all__ = (
 
 class OrganizationsAPI(BaseAPI):
     """Organization management API methods."""
+    __slots__ = ()
 
     def get_all(
         self,
@@ -136,10 +137,9 @@ class OrganizationsAPI(BaseAPI):
             org_data,
             OrganizationRepresentation
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create organization: {response.status_code}")
+        self._check(response, OK_CREATE, "create organization")
         location = response.headers.get("Location", "")
-        return location.split("/")[-1] if location else ""
+        return location.rpartition("/")[2]
 
     async def acreate(self, realm: str | None = None, *, org_data: dict | OrganizationRepresentation) -> str:
         """Create an organization (async).
@@ -160,10 +160,9 @@ class OrganizationsAPI(BaseAPI):
             org_data,
             OrganizationRepresentation
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create organization: {response.status_code}")
+        self._check(response, OK_CREATE, "create organization")
         location = response.headers.get("Location", "")
-        return location.split("/")[-1] if location else ""
+        return location.rpartition("/")[2]
 
     def get(self, realm: str | None = None, *, org_id: str) -> OrganizationRepresentation | None:
         """Get an organization by ID (sync).
@@ -215,8 +214,7 @@ class OrganizationsAPI(BaseAPI):
             OrganizationRepresentation,
             org_id=org_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update organization: {response.status_code}")
+        self._check(response, OK_UPDATE, "update organization")
 
     async def aupdate(self, realm: str | None = None, *, org_id: str, org_data: dict | OrganizationRepresentation) -> None:
         """Update an organization (async).
@@ -236,8 +234,7 @@ class OrganizationsAPI(BaseAPI):
             OrganizationRepresentation,
             org_id=org_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update organization: {response.status_code}")
+        self._check(response, OK_UPDATE, "update organization")
 
     def delete(self, realm: str | None = None, *, org_id: str) -> None:
         """Delete an organization (sync).
@@ -254,8 +251,7 @@ class OrganizationsAPI(BaseAPI):
             realm,
             org_id=org_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete organization: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete organization")
 
     async def adelete(self, realm: str | None = None, *, org_id: str) -> None:
         """Delete an organization (async).
@@ -272,8 +268,7 @@ class OrganizationsAPI(BaseAPI):
             realm,
             org_id=org_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete organization: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete organization")
 
     def get_members(
         self, 
@@ -364,8 +359,7 @@ class OrganizationsAPI(BaseAPI):
             org_id=org_id,
             body=user_id
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to add member: {response.status_code}")
+        self._check(response, OK_CREATE, "add member")
 
     async def aadd_member(self, realm: str | None = None, *, org_id: str, user_id: str) -> None:
         """Add a member to an organization (async).
@@ -384,8 +378,7 @@ class OrganizationsAPI(BaseAPI):
             org_id=org_id,
             body=user_id
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to add member: {response.status_code}")
+        self._check(response, OK_CREATE, "add member")
 
     def remove_member(self, realm: str | None = None, *, org_id: str, member_id: str) -> None:
         """Remove a member from an organization (sync).
@@ -404,8 +397,7 @@ class OrganizationsAPI(BaseAPI):
             org_id=org_id,
             member_id=member_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove member: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove member")
 
     async def aremove_member(self, realm: str | None = None, *, org_id: str, member_id: str) -> None:
         """Remove a member from an organization (async).
@@ -424,8 +416,7 @@ class OrganizationsAPI(BaseAPI):
             org_id=org_id,
             member_id=member_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove member: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove member")
 
     def get_count(
         self,
@@ -567,8 +558,7 @@ class OrganizationsAPI(BaseAPI):
             PostAdminRealmsRealmOrganizationsOrgIdMembersInviteExistingUserBody,
             org_id=org_id
         )
-        if response.status_code not in (200, 201, 204):
-            raise APIError(f"Failed to invite user: {response.status_code}")
+        self._check(response, OK_ADD, "invite user")
 
     async def ainvite_existing_user(self, realm: str | None = None, *, org_id: str, user_id: str) -> None:
         """Invite existing user to organization (async).
@@ -588,8 +578,7 @@ class OrganizationsAPI(BaseAPI):
             PostAdminRealmsRealmOrganizationsOrgIdMembersInviteExistingUserBody,
             org_id=org_id
         )
-        if response.status_code not in (200, 201, 204):
-            raise APIError(f"Failed to invite user: {response.status_code}")
+        self._check(response, OK_ADD, "invite user")
 
     def invite_user(self, realm: str | None = None, *, org_id: str, email: str, first_name: str = None, last_name: str = None) -> None:
         """Invite new user to organization (sync).
@@ -617,8 +606,7 @@ class OrganizationsAPI(BaseAPI):
             PostAdminRealmsRealmOrganizationsOrgIdMembersInviteUserBody,
             org_id=org_id
         )
-        if response.status_code not in (200, 201, 204):
-            raise APIError(f"Failed to invite new user: {response.status_code}")
+        self._check(response, OK_ADD, "invite new user")
 
     async def ainvite_user(self, realm: str | None = None, *, org_id: str, email: str, first_name: str = None, last_name: str = None) -> None:
         """Invite new user to organization (async).
@@ -646,8 +634,7 @@ class OrganizationsAPI(BaseAPI):
             PostAdminRealmsRealmOrganizationsOrgIdMembersInviteUserBody,
             org_id=org_id
         )
-        if response.status_code not in (200, 201, 204):
-            raise APIError(f"Failed to invite new user: {response.status_code}")
+        self._check(response, OK_ADD, "invite new user")
 
     # Identity Provider management
     def get_identity_providers(self, realm: str | None = None, *, org_id: str) -> list[IdentityProviderRepresentation] | None:
@@ -735,8 +722,7 @@ class OrganizationsAPI(BaseAPI):
             org_id=org_id,
             body=alias
         )
-        if response.status_code not in (200, 201, 204):
-            raise APIError(f"Failed to add identity provider: {response.status_code}")
+        self._check(response, OK_ADD, "add identity provider")
 
     async def aadd_identity_provider(self, realm: str | None = None, *, org_id: str, alias: str) -> None:
         """Add identity provider to organization (async).
@@ -755,8 +741,7 @@ class OrganizationsAPI(BaseAPI):
             org_id=org_id,
             body=alias
         )
-        if response.status_code not in (200, 201, 204):
-            raise APIError(f"Failed to add identity provider: {response.status_code}")
+        self._check(response, OK_ADD, "add identity provider")
 
     def remove_identity_provider(self, realm: str | None = None, *, org_id: str, alias: str) -> None:
         """Remove identity provider from organization (sync).
@@ -775,8 +760,7 @@ class OrganizationsAPI(BaseAPI):
             org_id=org_id,
             alias=alias
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove identity provider: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove identity provider")
 
     async def aremove_identity_provider(self, realm: str | None = None, *, org_id: str, alias: str) -> None:
         """Remove identity provider from organization (async).
@@ -795,8 +779,7 @@ class OrganizationsAPI(BaseAPI):
             org_id=org_id,
             alias=alias
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove identity provider: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove identity provider")
 
     def get_member_organizations(self, realm: str | None = None, *, member_id: str) -> list[OrganizationRepresentation] | None:
         """Get organizations for a member (sync).
@@ -1,33 +1,35 @@
 """Protocol mapper management API methods."""
 from functools import cached_property
 
-from .base import BaseAPI
-from ..generated.api.protocol_mappers import (
-    # Client protocol mappers
-    get_admin_realms_realm_clients_client_uuid_protocol_mappers_models,
-    post_admin_realms_realm_clients_client_uuid_protocol_mappers_models,
-    get_admin_realms_realm_clients_client_uuid_protocol_mappers_models_id,
-    put_admin_realms_realm_clients_client_uuid_protocol_mappers_models_id,
-    delete_admin_realms_realm_clients_client_uuid_protocol_mappers_models_id,
-    get_admin_realms_realm_clients_client_uuid_protocol_mappers_protocol_protocol,
-    post_admin_realms_realm_clients_client_uuid_protocol_mappers_add_models,
-    # Client scope protocol mappers
-    get_admin_realms_realm_client_scopes_client_scope_id_protocol_mappers_models,
-    post_admin_realms_realm_client_scopes_client_scope_id_protocol_mappers_models,
-    get_admin_realms_realm_client_scopes_client_scope_id_protocol_mappers_models_id,
-    put_admin_realms_realm_client_scopes_client_scope_id_protocol_mappers_models_id,
-    delete_admin_realms_realm_client_scopes_client_scope_id_protocol_mappers_models_id,
-    get_admin_realms_realm_client_scopes_client_scope_id_protocol_mappers_protocol_protocol,
-    post_admin_realms_realm_client_scopes_client_scope_id_protocol_mappers_add_models,
-)
+from .base import BaseAPI, OK_CREATE, OK_UPDATE, OK_POST, lazy_import
 from ..generated.models import ProtocolMapperRepresentation
-from ..exceptions import APIError
+
+_ENDPOINTS = "ackc.generated.api.protocol_mappers"
+
+# Client protocol mappers
+get_admin_realms_realm_clients_client_uuid_protocol_mappers_models = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_protocol_mappers_models")
+post_admin_realms_realm_clients_client_uuid_protocol_mappers_models = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients_client_uuid_protocol_mappers_models")
+get_admin_realms_realm_clients_client_uuid_protocol_mappers_models_id = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_protocol_mappers_models_id")
+put_admin_realms_realm_clients_client_uuid_protocol_mappers_models_id = lazy_import(_ENDPOINTS, "put_admin_realms_realm_clients_client_uuid_protocol_mappers_models_id")
+delete_admin_realms_realm_clients_client_uuid_protocol_mappers_models_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_clients_client_uuid_protocol_mappers_models_id")
+get_admin_realms_realm_clients_client_uuid_protocol_mappers_protocol_protocol = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_protocol_mappers_protocol_protocol")
+post_admin_realms_realm_clients_client_uuid_protocol_mappers_add_models = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients_client_uuid_protocol_mappers_add_models")
+
+# Client scope protocol mappers
+get_admin_realms_realm_client_scopes_client_scope_id_protocol_mappers_models = lazy_import(_ENDPOINTS, "get_admin_realms_realm_client_scopes_client_scope_id_protocol_mappers_models")
+post_admin_realms_realm_client_scopes_client_scope_id_protocol_mappers_models = lazy_import(_ENDPOINTS, "post_admin_realms_realm_client_scopes_client_scope_id_protocol_mappers_models")
+get_admin_realms_realm_client_scopes_client_scope_id_protocol_mappers_models_id = lazy_import(_ENDPOINTS, "get_admin_realms_realm_client_scopes_client_scope_id_protocol_mappers_models_id")
+put_admin_realms_realm_client_scopes_client_scope_id_protocol_mappers_models_id = lazy_import(_ENDPOINTS, "put_admin_realms_realm_client_scopes_client_scope_id_protocol_mappers_models_id")
+delete_admin_realms_realm_client_scopes_client_scope_id_protocol_mappers_models_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_client_scopes_client_scope_id_protocol_mappers_models_id")
+get_admin_realms_realm_client_scopes_client_scope_id_protocol_mappers_protocol_protocol = lazy_import(_ENDPOINTS, "get_admin_realms_realm_client_scopes_client_scope_id_protocol_mappers_protocol_protocol")
+post_admin_realms_realm_client_scopes_client_scope_id_protocol_mappers_add_models = lazy_import(_ENDPOINTS, "post_admin_realms_realm_client_scopes_client_scope_id_protocol_mappers_add_models")
 
 __all__ = "ProtocolMappersAPI", "ProtocolMappersClientMixin", "ProtocolMapperRepresentation"
 
 
 class ProtocolMappersAPI(BaseAPI):
     """Protocol mapper management API methods."""
+    __slots__ = ()
 
     # Client Protocol Mappers
     def get_client_mappers(self, realm: str | None = None, *, client_uuid: str) -> list[ProtocolMapperRepresentation] | None:
@@ -84,8 +86,7 @@ class ProtocolMappersAPI(BaseAPI):
             ProtocolMapperRepresentation,
             client_uuid=client_uuid
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create client mapper: {response.status_code}")
+        self._check(response, OK_CREATE, "create client mapper")
 
     async def acreate_client_mapper(self, realm: str | None = None, *, client_uuid: str, mapper_data: dict | ProtocolMapperRepresentation) -> None:
         """Create a protocol mapper for a client (async).
@@ -105,8 +106,7 @@ class ProtocolMappersAPI(BaseAPI):
             ProtocolMapperRepresentation,
             client_uuid=client_uuid
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create client mapper: {response.status_code}")
+        self._check(response, OK_CREATE, "create client mapper")
 
     def get_client_mapper(self, realm: str | None = None, *, client_uuid: str, mapper_id: str) -> ProtocolMapperRepresentation | None:
         """Get a protocol mapper for a client (sync).
@@ -164,8 +164,7 @@ class ProtocolMappersAPI(BaseAPI):
             client_uuid=client_uuid,
             id=mapper_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update client mapper: {response.status_code}")
+        self._check(response, OK_UPDATE, "update client mapper")
 
     async def aupdate_client_mapper(self, realm: str | None = None, *, client_uuid: str, mapper_id: str, mapper_data: dict | ProtocolMapperRepresentation) -> None:
         """Update a protocol mapper for a client (async).
@@ -187,8 +186,7 @@ class ProtocolMappersAPI(BaseAPI):
             client_uuid=client_uuid,
             id=mapper_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update client mapper: {response.status_code}")
+        self._check(response, OK_UPDATE, "update client mapper")
 
     def delete_client_mapper(self, realm: str | None = None, *, client_uuid: str, mapper_id: str) -> None:
         """Delete a protocol mapper for a client (sync).
@@ -207,8 +205,7 @@ class ProtocolMappersAPI(BaseAPI):
             client_uuid=client_uuid,
             id=mapper_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete client mapper: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete client mapper")
 
     async def adelete_client_mapper(self, realm: str | None = None, *, client_uuid: str, mapper_id: str) -> None:
         """Delete a protocol mapper for a client (async).
@@ -227,8 +224,7 @@ class ProtocolMappersAPI(BaseAPI):
             client_uuid=client_uuid,
             id=mapper_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete client mapper: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete client mapper")
 
     def get_client_mappers_by_protocol(self, realm: str | None = None, *, client_uuid: str, protocol: str) -> list[ProtocolMapperRepresentation] | None:
         """Get protocol mappers for a client by protocol (sync).
@@ -277,15 +273,14 @@ class ProtocolMappersAPI(BaseAPI):
         Raises:
             APIError: If adding mappers fails
         """
-        mapper_objs = [m if isinstance(m, ProtocolMapperRepresentation) else ProtocolMapperRepresentation.from_dict(m) for m in mappers]
+        mapper_objs = [self._coerce(m, ProtocolMapperRepresentation) for m in mappers]
         response = self._sync_detailed(
             post_admin_realms_realm_clients_client_uuid_protocol_mappers_add_models.sync_detailed,
             realm,
             client_uuid=client_uuid,
             body=mapper_objs
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add client mappers: {response.status_code}")
+        self._check(response, OK_UPDATE, "add client mappers")
 
     async def aadd_multiple_client_mappers(self, realm: str | None = None, *, client_uuid: str, mappers: list[dict | ProtocolMapperRepresentation]) -> None:
         """Add multiple protocol mappers to a client (async).
@@ -298,15 +293,14 @@ class ProtocolMappersAPI(BaseAPI):
         Raises:
             APIError: If adding mappers fails
         """
-        mapper_objs = [m if isinstance(m, ProtocolMapperRepresentation) else ProtocolMapperRepresentation.from_dict(m) for m in mappers]
+        mapper_objs = [self._coerce(m, ProtocolMapperRepresentation) for m in mappers]
         response = await self._async_detailed(
             post_admin_realms_realm_clients_client_uuid_protocol_mappers_add_models.asyncio_detailed,
             realm,
             client_uuid=client_uuid,
             body=mapper_objs
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add client mappers: {response.status_code}")
+        self._check(response, OK_UPDATE, "add client mappers")
 
     # Client Scope Protocol Mappers
     def get_scope_mappers(self, realm: str | None = None, *, client_scope_id: str) -> list[ProtocolMapperRepresentation] | None:
@@ -359,8 +353,7 @@ class ProtocolMappersAPI(BaseAPI):
             ProtocolMapperRepresentation,
             client_scope_id=client_scope_id
         )
-        if response.status_code not in (200, 201):
-            raise APIError(f"Failed to create scope mapper: {response.status_code}")
+        self._check(response, OK_POST, "create scope mapper")
 
     async def acreate_scope_mapper(self, realm: str | None = None, *, client_scope_id: str, mapper_data: dict | ProtocolMapperRepresentation) -> None:
         """Create a protocol mapper for a client scope (async).
@@ -380,8 +373,7 @@ class ProtocolMappersAPI(BaseAPI):
             ProtocolMapperRepresentation,
             client_scope_id=client_scope_id
         )
-        if response.status_code not in (200, 201):
-            raise APIError(f"Failed to create scope mapper: {response.status_code}")
+        self._check(response, OK_POST, "create scope mapper")
 
     def get_scope_mapper(self, realm: str | None = None, *, client_scope_id: str, mapper_id: str) -> ProtocolMapperRepresentation | None:
         """Get a protocol mapper for a client scope (sync).
@@ -439,8 +431,7 @@ class ProtocolMappersAPI(BaseAPI):
             client_scope_id=client_scope_id,
             id=mapper_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update scope mapper: {response.status_code}")
+        self._check(response, OK_UPDATE, "update scope mapper")
 
     async def aupdate_scope_mapper(self, realm: str | None = None, *, client_scope_id: str, mapper_id: str, mapper_data: dict | ProtocolMapperRepresentation) -> None:
         """Update a protocol mapper for a client scope (async).
@@ -462,8 +453,7 @@ class ProtocolMappersAPI(BaseAPI):
             client_scope_id=client_scope_id,
             id=mapper_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update scope mapper: {response.status_code}")
+        self._check(response, OK_UPDATE, "update scope mapper")
 
     def delete_scope_mapper(self, realm: str | None = None, *, client_scope_id: str, mapper_id: str) -> None:
         """Delete a protocol mapper for a client scope (sync).
@@ -482,8 +472,7 @@ class ProtocolMappersAPI(BaseAPI):
             client_scope_id=client_scope_id,
             id=mapper_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete scope mapper: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete scope mapper")
 
     async def adelete_scope_mapper(self, realm: str | None = None, *, client_scope_id: str, mapper_id: str) -> None:
         """Delete a protocol mapper for a client scope (async).
@@ -502,8 +491,7 @@ class ProtocolMappersAPI(BaseAPI):
             client_scope_id=client_scope_id,
             id=mapper_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete scope mapper: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete scope mapper")
 
     def get_scope_mappers_by_protocol(self, realm: str | None = None, *, client_scope_id: str, protocol: str) -> list[ProtocolMapperRepresentation] | None:
         """Get protocol mappers for a client scope by protocol (sync).
@@ -552,15 +540,14 @@ class ProtocolMappersAPI(BaseAPI):
         Raises:
             APIError: If adding mappers fails
         """
-        mapper_objs = [m if isinstance(m, ProtocolMapperRepresentation) else ProtocolMapperRepresentation.from_dict(m) for m in mappers]
+        mapper_objs = [self._coerce(m, ProtocolMapperRepresentation) for m in mappers]
         response = self._sync_detailed(
             post_admin_realms_realm_client_scopes_client_scope_id_protocol_mappers_add_models.sync_detailed,
             realm,
             client_scope_id=client_scope_id,
             body=mapper_objs
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add scope mappers: {response.status_code}")
+        self._check(response, OK_UPDATE, "add scope mappers")
 
     async def aadd_multiple_scope_mappers(self, realm: str | None = None, *, client_scope_id: str, mappers: list[dict | ProtocolMapperRepresentation]) -> None:
         """Add multiple protocol mappers to a client scope (async).
@@ -573,15 +560,14 @@ class ProtocolMappersAPI(BaseAPI):
         Raises:
             APIError: If adding mappers fails
         """
-        mapper_objs = [m if isinstance(m, ProtocolMapperRepresentation) else ProtocolMapperRepresentation.from_dict(m) for m in mappers]
+        mapper_objs = [self._coerce(m, ProtocolMapperRepresentation) for m in mappers]
         response = await self._async_detailed(
             post_admin_realms_realm_client_scopes_client_scope_id_protocol_mappers_add_models.asyncio_detailed,
             realm,
             client_scope_id=client_scope_id,
             body=mapper_objs
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add scope mappers: {response.status_code}")
+        self._check(response, OK_UPDATE, "add scope mappers")
 
 
 class ProtocolMappersClientMixin:
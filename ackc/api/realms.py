@@ -1,36 +1,7 @@
 """Realm management API methods."""
-import json
 from functools import cached_property
-from io import BytesIO
-
-from .base import BaseAPI
-from ..exceptions import APIError
-from ..generated.api.realms_admin import (
-    get_admin_realms,
-    post_admin_realms,
-    get_admin_realms_realm,
-    put_admin_realms_realm,
-    delete_admin_realms_realm,
-    get_admin_realms_realm_events,
-    delete_admin_realms_realm_events,
-    get_admin_realms_realm_events_config,
-    put_admin_realms_realm_events_config,
-    get_admin_realms_realm_admin_events,
-    delete_admin_realms_realm_admin_events,
-    get_admin_realms_realm_default_groups,
-    put_admin_realms_realm_default_groups_group_id,
-    delete_admin_realms_realm_default_groups_group_id,
-    get_admin_realms_realm_default_default_client_scopes,
-    put_admin_realms_realm_default_default_client_scopes_client_scope_id,
-    delete_admin_realms_realm_default_default_client_scopes_client_scope_id,
-    get_admin_realms_realm_default_optional_client_scopes,
-    put_admin_realms_realm_default_optional_client_scopes_client_scope_id,
-    delete_admin_realms_realm_default_optional_client_scopes_client_scope_id,
-    post_admin_realms_realm_partial_export,
-    post_admin_realms_realm_partial_import,
-    post_admin_realms_realm_logout_all,
-    get_admin_realms_realm_client_session_stats,
-)
+
+from .base import BaseAPI, JSONBody, OK_CREATE, OK_UPDATE, lazy_import
 from ..generated.models import (
     RealmRepresentation,
     AdminEventRepresentation,
@@ -39,7 +10,34 @@ from ..generated.models import (
     ClientScopeRepresentation,
     RealmEventsConfigRepresentation,
 )
-from ..generated.types import File, UNSET, Unset
+from ..generated.types import UNSET, Unset
+
+_ENDPOINTS = "ackc.generated.api.realms_admin"
+
+get_admin_realms = lazy_import(_ENDPOINTS, "get_admin_realms")
+post_admin_realms = lazy_import(_ENDPOINTS, "post_admin_realms")
+get_admin_realms_realm = lazy_import(_ENDPOINTS, "get_admin_realms_realm")
+put_admin_realms_realm = lazy_import(_ENDPOINTS, "put_admin_realms_realm")
+delete_admin_realms_realm = lazy_import(_ENDPOINTS, "delete_admin_realms_realm")
+get_admin_realms_realm_events = lazy_import(_ENDPOINTS, "get_admin_realms_realm_events")
+delete_admin_realms_realm_events = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_events")
+get_admin_realms_realm_events_config = lazy_import(_ENDPOINTS, "get_admin_realms_realm_events_config")
+put_admin_realms_realm_events_config = lazy_import(_ENDPOINTS, "put_admin_realms_realm_events_config")
+get_admin_realms_realm_admin_events = lazy_import(_ENDPOINTS, "get_admin_realms_realm_admin_events")
+delete_admin_realms_realm_admin_events = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_admin_events")
+get_admin_realms_realm_default_groups = lazy_import(_ENDPOINTS, "get_admin_realms_realm_default_groups")
+put_admin_realms_realm_default_groups_group_id = lazy_import(_ENDPOINTS, "put_admin_realms_realm_default_groups_group_id")
+delete_admin_realms_realm_default_groups_group_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_default_groups_group_id")
+get_admin_realms_realm_default_default_client_scopes = lazy_import(_ENDPOINTS, "get_admin_realms_realm_default_default_client_scopes")
+put_admin_realms_realm_default_default_client_scopes_client_scope_id = lazy_import(_ENDPOINTS, "put_admin_realms_realm_default_default_client_scopes_client_scope_id")
+delete_admin_realms_realm_default_default_client_scopes_client_scope_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_default_default_client_scopes_client_scope_id")
+get_admin_realms_realm_default_optional_client_scopes = lazy_import(_ENDPOINTS, "get_admin_realms_realm_default_optional_client_scopes")
+put_admin_realms_realm_default_optional_client_scopes_client_scope_id = lazy_import(_ENDPOINTS, "put_admin_realms_realm_default_optional_client_scopes_client_scope_id")
+delete_admin_realms_realm_default_optional_client_scopes_client_scope_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_default_optional_client_scopes_client_scope_id")
+post_admin_realms_realm_partial_export = lazy_import(_ENDPOINTS, "post_admin_realms_realm_partial_export")
+post_admin_realms_realm_partial_import = lazy_import(_ENDPOINTS, "post_admin_realms_realm_partial_import")
+post_admin_realms_realm_logout_all = lazy_import(_ENDPOINTS, "post_admin_realms_realm_logout_all")
+get_admin_realms_realm_client_session_stats = lazy_import(_ENDPOINTS, "get_admin_realms_realm_client_session_stats")
 
 __all__ = (
     "RealmsAPI",
@@ -55,6 +53,7 @@ __all__ = (
 
 class RealmsAPI(BaseAPI):
     """Realm management API methods."""
+    __slots__ = ()
 
     def get_all(self) -> list[RealmRepresentation] | None:
         """List all realms (sync).
@@ -82,20 +81,9 @@ class RealmsAPI(BaseAPI):
             APIError: If realm creation fails
         """
         if isinstance(realm_data, RealmRepresentation):
-            realm_dict = realm_data.to_dict()
-        else:
-            realm_dict = realm_data
-
-        json_bytes = json.dumps(realm_dict).encode("utf-8")
-        file_obj = File(
-            payload=BytesIO(json_bytes),
-            file_name="realm.json",
-            mime_type="application/json"
-        )
-
-        response = self._sync_any(post_admin_realms.sync_detailed, body=file_obj)
-        if response.status_code != 201:
-            raise APIError(f"Failed to create realm: {response.status_code}")
+            realm_data = realm_data.to_dict()
+        response = self._sync_any(post_admin_realms.sync_detailed, body=JSONBody(realm_data))
+        self._check(response, OK_CREATE, "create realm")
 
     async def acreate(self, realm_data: dict | RealmRepresentation) -> None:
         """Create a realm (async).
@@ -107,20 +95,9 @@ class RealmsAPI(BaseAPI):
             APIError: If realm creation fails
         """
         if isinstance(realm_data, RealmRepresentation):
-            realm_dict = realm_data.to_dict()
-        else:
-            realm_dict = realm_data
-
-        json_bytes = json.dumps(realm_dict).encode("utf-8")
-        file_obj = File(
-            payload=BytesIO(json_bytes),
-            file_name="realm.json",
-            mime_type="application/json"
-        )
-
-        response = await self._async_any(post_admin_realms.asyncio_detailed, body=file_obj)
-        if response.status_code != 201:
-            raise APIError(f"Failed to create realm: {response.status_code}")
+            realm_data = realm_data.to_dict()
+        response = await self._async_any(post_admin_realms.asyncio_detailed, body=JSONBody(realm_data))
+        self._check(response, OK_CREATE, "create realm")
 
     def get(self, realm: str) -> RealmRepresentation | None:
         """Get a realm (sync).
@@ -160,8 +137,7 @@ class RealmsAPI(BaseAPI):
             realm_data,
             RealmRepresentation
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update realm: {response.status_code}")
+        self._check(response, OK_UPDATE, "update realm")
 
     async def aupdate(self, realm: str, realm_data: dict | RealmRepresentation) -> None:
         """Update a realm (async).
@@ -179,8 +155,7 @@ class RealmsAPI(BaseAPI):
             realm_data,
             RealmRepresentation
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update realm: {response.status_code}")
+        self._check(response, OK_UPDATE, "update realm")
 
     def delete(self, realm: str) -> None:
         """Delete a realm (sync).
@@ -192,8 +167,7 @@ class RealmsAPI(BaseAPI):
             APIError: If realm deletion fails
         """
         response = self._sync_any(delete_admin_realms_realm.sync_detailed, realm=realm)
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete realm: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete realm")
 
     async def adelete(self, realm: str) -> None:
         """Delete a realm (async).
@@ -205,8 +179,7 @@ class RealmsAPI(BaseAPI):
             APIError: If realm deletion fails
         """
         response = await self._async_any(delete_admin_realms_realm.asyncio_detailed, realm=realm)
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete realm: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete realm")
 
     def get_events(
         self,
@@ -311,8 +284,7 @@ class RealmsAPI(BaseAPI):
             delete_admin_realms_realm_events.sync_detailed,
             realm,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete events: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete events")
 
     async def adelete_events(self, realm: str | None = None) -> None:
         """Delete all realm events (async).
@@ -327,8 +299,7 @@ class RealmsAPI(BaseAPI):
             delete_admin_realms_realm_events.asyncio_detailed,
             realm,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete events: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete events")
 
     def get_admin_events(
         self,
@@ -449,8 +420,7 @@ class RealmsAPI(BaseAPI):
             delete_admin_realms_realm_admin_events.sync_detailed,
             realm,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete admin events: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete admin events")
 
     async def adelete_admin_events(self, realm: str | None = None) -> None:
         """Delete all admin events (async).
@@ -465,8 +435,7 @@ class RealmsAPI(BaseAPI):
             delete_admin_realms_realm_admin_events.asyncio_detailed,
             realm,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete admin events: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete admin events")
 
     def get_events_config(self, realm: str | None = None) -> RealmEventsConfigRepresentation | None:
         """Get events configuration (sync).
@@ -512,8 +481,7 @@ class RealmsAPI(BaseAPI):
             config,
             RealmEventsConfigRepresentation
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update events config: {response.status_code}")
+        self._check(response, OK_UPDATE, "update events config")
 
     async def aupdate_events_config(self, realm: str | None = None, *, config: dict | RealmEventsConfigRepresentation) -> None:
         """Update events configuration (async).
@@ -531,8 +499,7 @@ class RealmsAPI(BaseAPI):
             config,
             RealmEventsConfigRepresentation
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update events config: {response.status_code}")
+        self._check(response, OK_UPDATE, "update events config")
 
     def get_default_groups(self, realm: str | None = None) -> list[GroupRepresentation] | None:
         """Get default groups (sync).
@@ -581,8 +548,7 @@ class RealmsAPI(BaseAPI):
             realm,
             group_id=group_id,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add default group: {response.status_code}")
+        self._check(response, OK_UPDATE, "add default group")
 
     async def aadd_default_group(self, realm: str | None = None, *, group_id: str) -> None:
         """Add default group (async).
@@ -599,8 +565,7 @@ class RealmsAPI(BaseAPI):
             realm,
             group_id=group_id,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add default group: {response.status_code}")
+        self._check(response, OK_UPDATE, "add default group")
 
     def remove_default_group(self, realm: str | None = None, *, group_id: str) -> None:
         """Remove default group (sync).
@@ -617,8 +582,7 @@ class RealmsAPI(BaseAPI):
             realm,
             group_id=group_id,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove default group: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove default group")
 
     async def aremove_default_group(self, realm: str | None = None, *, group_id: str) -> None:
         """Remove default group (async).
@@ -635,8 +599,7 @@ class RealmsAPI(BaseAPI):
             realm,
             group_id=group_id,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove default group: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove default group")
 
     def partial_export(
         self,
@@ -691,7 +654,8 @@ class RealmsAPI(BaseAPI):
         
         Args:
             realm: The realm name
-            rep: Realm representation to import
+            rep: Partial import representation (users, clients, groups, identityProviders,
+                roles and an optional ifResourceExists policy: FAIL, SKIP or OVERWRITE)
             
         Raises:
             APIError: If import fails
@@ -699,17 +663,17 @@ class RealmsAPI(BaseAPI):
         response = self._sync_detailed(
             post_admin_realms_realm_partial_import.sync_detailed,
             realm,
-            body=rep,
+            body=JSONBody(rep),
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to partial import: {response.status_code}")
+        self._check(response, OK_UPDATE, "partial import")
 
     async def apartial_import(self, realm: str | None = None, *, rep: dict) -> None:
         """Partial import to realm (async).
         
         Args:
             realm: The realm name
-            rep: Realm representation to import
+            rep: Partial import representation (users, clients, groups, identityProviders,
+                roles and an optional ifResourceExists policy: FAIL, SKIP or OVERWRITE)
             
         Raises:
             APIError: If import fails
@@ -717,10 +681,9 @@ class RealmsAPI(BaseAPI):
         response = await self._async_detailed(
             post_admin_realms_realm_partial_import.asyncio_detailed,
             realm,
-            body=rep,
+            body=JSONBody(rep),
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to partial import: {response.status_code}")
+        self._check(response, OK_UPDATE, "partial import")
 
     def logout_all(self, realm: str | None = None) -> None:
         """Logout all sessions in realm (sync).
@@ -737,8 +700,7 @@ class RealmsAPI(BaseAPI):
             post_admin_realms_realm_logout_all.sync_detailed,
             realm,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to logout all: {response.status_code}")
+        self._check(response, OK_UPDATE, "logout all")
 
     async def alogout_all(self, realm: str | None = None) -> None:
         """Logout all sessions in realm (async).
@@ -755,8 +717,7 @@ class RealmsAPI(BaseAPI):
             post_admin_realms_realm_logout_all.asyncio_detailed,
             realm,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to logout all: {response.status_code}")
+        self._check(response, OK_UPDATE, "logout all")
 
     def get_client_session_stats(self, realm: str | None = None) -> list[dict[str, str]] | None:
         """Get client session statistics (sync).
@@ -833,8 +794,7 @@ class RealmsAPI(BaseAPI):
             realm,
             client_scope_id=client_scope_id,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add default client scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "add default client scope")
 
     async def aadd_default_client_scope(self, realm: str | None = None, *, client_scope_id: str) -> None:
         """Add default client scope (async).
@@ -851,8 +811,7 @@ class RealmsAPI(BaseAPI):
             realm,
             client_scope_id=client_scope_id,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add default client scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "add default client scope")
 
     def remove_default_client_scope(self, realm: str | None = None, *, client_scope_id: str) -> None:
         """Remove default client scope (sync).
@@ -869,8 +828,7 @@ class RealmsAPI(BaseAPI):
             realm,
             client_scope_id=client_scope_id,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove default client scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove default client scope")
 
     async def aremove_default_client_scope(self, realm: str | None = None, *, client_scope_id: str) -> None:
         """Remove default client scope (async).
@@ -887,8 +845,7 @@ class RealmsAPI(BaseAPI):
             realm,
             client_scope_id=client_scope_id,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove default client scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove default client scope")
 
     def get_optional_client_scopes(self, realm: str | None = None) -> list[ClientScopeRepresentation] | None:
         """Get optional client scopes (sync).
@@ -937,8 +894,7 @@ class RealmsAPI(BaseAPI):
             realm,
             client_scope_id=client_scope_id,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add optional client scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "add optional client scope")
 
     async def aadd_optional_client_scope(self, realm: str | None = None, *, client_scope_id: str) -> None:
         """Add optional client scope (async).
@@ -955,8 +911,7 @@ class RealmsAPI(BaseAPI):
             realm,
             client_scope_id=client_scope_id,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add optional client scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "add optional client scope")
 
     def remove_optional_client_scope(self, realm: str | None = None, *, client_scope_id: str) -> None:
         """Remove optional client scope (sync).
@@ -973,8 +928,7 @@ class RealmsAPI(BaseAPI):
             realm,
             client_scope_id=client_scope_id,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove optional client scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove optional client scope")
 
     async def aremove_optional_client_scope(self, realm: str | None = None, *, client_scope_id: str) -> None:
         """Remove optional client scope (async).
@@ -991,8 +945,7 @@ class RealmsAPI(BaseAPI):
             realm,
             client_scope_id=client_scope_id,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove optional client scope: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove optional client scope")
 
 
 class RealmsClientMixin:
@@ -1,30 +1,31 @@
 """Role mapper API methods."""
 from functools import cached_property
 
-from .base import BaseAPI
-from ..exceptions import APIError
-from ..generated.api.role_mapper import (
-    get_admin_realms_realm_users_user_id_role_mappings,
-    get_admin_realms_realm_users_user_id_role_mappings_realm,
-    get_admin_realms_realm_users_user_id_role_mappings_realm_available,
-    get_admin_realms_realm_users_user_id_role_mappings_realm_composite,
-    post_admin_realms_realm_users_user_id_role_mappings_realm,
-    delete_admin_realms_realm_users_user_id_role_mappings_realm,
-    get_admin_realms_realm_groups_group_id_role_mappings,
-    get_admin_realms_realm_groups_group_id_role_mappings_realm,
-    get_admin_realms_realm_groups_group_id_role_mappings_realm_available,
-    get_admin_realms_realm_groups_group_id_role_mappings_realm_composite,
-    post_admin_realms_realm_groups_group_id_role_mappings_realm,
-    delete_admin_realms_realm_groups_group_id_role_mappings_realm,
-)
+from .base import BaseAPI, OK_UPDATE, lazy_import
 from ..generated.models import MappingsRepresentation, RoleRepresentation
-from ..generated.types import UNSET, Unset
+from ..generated.types import Unset
+
+_ENDPOINTS = "ackc.generated.api.role_mapper"
+
+get_admin_realms_realm_users_user_id_role_mappings = lazy_import(_ENDPOINTS, "get_admin_realms_realm_users_user_id_role_mappings")
+get_admin_realms_realm_users_user_id_role_mappings_realm = lazy_import(_ENDPOINTS, "get_admin_realms_realm_users_user_id_role_mappings_realm")
+get_admin_realms_realm_users_user_id_role_mappings_realm_available = lazy_import(_ENDPOINTS, "get_admin_realms_realm_users_user_id_role_mappings_realm_available")
+get_admin_realms_realm_users_user_id_role_mappings_realm_composite = lazy_import(_ENDPOINTS, "get_admin_realms_realm_users_user_id_role_mappings_realm_composite")
+post_admin_realms_realm_users_user_id_role_mappings_realm = lazy_import(_ENDPOINTS, "post_admin_realms_realm_users_user_id_role_mappings_realm")
+delete_admin_realms_realm_users_user_id_role_mappings_realm = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_users_user_id_role_mappings_realm")
+get_admin_realms_realm_groups_group_id_role_mappings = lazy_import(_ENDPOINTS, "get_admin_realms_realm_groups_group_id_role_mappings")
+get_admin_realms_realm_groups_group_id_role_mappings_realm = lazy_import(_ENDPOINTS, "get_admin_realms_realm_groups_group_id_role_mappings_realm")
+get_admin_realms_realm_groups_group_id_role_mappings_realm_available = lazy_import(_ENDPOINTS, "get_admin_realms_realm_groups_group_id_role_mappings_realm_available")
+get_admin_realms_realm_groups_group_id_role_mappings_realm_composite = lazy_import(_ENDPOINTS, "get_admin_realms_realm_groups_group_id_role_mappings_realm_composite")
+post_admin_realms_realm_groups_group_id_role_mappings_realm = lazy_import(_ENDPOINTS, "post_admin_realms_realm_groups_group_id_role_mappings_realm")
+delete_admin_realms_realm_groups_group_id_role_mappings_realm = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_groups_group_id_role_mappings_realm")
 
 __all__ = "RoleMapperAPI", "RoleMapperClientMixin"
 
 
 class RoleMapperAPI(BaseAPI):
     """Role mapper API methods."""
+    __slots__ = ()
 
     def get_user_role_mappings(self, realm: str | None = None, *, user_id: str) -> MappingsRepresentation | None:
         """Get all role mappings for a user.
@@ -179,8 +180,7 @@ class RoleMapperAPI(BaseAPI):
             user_id=user_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add realm role mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "add realm role mappings")
 
     async def aadd_user_realm_role_mappings(self, realm: str | None = None, *, user_id: str, roles: list[RoleRepresentation]) -> None:
         """Add realm-level role mappings to a user (async).
@@ -199,8 +199,7 @@ class RoleMapperAPI(BaseAPI):
             user_id=user_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add realm role mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "add realm role mappings")
 
     def remove_user_realm_role_mappings(self, realm: str | None = None, *, user_id: str, roles: list[RoleRepresentation]) -> None:
         """Remove realm-level role mappings from a user.
@@ -219,8 +218,7 @@ class RoleMapperAPI(BaseAPI):
             user_id=user_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove realm role mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove realm role mappings")
 
     async def aremove_user_realm_role_mappings(self, realm: str | None = None, *, user_id: str, roles: list[RoleRepresentation]) -> None:
         """Remove realm-level role mappings from a user (async).
@@ -239,8 +237,7 @@ class RoleMapperAPI(BaseAPI):
             user_id=user_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove realm role mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove realm role mappings")
 
     def get_group_role_mappings(self, realm: str | None = None, *, group_id: str) -> MappingsRepresentation | None:
         """Get all role mappings for a group.
@@ -395,8 +392,7 @@ class RoleMapperAPI(BaseAPI):
             group_id=group_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add realm role mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "add realm role mappings")
 
     async def aadd_group_realm_role_mappings(self, realm: str | None = None, *, group_id: str, roles: list[RoleRepresentation]) -> None:
         """Add realm-level role mappings to a group (async).
@@ -415,8 +411,7 @@ class RoleMapperAPI(BaseAPI):
             group_id=group_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add realm role mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "add realm role mappings")
 
     def remove_group_realm_role_mappings(self, realm: str | None = None, *, group_id: str, roles: list[RoleRepresentation]) -> None:
         """Remove realm-level role mappings from a group.
@@ -435,8 +430,7 @@ class RoleMapperAPI(BaseAPI):
             group_id=group_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove realm role mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove realm role mappings")
 
     async def aremove_group_realm_role_mappings(self, realm: str | None = None, *, group_id: str, roles: list[RoleRepresentation]) -> None:
         """Remove realm-level role mappings from a group (async).
@@ -455,8 +449,7 @@ class RoleMapperAPI(BaseAPI):
             group_id=group_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove realm role mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove realm role mappings")
 
 
 class RoleMapperClientMixin:
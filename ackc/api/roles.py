@@ -1,41 +1,42 @@
 """Role management API methods."""
 from functools import cached_property
 
-from .base import BaseAPI
-from ..exceptions import APIError
-from ..generated.api.roles import (
-    get_admin_realms_realm_roles,
-    post_admin_realms_realm_roles,
-    get_admin_realms_realm_roles_role_name,
-    put_admin_realms_realm_roles_role_name,
-    delete_admin_realms_realm_roles_role_name,
-    get_admin_realms_realm_roles_role_name_users,
-    get_admin_realms_realm_roles_role_name_groups,
-    get_admin_realms_realm_roles_role_name_composites,
-    post_admin_realms_realm_roles_role_name_composites,
-    delete_admin_realms_realm_roles_role_name_composites,
-    get_admin_realms_realm_roles_role_name_composites_realm,
-    get_admin_realms_realm_roles_role_name_composites_clients_client_uuid,
-    get_admin_realms_realm_roles_role_name_management_permissions,
-    put_admin_realms_realm_roles_role_name_management_permissions,
-    get_admin_realms_realm_clients_client_uuid_roles,
-    post_admin_realms_realm_clients_client_uuid_roles,
-    get_admin_realms_realm_clients_client_uuid_roles_role_name,
-    put_admin_realms_realm_clients_client_uuid_roles_role_name,
-    delete_admin_realms_realm_clients_client_uuid_roles_role_name,
-    get_admin_realms_realm_clients_client_uuid_roles_role_name_users,
-    get_admin_realms_realm_clients_client_uuid_roles_role_name_composites,
-    post_admin_realms_realm_clients_client_uuid_roles_role_name_composites,
-    delete_admin_realms_realm_clients_client_uuid_roles_role_name_composites,
-)
+from .base import BaseAPI, OK_CREATE, OK_UPDATE, lazy_import
 from ..generated.models import RoleRepresentation, UserRepresentation
 from ..generated.types import UNSET, Unset
 
+_ENDPOINTS = "ackc.generated.api.roles"
+
+get_admin_realms_realm_roles = lazy_import(_ENDPOINTS, "get_admin_realms_realm_roles")
+post_admin_realms_realm_roles = lazy_import(_ENDPOINTS, "post_admin_realms_realm_roles")
+get_admin_realms_realm_roles_role_name = lazy_import(_ENDPOINTS, "get_admin_realms_realm_roles_role_name")
+put_admin_realms_realm_roles_role_name = lazy_import(_ENDPOINTS, "put_admin_realms_realm_roles_role_name")
+delete_admin_realms_realm_roles_role_name = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_roles_role_name")
+get_admin_realms_realm_roles_role_name_users = lazy_import(_ENDPOINTS, "get_admin_realms_realm_roles_role_name_users")
+get_admin_realms_realm_roles_role_name_groups = lazy_import(_ENDPOINTS, "get_admin_realms_realm_roles_role_name_groups")
+get_admin_realms_realm_roles_role_name_composites = lazy_import(_ENDPOINTS, "get_admin_realms_realm_roles_role_name_composites")
+post_admin_realms_realm_roles_role_name_composites = lazy_import(_ENDPOINTS, "post_admin_realms_realm_roles_role_name_composites")
+delete_admin_realms_realm_roles_role_name_composites = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_roles_role_name_composites")
+get_admin_realms_realm_roles_role_name_composites_realm = lazy_import(_ENDPOINTS, "get_admin_realms_realm_roles_role_name_composites_realm")
+get_admin_realms_realm_roles_role_name_composites_clients_client_uuid = lazy_import(_ENDPOINTS, "get_admin_realms_realm_roles_role_name_composites_clients_client_uuid")
+get_admin_realms_realm_roles_role_name_management_permissions = lazy_import(_ENDPOINTS, "get_admin_realms_realm_roles_role_name_management_permissions")
+put_admin_realms_realm_roles_role_name_management_permissions = lazy_import(_ENDPOINTS, "put_admin_realms_realm_roles_role_name_management_permissions")
+get_admin_realms_realm_clients_client_uuid_roles = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_roles")
+post_admin_realms_realm_clients_client_uuid_roles = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients_client_uuid_roles")
+get_admin_realms_realm_clients_client_uuid_roles_role_name = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_roles_role_name")
+put_admin_realms_realm_clients_client_uuid_roles_role_name = lazy_import(_ENDPOINTS, "put_admin_realms_realm_clients_client_uuid_roles_role_name")
+delete_admin_realms_realm_clients_client_uuid_roles_role_name = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_clients_client_uuid_roles_role_name")
+get_admin_realms_realm_clients_client_uuid_roles_role_name_users = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_roles_role_name_users")
+get_admin_realms_realm_clients_client_uuid_roles_role_name_composites = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_roles_role_name_composites")
+post_admin_realms_realm_clients_client_uuid_roles_role_name_composites = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients_client_uuid_roles_role_name_composites")
+delete_admin_realms_realm_clients_client_uuid_roles_role_name_composites = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_clients_client_uuid_roles_role_name_composites")
+
 __all__ = "RolesAPI", "RolesClientMixin", "RoleRepresentation"
 
 
 class RolesAPI(BaseAPI):
     """Role management API methods."""
+    __slots__ = ()
 
     def get_all(
             self,
@@ -113,8 +114,7 @@ class RolesAPI(BaseAPI):
             role_data,
             RoleRepresentation
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create role: {response.status_code}")
+        self._check(response, OK_CREATE, "create role")
 
     async def acreate(self, realm: str | None = None, *, role_data: dict | RoleRepresentation) -> None:
         """Create a realm role (async).
@@ -132,8 +132,7 @@ class RolesAPI(BaseAPI):
             role_data,
             RoleRepresentation
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create role: {response.status_code}")
+        self._check(response, OK_CREATE, "create role")
 
     def get(self, realm: str | None = None, *, role_name: str) -> RoleRepresentation | None:
         """Get a role by name (sync).
@@ -185,8 +184,7 @@ class RolesAPI(BaseAPI):
             RoleRepresentation,
             role_name=role_name
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update role: {response.status_code}")
+        self._check(response, OK_UPDATE, "update role")
 
     async def aupdate(self, realm: str | None = None, *, role_name: str, role_data: dict | RoleRepresentation) -> None:
         """Update a role (async).
@@ -206,8 +204,7 @@ class RolesAPI(BaseAPI):
             RoleRepresentation,
             role_name=role_name
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update role: {response.status_code}")
+        self._check(response, OK_UPDATE, "update role")
 
     def delete(self, realm: str | None = None, *, role_name: str) -> None:
         """Delete a role (sync).
@@ -224,8 +221,7 @@ class RolesAPI(BaseAPI):
             realm,
             role_name=role_name
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete role: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete role")
 
     async def adelete(self, realm: str | None = None, *, role_name: str) -> None:
         """Delete a role (async).
@@ -242,8 +238,7 @@ class RolesAPI(BaseAPI):
             realm,
             role_name=role_name
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete role: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete role")
 
     def get_users(self, realm: str | None = None, *, role_name: str) -> list[UserRepresentation] | None:
         """Get users with this role (sync).
@@ -394,8 +389,7 @@ class RolesAPI(BaseAPI):
             role_name=role_name,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add composite roles: {response.status_code}")
+        self._check(response, OK_UPDATE, "add composite roles")
 
     async def aadd_composites(self, realm: str | None = None, *, role_name: str, roles: list[RoleRepresentation]) -> None:
         """Add composite roles (async).
@@ -414,8 +408,7 @@ class RolesAPI(BaseAPI):
             role_name=role_name,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add composite roles: {response.status_code}")
+        self._check(response, OK_UPDATE, "add composite roles")
 
     def remove_composites(self, realm: str | None = None, *, role_name: str, roles: list[RoleRepresentation]) -> None:
         """Remove composite roles (sync).
@@ -434,8 +427,7 @@ class RolesAPI(BaseAPI):
             role_name=role_name,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove composite roles: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove composite roles")
 
     async def aremove_composites(self, realm: str | None = None, *, role_name: str, roles: list[RoleRepresentation]) -> None:
         """Remove composite roles (async).
@@ -454,8 +446,7 @@ class RolesAPI(BaseAPI):
             role_name=role_name,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove composite roles: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove composite roles")
 
     def get_realm_composites(self, realm: str | None = None, *, role_name: str) -> list[RoleRepresentation] | None:
         """Get realm-level composite roles (sync).
@@ -594,8 +585,7 @@ class RolesAPI(BaseAPI):
             RoleRepresentation,
             client_uuid=client_uuid
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create client role: {response.status_code}")
+        self._check(response, OK_CREATE, "create client role")
 
     async def acreate_client_role(
             self,
@@ -621,8 +611,7 @@ class RolesAPI(BaseAPI):
             RoleRepresentation,
             client_uuid=client_uuid
         )
-        if response.status_code != 201:
-            raise APIError(f"Failed to create client role: {response.status_code}")
+        self._check(response, OK_CREATE, "create client role")
 
     def get_client_role(
             self,
@@ -699,8 +688,7 @@ class RolesAPI(BaseAPI):
             client_uuid=client_uuid,
             role_name=role_name
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update client role: {response.status_code}")
+        self._check(response, OK_UPDATE, "update client role")
 
     async def aupdate_client_role(
             self,
@@ -729,8 +717,7 @@ class RolesAPI(BaseAPI):
             client_uuid=client_uuid,
             role_name=role_name
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update client role: {response.status_code}")
+        self._check(response, OK_UPDATE, "update client role")
 
     def delete_client_role(
             self,
@@ -755,8 +742,7 @@ class RolesAPI(BaseAPI):
             client_uuid=client_uuid,
             role_name=role_name
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete client role: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete client role")
 
     async def adelete_client_role(
             self,
@@ -781,8 +767,7 @@ class RolesAPI(BaseAPI):
             client_uuid=client_uuid,
             role_name=role_name
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete client role: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete client role")
 
     def get_client_role_users(
             self,
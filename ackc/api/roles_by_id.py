@@ -1,28 +1,29 @@
 """Roles by ID API methods."""
 from functools import cached_property
 
-from .base import BaseAPI
-from ..exceptions import APIError
-from ..generated.api.roles_by_id import (
-    get_admin_realms_realm_roles_by_id_role_id,
-    put_admin_realms_realm_roles_by_id_role_id,
-    delete_admin_realms_realm_roles_by_id_role_id,
-    get_admin_realms_realm_roles_by_id_role_id_composites,
-    get_admin_realms_realm_roles_by_id_role_id_composites_realm,
-    get_admin_realms_realm_roles_by_id_role_id_composites_clients_client_uuid,
-    post_admin_realms_realm_roles_by_id_role_id_composites,
-    delete_admin_realms_realm_roles_by_id_role_id_composites,
-    get_admin_realms_realm_roles_by_id_role_id_management_permissions,
-    put_admin_realms_realm_roles_by_id_role_id_management_permissions,
-)
+from .base import BaseAPI, OK_UPDATE, lazy_import
 from ..generated.models import RoleRepresentation, ManagementPermissionReference
 from ..generated.types import UNSET, Unset
 
+_ENDPOINTS = "ackc.generated.api.roles_by_id"
+
+get_admin_realms_realm_roles_by_id_role_id = lazy_import(_ENDPOINTS, "get_admin_realms_realm_roles_by_id_role_id")
+put_admin_realms_realm_roles_by_id_role_id = lazy_import(_ENDPOINTS, "put_admin_realms_realm_roles_by_id_role_id")
+delete_admin_realms_realm_roles_by_id_role_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_roles_by_id_role_id")
+get_admin_realms_realm_roles_by_id_role_id_composites = lazy_import(_ENDPOINTS, "get_admin_realms_realm_roles_by_id_role_id_composites")
+get_admin_realms_realm_roles_by_id_role_id_composites_realm = lazy_import(_ENDPOINTS, "get_admin_realms_realm_roles_by_id_role_id_composites_realm")
+get_admin_realms_realm_roles_by_id_role_id_composites_clients_client_uuid = lazy_import(_ENDPOINTS, "get_admin_realms_realm_roles_by_id_role_id_composites_clients_client_uuid")
+post_admin_realms_realm_roles_by_id_role_id_composites = lazy_import(_ENDPOINTS, "post_admin_realms_realm_roles_by_id_role_id_composites")
+delete_admin_realms_realm_roles_by_id_role_id_composites = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_roles_by_id_role_id_composites")
+get_admin_realms_realm_roles_by_id_role_id_management_permissions = lazy_import(_ENDPOINTS, "get_admin_realms_realm_roles_by_id_role_id_management_permissions")
+put_admin_realms_realm_roles_by_id_role_id_management_permissions = lazy_import(_ENDPOINTS, "put_admin_realms_realm_roles_by_id_role_id_management_permissions")
+
 __all__ = "RolesByIdAPI", "RolesByIdClientMixin"
 
 
 class RolesByIdAPI(BaseAPI):
     """Roles by ID API methods."""
+    __slots__ = ()
 
     def get(self, realm: str | None = None, *, role_id: str) -> RoleRepresentation | None:
         """Get a role by ID (sync).
@@ -74,8 +75,7 @@ class RolesByIdAPI(BaseAPI):
             RoleRepresentation,
             role_id=role_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update role: {response.status_code}")
+        self._check(response, OK_UPDATE, "update role")
 
     async def aupdate(self, realm: str | None = None, *, role_id: str, role_data: dict | RoleRepresentation) -> None:
         """Update a role by ID (async).
@@ -95,8 +95,7 @@ class RolesByIdAPI(BaseAPI):
             RoleRepresentation,
             role_id=role_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update role: {response.status_code}")
+        self._check(response, OK_UPDATE, "update role")
 
     def delete(self, realm: str | None = None, *, role_id: str) -> None:
         """Delete a role by ID (sync).
@@ -113,8 +112,7 @@ class RolesByIdAPI(BaseAPI):
             realm,
             role_id=role_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete role: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete role")
 
     async def adelete(self, realm: str | None = None, *, role_id: str) -> None:
         """Delete a role by ID (async).
@@ -131,8 +129,7 @@ class RolesByIdAPI(BaseAPI):
             realm,
             role_id=role_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete role: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete role")
 
     def get_composites(self, realm: str | None = None, *, role_id: str, first: Unset | int = UNSET, max: Unset | int = UNSET, search: Unset | str = UNSET) -> list[RoleRepresentation] | None:
         """Get composite roles for a role (sync).
@@ -267,8 +264,7 @@ class RolesByIdAPI(BaseAPI):
             role_id=role_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add composite roles: {response.status_code}")
+        self._check(response, OK_UPDATE, "add composite roles")
 
     async def aadd_composites(self, realm: str | None = None, *, role_id: str, roles: list[RoleRepresentation]) -> None:
         """Add composite roles to a role (async).
@@ -287,8 +283,7 @@ class RolesByIdAPI(BaseAPI):
             role_id=role_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add composite roles: {response.status_code}")
+        self._check(response, OK_UPDATE, "add composite roles")
 
     def remove_composites(self, realm: str | None = None, *, role_id: str, roles: list[RoleRepresentation]) -> None:
         """Remove composite roles from a role (sync).
@@ -307,8 +302,7 @@ class RolesByIdAPI(BaseAPI):
             role_id=role_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove composite roles: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove composite roles")
 
     async def aremove_composites(self, realm: str | None = None, *, role_id: str, roles: list[RoleRepresentation]) -> None:
         """Remove composite roles from a role (async).
@@ -327,8 +321,7 @@ class RolesByIdAPI(BaseAPI):
             role_id=role_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove composite roles: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove composite roles")
 
     def get_management_permissions(self, realm: str | None = None, *, role_id: str) -> ManagementPermissionReference | None:
         """Get management permissions for a role (sync).
@@ -380,8 +373,7 @@ class RolesByIdAPI(BaseAPI):
             ManagementPermissionReference,
             role_id=role_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update management permissions: {response.status_code}")
+        self._check(response, OK_UPDATE, "update management permissions")
         return response.parsed
 
     async def aupdate_management_permissions(self, realm: str | None = None, *, role_id: str, ref: dict | ManagementPermissionReference) -> ManagementPermissionReference | None:
@@ -402,8 +394,7 @@ class RolesByIdAPI(BaseAPI):
             ManagementPermissionReference,
             role_id=role_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update management permissions: {response.status_code}")
+        self._check(response, OK_UPDATE, "update management permissions")
         return response.parsed
 
 
@@ -1,42 +1,44 @@
 """Scope mappings API methods."""
 from functools import cached_property
 
-from .base import BaseAPI
-from ..exceptions import APIError
-from ..generated.api.scope_mappings import (
-    # Client scope mappings
-    get_admin_realms_realm_clients_client_uuid_scope_mappings,
-    get_admin_realms_realm_clients_client_uuid_scope_mappings_realm,
-    get_admin_realms_realm_clients_client_uuid_scope_mappings_realm_available,
-    get_admin_realms_realm_clients_client_uuid_scope_mappings_realm_composite,
-    post_admin_realms_realm_clients_client_uuid_scope_mappings_realm,
-    delete_admin_realms_realm_clients_client_uuid_scope_mappings_realm,
-    get_admin_realms_realm_clients_client_uuid_scope_mappings_clients_client,
-    get_admin_realms_realm_clients_client_uuid_scope_mappings_clients_client_available,
-    get_admin_realms_realm_clients_client_uuid_scope_mappings_clients_client_composite,
-    post_admin_realms_realm_clients_client_uuid_scope_mappings_clients_client,
-    delete_admin_realms_realm_clients_client_uuid_scope_mappings_clients_client,
-    # Client scope scope mappings
-    get_admin_realms_realm_client_scopes_client_scope_id_scope_mappings,
-    get_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_realm,
-    get_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_realm_available,
-    get_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_realm_composite,
-    post_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_realm,
-    delete_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_realm,
-    get_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_clients_client,
-    get_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_clients_client_available,
-    get_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_clients_client_composite,
-    post_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_clients_client,
-    delete_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_clients_client,
-)
+from .base import BaseAPI, OK_UPDATE, lazy_import
 from ..generated.models import MappingsRepresentation, RoleRepresentation
-from ..generated.types import UNSET, Unset
+from ..generated.types import Unset
+
+_ENDPOINTS = "ackc.generated.api.scope_mappings"
+
+# Client scope mappings
+get_admin_realms_realm_clients_client_uuid_scope_mappings = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_scope_mappings")
+get_admin_realms_realm_clients_client_uuid_scope_mappings_realm = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_scope_mappings_realm")
+get_admin_realms_realm_clients_client_uuid_scope_mappings_realm_available = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_scope_mappings_realm_available")
+get_admin_realms_realm_clients_client_uuid_scope_mappings_realm_composite = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_scope_mappings_realm_composite")
+post_admin_realms_realm_clients_client_uuid_scope_mappings_realm = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients_client_uuid_scope_mappings_realm")
+delete_admin_realms_realm_clients_client_uuid_scope_mappings_realm = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_clients_client_uuid_scope_mappings_realm")
+get_admin_realms_realm_clients_client_uuid_scope_mappings_clients_client = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_scope_mappings_clients_client")
+get_admin_realms_realm_clients_client_uuid_scope_mappings_clients_client_available = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_scope_mappings_clients_client_available")
+get_admin_realms_realm_clients_client_uuid_scope_mappings_clients_client_composite = lazy_import(_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_scope_mappings_clients_client_composite")
+post_admin_realms_realm_clients_client_uuid_scope_mappings_clients_client = lazy_import(_ENDPOINTS, "post_admin_realms_realm_clients_client_uuid_scope_mappings_clients_client")
+delete_admin_realms_realm_clients_client_uuid_scope_mappings_clients_client = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_clients_client_uuid_scope_mappings_clients_client")
+
+# Client scope scope mappings
+get_admin_realms_realm_client_scopes_client_scope_id_scope_mappings = lazy_import(_ENDPOINTS, "get_admin_realms_realm_client_scopes_client_scope_id_scope_mappings")
+get_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_realm = lazy_import(_ENDPOINTS, "get_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_realm")
+get_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_realm_available = lazy_import(_ENDPOINTS, "get_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_realm_available")
+get_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_realm_composite = lazy_import(_ENDPOINTS, "get_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_realm_composite")
+post_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_realm = lazy_import(_ENDPOINTS, "post_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_realm")
+delete_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_realm = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_realm")
+get_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_clients_client = lazy_import(_ENDPOINTS, "get_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_clients_client")
+get_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_clients_client_available = lazy_import(_ENDPOINTS, "get_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_clients_client_available")
+get_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_clients_client_composite = lazy_import(_ENDPOINTS, "get_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_clients_client_composite")
+post_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_clients_client = lazy_import(_ENDPOINTS, "post_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_clients_client")
+delete_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_clients_client = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_client_scopes_client_scope_id_scope_mappings_clients_client")
 
 __all__ = "ScopeMappingsAPI", "ScopeMappingsClientMixin"
 
 
 class ScopeMappingsAPI(BaseAPI):
     """Scope mappings API methods."""
+    __slots__ = ()
 
     # Client scope mappings
     def get_client_scope_mappings(self, realm: str | None = None, *, client_uuid: str) -> MappingsRepresentation | None:
@@ -157,8 +159,7 @@ class ScopeMappingsAPI(BaseAPI):
             client_uuid=client_uuid,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add realm scope mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "add realm scope mappings")
 
     async def aadd_client_realm_scope_mappings(self, realm: str | None = None, *, client_uuid: str, roles: list[RoleRepresentation]) -> None:
         """Add realm-level scope mappings to a client (async)."""
@@ -168,8 +169,7 @@ class ScopeMappingsAPI(BaseAPI):
             client_uuid=client_uuid,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add realm scope mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "add realm scope mappings")
 
     def remove_client_realm_scope_mappings(self, realm: str | None = None, *, client_uuid: str, roles: list[RoleRepresentation]) -> None:
         """Remove realm-level scope mappings from a client.
@@ -188,8 +188,7 @@ class ScopeMappingsAPI(BaseAPI):
             client_uuid=client_uuid,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove realm scope mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove realm scope mappings")
 
     async def aremove_client_realm_scope_mappings(self, realm: str | None = None, *, client_uuid: str, roles: list[RoleRepresentation]) -> None:
         """Remove realm-level scope mappings from a client (async)."""
@@ -199,8 +198,7 @@ class ScopeMappingsAPI(BaseAPI):
             client_uuid=client_uuid,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove realm scope mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove realm scope mappings")
 
     def get_client_client_scope_mappings(self, realm: str | None = None, *, client_uuid: str, client: str) -> list[RoleRepresentation] | None:
         """Get client-level scope mappings for a client."""
@@ -265,8 +263,7 @@ class ScopeMappingsAPI(BaseAPI):
             client_path=client,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add client scope mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "add client scope mappings")
 
     async def aadd_client_client_scope_mappings(self, realm: str | None = None, *, client_uuid: str, client: str, roles: list[RoleRepresentation]) -> None:
         """Add client-level scope mappings to a client (async)."""
@@ -277,8 +274,7 @@ class ScopeMappingsAPI(BaseAPI):
             client_path=client,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add client scope mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "add client scope mappings")
 
     def remove_client_client_scope_mappings(self, realm: str | None = None, *, client_uuid: str, client: str, roles: list[RoleRepresentation]) -> None:
         """Remove client-level scope mappings from a client."""
@@ -289,8 +285,7 @@ class ScopeMappingsAPI(BaseAPI):
             client_path=client,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove client scope mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove client scope mappings")
 
     async def aremove_client_client_scope_mappings(self, realm: str | None = None, *, client_uuid: str, client: str, roles: list[RoleRepresentation]) -> None:
         """Remove client-level scope mappings from a client (async)."""
@@ -301,8 +296,7 @@ class ScopeMappingsAPI(BaseAPI):
             client_path=client,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove client scope mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove client scope mappings")
 
     # Client scope scope mappings
     def get_client_scope_scope_mappings(self, realm: str | None = None, *, client_scope_id: str) -> MappingsRepresentation | None:
@@ -379,8 +373,7 @@ class ScopeMappingsAPI(BaseAPI):
             client_scope_id=client_scope_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add realm scope mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "add realm scope mappings")
 
     async def aadd_client_scope_realm_scope_mappings(self, realm: str | None = None, *, client_scope_id: str, roles: list[RoleRepresentation]) -> None:
         """Add realm-level scope mappings to a client scope (async)."""
@@ -390,8 +383,7 @@ class ScopeMappingsAPI(BaseAPI):
             client_scope_id=client_scope_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add realm scope mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "add realm scope mappings")
 
     def remove_client_scope_realm_scope_mappings(self, realm: str | None = None, *, client_scope_id: str, roles: list[RoleRepresentation]) -> None:
         """Remove realm-level scope mappings from a client scope."""
@@ -401,8 +393,7 @@ class ScopeMappingsAPI(BaseAPI):
             client_scope_id=client_scope_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove realm scope mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove realm scope mappings")
 
     async def aremove_client_scope_realm_scope_mappings(self, realm: str | None = None, *, client_scope_id: str, roles: list[RoleRepresentation]) -> None:
         """Remove realm-level scope mappings from a client scope (async)."""
@@ -412,8 +403,7 @@ class ScopeMappingsAPI(BaseAPI):
             client_scope_id=client_scope_id,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove realm scope mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove realm scope mappings")
 
     def get_client_scope_client_scope_mappings(self, realm: str | None = None, *, client_scope_id: str, client: str) -> list[RoleRepresentation] | None:
         """Get client-level scope mappings for a client scope."""
@@ -480,8 +470,7 @@ class ScopeMappingsAPI(BaseAPI):
             client_path=client,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add client scope mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "add client scope mappings")
 
     async def aadd_client_scope_client_scope_mappings(self, realm: str | None = None, *, client_scope_id: str, client: str, roles: list[RoleRepresentation]) -> None:
         """Add client-level scope mappings to a client scope (async)."""
@@ -492,8 +481,7 @@ class ScopeMappingsAPI(BaseAPI):
             client_path=client,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add client scope mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "add client scope mappings")
 
     def remove_client_scope_client_scope_mappings(self, realm: str | None = None, *, client_scope_id: str, client: str, roles: list[RoleRepresentation]) -> None:
         """Remove client-level scope mappings from a client scope."""
@@ -504,8 +492,7 @@ class ScopeMappingsAPI(BaseAPI):
             client_path=client,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove client scope mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove client scope mappings")
 
     async def aremove_client_scope_client_scope_mappings(self, realm: str | None = None, *, client_scope_id: str, client: str, roles: list[RoleRepresentation]) -> None:
         """Remove client-level scope mappings from a client scope (async)."""
@@ -516,8 +503,7 @@ class ScopeMappingsAPI(BaseAPI):
             client_path=client,
             body=roles
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove client scope mappings: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove client scope mappings")
 
 
 class ScopeMappingsClientMixin:
@@ -1,30 +1,29 @@
 """Session management API methods."""
 from functools import cached_property
 
-from .base import BaseAPI
-from ..exceptions import APIError
-from ..generated.api.realms_admin import (
-    delete_admin_realms_realm_sessions_session,
-    get_admin_realms_realm_client_session_stats,
-)
-from ..generated.api.clients import (
-    get_admin_realms_realm_clients_client_uuid_session_count,
-    get_admin_realms_realm_clients_client_uuid_user_sessions,
-    get_admin_realms_realm_clients_client_uuid_offline_sessions,
-    get_admin_realms_realm_clients_client_uuid_offline_session_count,
-)
-from ..generated.api.users import (
-    get_admin_realms_realm_users_user_id_sessions,
-    get_admin_realms_realm_users_user_id_offline_sessions_client_uuid,
-)
+from .base import BaseAPI, OK_UPDATE, lazy_import
 from ..generated.models import UserSessionRepresentation
 from ..generated.types import UNSET, Unset
 
+_REALMS_ADMIN_ENDPOINTS = "ackc.generated.api.realms_admin"
+_CLIENTS_ENDPOINTS = "ackc.generated.api.clients"
+_USERS_ENDPOINTS = "ackc.generated.api.users"
+
+delete_admin_realms_realm_sessions_session = lazy_import(_REALMS_ADMIN_ENDPOINTS, "delete_admin_realms_realm_sessions_session")
+get_admin_realms_realm_client_session_stats = lazy_import(_REALMS_ADMIN_ENDPOINTS, "get_admin_realms_realm_client_session_stats")
+get_admin_realms_realm_clients_client_uuid_session_count = lazy_import(_CLIENTS_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_session_count")
+get_admin_realms_realm_clients_client_uuid_user_sessions = lazy_import(_CLIENTS_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_user_sessions")
+get_admin_realms_realm_clients_client_uuid_offline_sessions = lazy_import(_CLIENTS_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_offline_sessions")
+get_admin_realms_realm_clients_client_uuid_offline_session_count = lazy_import(_CLIENTS_ENDPOINTS, "get_admin_realms_realm_clients_client_uuid_offline_session_count")
+get_admin_realms_realm_users_user_id_sessions = lazy_import(_USERS_ENDPOINTS, "get_admin_realms_realm_users_user_id_sessions")
+get_admin_realms_realm_users_user_id_offline_sessions_client_uuid = lazy_import(_USERS_ENDPOINTS, "get_admin_realms_realm_users_user_id_offline_sessions_client_uuid")
+
 __all__ = "SessionsAPI", "SessionsClientMixin", "UserSessionRepresentation"
 
 
 class SessionsAPI(BaseAPI):
     """Session management API methods."""
+    __slots__ = ()
 
     # Realm session operations
     def get_client_session_stats(self, realm: str | None = None) -> list[dict[str, str]] | None:
@@ -66,8 +65,7 @@ class SessionsAPI(BaseAPI):
             session=session,
             is_offline=is_offline
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete session: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete session")
 
     async def adelete_session(self, realm: str | None = None, *, session: str, is_offline: Unset | bool = False) -> None:
         """Delete a session (async).
@@ -86,8 +84,7 @@ class SessionsAPI(BaseAPI):
             session=session,
             is_offline=is_offline
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete session: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete session")
 
     # Client session operations
     def get_client_session_count(self, realm: str | None = None, *, client_uuid: str) -> dict[str, int] | None:
@@ -2,43 +2,7 @@
 from functools import cached_property
 from typing import Any
 
-from .base import BaseAPI
-from ..exceptions import APIError
-from ..generated.api.users import (
-    get_admin_realms_realm_users,
-    get_admin_realms_realm_users_count,
-    post_admin_realms_realm_users,
-    get_admin_realms_realm_users_user_id,
-    put_admin_realms_realm_users_user_id,
-    delete_admin_realms_realm_users_user_id,
-    get_admin_realms_realm_users_user_id_groups,
-    get_admin_realms_realm_users_user_id_groups_count,
-    put_admin_realms_realm_users_user_id_groups_group_id,
-    delete_admin_realms_realm_users_user_id_groups_group_id,
-    put_admin_realms_realm_users_user_id_reset_password,
-    put_admin_realms_realm_users_user_id_send_verify_email,
-    get_admin_realms_realm_users_user_id_sessions,
-    post_admin_realms_realm_users_user_id_logout,
-    get_admin_realms_realm_users_user_id_credentials,
-    delete_admin_realms_realm_users_user_id_credentials_credential_id,
-    get_admin_realms_realm_users_user_id_consents,
-    delete_admin_realms_realm_users_user_id_consents_client,
-    get_admin_realms_realm_users_user_id_federated_identity,
-    post_admin_realms_realm_users_user_id_federated_identity_provider,
-    delete_admin_realms_realm_users_user_id_federated_identity_provider,
-    post_admin_realms_realm_users_user_id_impersonation,
-    get_admin_realms_realm_users_user_id_offline_sessions_client_uuid,
-    put_admin_realms_realm_users_user_id_execute_actions_email,
-    get_admin_realms_realm_users_profile,
-    put_admin_realms_realm_users_profile,
-    get_admin_realms_realm_users_profile_metadata,
-    get_admin_realms_realm_users_user_id_configured_user_storage_credential_types,
-    get_admin_realms_realm_users_user_id_unmanaged_attributes,
-    post_admin_realms_realm_users_user_id_credentials_credential_id_move_after_new_previous_credential_id,
-    post_admin_realms_realm_users_user_id_credentials_credential_id_move_to_first,
-    put_admin_realms_realm_users_user_id_disable_credential_types,
-    put_admin_realms_realm_users_user_id_reset_password_email,
-)
+from .base import BaseAPI, OK_CREATE, OK_UPDATE, OK_ADD, lazy_import
 from ..generated.models import (
     UserRepresentation,
     GroupRepresentation,
@@ -51,6 +15,42 @@ from ..generated.models import (
 )
 from ..generated.types import UNSET, Unset
 
+_ENDPOINTS = "ackc.generated.api.users"
+
+get_admin_realms_realm_users = lazy_import(_ENDPOINTS, "get_admin_realms_realm_users")
+get_admin_realms_realm_users_count = lazy_import(_ENDPOINTS, "get_admin_realms_realm_users_count")
+post_admin_realms_realm_users = lazy_import(_ENDPOINTS, "post_admin_realms_realm_users")
+get_admin_realms_realm_users_user_id = lazy_import(_ENDPOINTS, "get_admin_realms_realm_users_user_id")
+put_admin_realms_realm_users_user_id = lazy_import(_ENDPOINTS, "put_admin_realms_realm_users_user_id")
+delete_admin_realms_realm_users_user_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_users_user_id")
+get_admin_realms_realm_users_user_id_groups = lazy_import(_ENDPOINTS, "get_admin_realms_realm_users_user_id_groups")
+get_admin_realms_realm_users_user_id_groups_count = lazy_import(_ENDPOINTS, "get_admin_realms_realm_users_user_id_groups_count")
+put_admin_realms_realm_users_user_id_groups_group_id = lazy_import(_ENDPOINTS, "put_admin_realms_realm_users_user_id_groups_group_id")
+delete_admin_realms_realm_users_user_id_groups_group_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_users_user_id_groups_group_id")
+put_admin_realms_realm_users_user_id_reset_password = lazy_import(_ENDPOINTS, "put_admin_realms_realm_users_user_id_reset_password")
+put_admin_realms_realm_users_user_id_send_verify_email = lazy_import(_ENDPOINTS, "put_admin_realms_realm_users_user_id_send_verify_email")
+get_admin_realms_realm_users_user_id_sessions = lazy_import(_ENDPOINTS, "get_admin_realms_realm_users_user_id_sessions")
+post_admin_realms_realm_users_user_id_logout = lazy_import(_ENDPOINTS, "post_admin_realms_realm_users_user_id_logout")
+get_admin_realms_realm_users_user_id_credentials = lazy_import(_ENDPOINTS, "get_admin_realms_realm_users_user_id_credentials")
+delete_admin_realms_realm_users_user_id_credentials_credential_id = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_users_user_id_credentials_credential_id")
+get_admin_realms_realm_users_user_id_consents = lazy_import(_ENDPOINTS, "get_admin_realms_realm_users_user_id_consents")
+delete_admin_realms_realm_users_user_id_consents_client = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_users_user_id_consents_client")
+get_admin_realms_realm_users_user_id_federated_identity = lazy_import(_ENDPOINTS, "get_admin_realms_realm_users_user_id_federated_identity")
+post_admin_realms_realm_users_user_id_federated_identity_provider = lazy_import(_ENDPOINTS, "post_admin_realms_realm_users_user_id_federated_identity_provider")
+delete_admin_realms_realm_users_user_id_federated_identity_provider = lazy_import(_ENDPOINTS, "delete_admin_realms_realm_users_user_id_federated_identity_provider")
+post_admin_realms_realm_users_user_id_impersonation = lazy_import(_ENDPOINTS, "post_admin_realms_realm_users_user_id_impersonation")
+get_admin_realms_realm_users_user_id_offline_sessions_client_uuid = lazy_import(_ENDPOINTS, "get_admin_realms_realm_users_user_id_offline_sessions_client_uuid")
+put_admin_realms_realm_users_user_id_execute_actions_email = lazy_import(_ENDPOINTS, "put_admin_realms_realm_users_user_id_execute_actions_email")
+get_admin_realms_realm_users_profile = lazy_import(_ENDPOINTS, "get_admin_realms_realm_users_profile")
+put_admin_realms_realm_users_profile = lazy_import(_ENDPOINTS, "put_admin_realms_realm_users_profile")
+get_admin_realms_realm_users_profile_metadata = lazy_import(_ENDPOINTS, "get_admin_realms_realm_users_profile_metadata")
+get_admin_realms_realm_users_user_id_configured_user_storage_credential_types = lazy_import(_ENDPOINTS, "get_admin_realms_realm_users_user_id_configured_user_storage_credential_types")
+get_admin_realms_realm_users_user_id_unmanaged_attributes = lazy_import(_ENDPOINTS, "get_admin_realms_realm_users_user_id_unmanaged_attributes")
+post_admin_realms_realm_users_user_id_credentials_credential_id_move_after_new_previous_credential_id = lazy_import(_ENDPOINTS, "post_admin_realms_realm_users_user_id_credentials_credential_id_move_after_new_previous_credential_id")
+post_admin_realms_realm_users_user_id_credentials_credential_id_move_to_first = lazy_import(_ENDPOINTS, "post_admin_realms_realm_users_user_id_credentials_credential_id_move_to_first")
+put_admin_realms_realm_users_user_id_disable_credential_types = lazy_import(_ENDPOINTS, "put_admin_realms_realm_users_user_id_disable_credential_types")
+put_admin_realms_realm_users_user_id_reset_password_email = lazy_import(_ENDPOINTS, "put_admin_realms_realm_users_user_id_reset_password_email")
+
 __all__ = (
     "UsersAPI",
     "UsersClientMixin",
@@ -65,6 +65,7 @@ __all__ = (
 
 class UsersAPI(BaseAPI):
     """User management API methods."""
+    __slots__ = ()
 
     def get_all(
         self,
@@ -206,11 +207,10 @@ class UsersAPI(BaseAPI):
             UserRepresentation
         )
 
-        if response.status_code != 201:
-            raise APIError(f"Failed to create user: {response.status_code}")
+        self._check(response, OK_CREATE, "create user")
 
         location = response.headers.get("Location", "")
-        return location.split("/")[-1] if location else ""
+        return location.rpartition("/")[2]
     
     async def acreate(self, realm: str | None = None, *, user_data: dict | UserRepresentation) -> str:
         """Create a user (async).
@@ -232,11 +232,10 @@ class UsersAPI(BaseAPI):
             UserRepresentation
         )
 
-        if response.status_code != 201:
-            raise APIError(f"Failed to create user: {response.status_code}")
+        self._check(response, OK_CREATE, "create user")
 
         location = response.headers.get("Location", "")
-        return location.split("/")[-1] if location else ""
+        return location.rpartition("/")[2]
     
     def get(self, realm: str | None = None, *, user_id: str) -> UserRepresentation | None:
         """Get a user by ID (sync).
@@ -281,8 +280,7 @@ class UsersAPI(BaseAPI):
             user_id=user_id
         )
 
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update user: {response.status_code}")
+        self._check(response, OK_UPDATE, "update user")
     
     async def aupdate(self, realm: str | None = None, *, user_id: str, user_data: dict | UserRepresentation) -> None:
         """Update a user (async).
@@ -303,8 +301,7 @@ class UsersAPI(BaseAPI):
             user_id=user_id
         )
 
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update user: {response.status_code}")
+        self._check(response, OK_UPDATE, "update user")
 
     def delete(self, realm: str | None = None, *, user_id: str) -> None:
         """Delete a user (sync).
@@ -321,8 +318,7 @@ class UsersAPI(BaseAPI):
             realm,
             user_id=user_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete user: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete user")
 
     async def adelete(self, realm: str | None = None, *, user_id: str) -> None:
         """Delete a user (async).
@@ -339,8 +335,7 @@ class UsersAPI(BaseAPI):
             realm,
             user_id=user_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete user: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete user")
 
     def get_count(
         self,
@@ -475,8 +470,7 @@ class UsersAPI(BaseAPI):
             user_id=user_id,
             group_id=group_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add user to group: {response.status_code}")
+        self._check(response, OK_UPDATE, "add user to group")
 
     async def aadd_to_group(self, realm: str | None = None, *, user_id: str, group_id: str) -> None:
         """Add user to group (async).
@@ -495,8 +489,7 @@ class UsersAPI(BaseAPI):
             user_id=user_id,
             group_id=group_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to add user to group: {response.status_code}")
+        self._check(response, OK_UPDATE, "add user to group")
 
     def remove_from_group(self, realm: str | None = None, *, user_id: str, group_id: str) -> None:
         """Remove user from group (sync).
@@ -515,8 +508,7 @@ class UsersAPI(BaseAPI):
             user_id=user_id,
             group_id=group_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove user from group: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove user from group")
 
     async def aremove_from_group(self, realm: str | None = None, *, user_id: str, group_id: str) -> None:
         """Remove user from group (async).
@@ -535,8 +527,7 @@ class UsersAPI(BaseAPI):
             user_id=user_id,
             group_id=group_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove user from group: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove user from group")
 
     def reset_password(self, realm: str | None = None, *, user_id: str, password: str, temporary: bool = False) -> None:
         """Reset user password (sync).
@@ -561,8 +552,7 @@ class UsersAPI(BaseAPI):
             user_id=user_id,
             body=credential,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to reset password: {response.status_code}")
+        self._check(response, OK_UPDATE, "reset password")
 
     async def areset_password(self, realm: str | None = None, *, user_id: str, password: str, temporary: bool = False) -> None:
         """Reset user password (async).
@@ -587,8 +577,7 @@ class UsersAPI(BaseAPI):
             user_id=user_id,
             body=credential,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to reset password: {response.status_code}")
+        self._check(response, OK_UPDATE, "reset password")
 
     def send_verify_email(self, realm: str | None = None, *, user_id: str, redirect_uri: Unset | str = UNSET) -> None:
         """Send email verification (sync).
@@ -607,8 +596,7 @@ class UsersAPI(BaseAPI):
             user_id=user_id,
             redirect_uri=redirect_uri
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to send verification email: {response.status_code}")
+        self._check(response, OK_UPDATE, "send verification email")
 
     async def asend_verify_email(self, realm: str | None = None, *, user_id: str, redirect_uri: Unset | str = UNSET) -> None:
         """Send email verification (async).
@@ -627,8 +615,7 @@ class UsersAPI(BaseAPI):
             user_id=user_id,
             redirect_uri=redirect_uri
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to send verification email: {response.status_code}")
+        self._check(response, OK_UPDATE, "send verification email")
 
     def get_sessions(self, realm: str | None = None, *, user_id: str) -> list[UserSessionRepresentation] | None:
         """Get user's active sessions (sync).
@@ -677,8 +664,7 @@ class UsersAPI(BaseAPI):
             realm,
             user_id=user_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to logout user: {response.status_code}")
+        self._check(response, OK_UPDATE, "logout user")
 
     async def alogout(self, realm: str | None = None, *, user_id: str) -> None:
         """Force logout user from all sessions (async).
@@ -695,8 +681,7 @@ class UsersAPI(BaseAPI):
             realm,
             user_id=user_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to logout user: {response.status_code}")
+        self._check(response, OK_UPDATE, "logout user")
 
     def get_credentials(self, realm: str | None = None, *, user_id: str) -> list[CredentialRepresentation] | None:
         """Get user's credentials (sync).
@@ -747,8 +732,7 @@ class UsersAPI(BaseAPI):
             user_id=user_id,
             credential_id=credential_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete credential: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete credential")
 
     async def adelete_credential(self, realm: str | None = None, *, user_id: str, credential_id: str) -> None:
         """Delete specific credential (async).
@@ -767,8 +751,7 @@ class UsersAPI(BaseAPI):
             user_id=user_id,
             credential_id=credential_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to delete credential: {response.status_code}")
+        self._check(response, OK_UPDATE, "delete credential")
 
     def get_groups_count(self, realm: str | None = None, *, user_id: str) -> int | None:
         """Get count of user's group memberships (sync).
@@ -853,8 +836,7 @@ class UsersAPI(BaseAPI):
             user_id=user_id,
             client_path=client_path
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to revoke consent: {response.status_code}")
+        self._check(response, OK_UPDATE, "revoke consent")
 
     async def arevoke_consent(self, realm: str | None = None, *, user_id: str, client_path: str) -> None:
         """Revoke user consent for client (async).
@@ -873,8 +855,7 @@ class UsersAPI(BaseAPI):
             user_id=user_id,
             client_path=client_path
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to revoke consent: {response.status_code}")
+        self._check(response, OK_UPDATE, "revoke consent")
 
     def get_federated_identities(self, realm: str | None = None, *, user_id: str) -> list[FederatedIdentityRepresentation] | None:
         """Get user's federated identities (sync).
@@ -928,8 +909,7 @@ class UsersAPI(BaseAPI):
             user_id=user_id,
             provider=provider
         )
-        if response.status_code not in (200, 201, 204):
-            raise APIError(f"Failed to add federated identity: {response.status_code}")
+        self._check(response, OK_ADD, "add federated identity")
 
     async def aadd_federated_identity(self, realm: str | None = None, *, user_id: str, provider: str, rep: dict | FederatedIdentityRepresentation) -> None:
         """Add federated identity to user (async).
@@ -951,8 +931,7 @@ class UsersAPI(BaseAPI):
             user_id=user_id,
             provider=provider
         )
-        if response.status_code not in (200, 201, 204):
-            raise APIError(f"Failed to add federated identity: {response.status_code}")
+        self._check(response, OK_ADD, "add federated identity")
 
     def remove_federated_identity(self, realm: str | None = None, *, user_id: str, provider: str) -> None:
         """Remove federated identity from user (sync).
@@ -971,8 +950,7 @@ class UsersAPI(BaseAPI):
             user_id=user_id,
             provider=provider
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove federated identity: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove federated identity")
 
     async def aremove_federated_identity(self, realm: str | None = None, *, user_id: str, provider: str) -> None:
         """Remove federated identity from user (async).
@@ -991,8 +969,7 @@ class UsersAPI(BaseAPI):
             user_id=user_id,
             provider=provider
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to remove federated identity: {response.status_code}")
+        self._check(response, OK_UPDATE, "remove federated identity")
 
     def impersonate(self, realm: str | None = None, *, user_id: str) -> dict[str, Any] | None:
         """Impersonate user (sync).
@@ -1085,8 +1062,7 @@ class UsersAPI(BaseAPI):
             client_id=client_id,
             lifespan=lifespan,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to send execute actions email: {response.status_code}")
+        self._check(response, OK_UPDATE, "send execute actions email")
 
     async def aexecute_actions_email(self, realm: str | None = None, *, user_id: str, actions: list[str], redirect_uri: str | None = None, client_id: str | None = None, lifespan: int | None = None) -> None:
         """Send execute actions email to user (async).
@@ -1111,8 +1087,7 @@ class UsersAPI(BaseAPI):
             client_id=client_id,
             lifespan=lifespan,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to send execute actions email: {response.status_code}")
+        self._check(response, OK_UPDATE, "send execute actions email")
 
     def get_configured_credential_types(self, realm: str | None = None, *, user_id: str) -> list[str] | None:
         """Get configured user storage credential types (sync).
@@ -1204,8 +1179,7 @@ class UsersAPI(BaseAPI):
             credential_id=credential_id,
             new_previous_credential_id=new_previous_credential_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to move credential: {response.status_code}")
+        self._check(response, OK_UPDATE, "move credential")
 
     async def amove_credential_after(
         self,
@@ -1233,8 +1207,7 @@ class UsersAPI(BaseAPI):
             credential_id=credential_id,
             new_previous_credential_id=new_previous_credential_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to move credential: {response.status_code}")
+        self._check(response, OK_UPDATE, "move credential")
 
     def move_credential_to_first(self, realm: str | None = None, *, user_id: str, credential_id: str) -> None:
         """Move credential to first position (sync).
@@ -1253,8 +1226,7 @@ class UsersAPI(BaseAPI):
             user_id=user_id,
             credential_id=credential_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to move credential to first: {response.status_code}")
+        self._check(response, OK_UPDATE, "move credential to first")
 
     async def amove_credential_to_first(self, realm: str | None = None, *, user_id: str, credential_id: str) -> None:
         """Move credential to first position (async).
@@ -1273,8 +1245,7 @@ class UsersAPI(BaseAPI):
             user_id=user_id,
             credential_id=credential_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to move credential to first: {response.status_code}")
+        self._check(response, OK_UPDATE, "move credential to first")
 
     def disable_credential_types(self, realm: str | None = None, *, user_id: str, credential_types: list[str]) -> None:
         """Disable credential types for user (sync).
@@ -1293,8 +1264,7 @@ class UsersAPI(BaseAPI):
             user_id=user_id,
             body=credential_types,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to disable credential types: {response.status_code}")
+        self._check(response, OK_UPDATE, "disable credential types")
 
     async def adisable_credential_types(self, realm: str | None = None, *, user_id: str, credential_types: list[str]) -> None:
         """Disable credential types for user (async).
@@ -1313,8 +1283,7 @@ class UsersAPI(BaseAPI):
             user_id=user_id,
             body=credential_types,
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to disable credential types: {response.status_code}")
+        self._check(response, OK_UPDATE, "disable credential types")
 
     def reset_password_email(self, realm: str | None = None, *, user_id: str, redirect_uri: str | None = None, client_id: str | None = None) -> None:
         """Send reset password email (sync).
@@ -1335,8 +1304,7 @@ class UsersAPI(BaseAPI):
             redirect_uri=redirect_uri,
             client_id=client_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to send reset password email: {response.status_code}")
+        self._check(response, OK_UPDATE, "send reset password email")
 
     async def areset_password_email(self, realm: str | None = None, *, user_id: str, redirect_uri: str | None = None, client_id: str | None = None) -> None:
         """Send reset password email (async).
@@ -1357,8 +1325,7 @@ class UsersAPI(BaseAPI):
             redirect_uri=redirect_uri,
             client_id=client_id
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to send reset password email: {response.status_code}")
+        self._check(response, OK_UPDATE, "send reset password email")
 
     def get_profile(self, realm: str | None = None) -> UPConfig | None:
         """Get users profile (sync).
@@ -1404,8 +1371,7 @@ class UsersAPI(BaseAPI):
             profile_data,
             UPConfig
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update profile: {response.status_code}")
+        self._check(response, OK_UPDATE, "update profile")
 
     async def aupdate_profile(self, realm: str | None = None, *, profile_data: dict | UPConfig) -> None:
         """Update users profile (async).
@@ -1423,8 +1389,7 @@ class UsersAPI(BaseAPI):
             profile_data,
             UPConfig
         )
-        if response.status_code not in (200, 204):
-            raise APIError(f"Failed to update profile: {response.status_code}")
+        self._check(response, OK_UPDATE, "update profile")
 
     def get_profile_metadata(self, realm: str | None = None) -> UserProfileMetadata | None:
         """Get users profile metadata (sync).
@@ -55,7 +55,7 @@ class BaseKeycloakClient(BaseClientManager):
             cf_client_id: Cloudflare Access client ID
             cf_client_secret: Cloudflare Access client secret
             refresh_buffer_seconds: Seconds before expiry to consider token needs refresh (default: 60)
-            **kwds: Additional arguments for the underlying client
+            **kwds: Additional arguments for the underlying client (e.g. multiplexed, pool_connections, pool_maxsize, niquests_args)
         """
         super().__init__(realm=realm or env.KEYCLOAK_REALM)
 
@@ -239,6 +239,15 @@ class BaseKeycloakClient(BaseClientManager):
         await self._ensure_authenticated_async(scopes)
         return self._token
 
+    def _apply_token(self):
+        """Point the long-lived client, including its open sessions, at the current access token."""
+        if self._client:
+            client = self._client
+            client.token = self._access_token
+            client.with_headers({
+                client.auth_header_name: f"{client.prefix} {client.token}" if client.prefix else client.token
+            })
+
     def refresh_token(self):
         """Refresh this client's internal token synchronously."""
         if self._token and self._refresh_token:
@@ -257,20 +266,17 @@ class BaseKeycloakClient(BaseClientManager):
                     error_data = response.json()
                     if error_data.get("error") == "invalid_grant":
                         self._token = self._get_token(None)
-                        if self._client:
-                            self._client.token = self._access_token
+                        self._apply_token()
                         return
 
                 if response.status_code != 200:
                     raise AuthError(f"Token refresh failed: {response.status_code} - {response.text}")
 
                 self._token = response.json()
-                if self._client:
-                    self._client.token = self._access_token
+                self._apply_token()
         else:
             self._token = self._get_token(None)
-            if self._client:
-                self._client.token = self._access_token
+            self._apply_token()
 
     async def arefresh_token(self):
         """Refresh the internal token asynchronously."""
@@ -290,20 +296,17 @@ class BaseKeycloakClient(BaseClientManager):
                     error_data = response.json()
                     if error_data.get("error") == "invalid_grant":
                         self._token = await self._get_token_async(None)
-                        if self._client:
-                            self._client.token = self._access_token
+                        self._apply_token()
                         return
 
                 if response.status_code != 200:
                     raise AuthError(f"Token refresh failed: {response.status_code} - {response.text}")
 
                 self._token = response.json()
-                if self._client:
-                    self._client.token = self._access_token
+                self._apply_token()
         else:
             self._token = await self._get_token_async(None)
-            if self._client:
-                self._client.token = self._access_token
+            self._apply_token()
 
     def get_token_password(
         self,
@@ -38,5 +38,25 @@ class ClientNotFoundError(ClientError):
 
 
 class APIError(ClientError):
-    """General API operation error."""
-    pass
+    """General API operation error.
+
+    Raised for an unexpected response as `APIError(action, status_code, content)`; the message
+    ("Failed to {action}: {status_code} - {content}") is only formatted when the error is displayed.
+    """
+    status_code: int | None
+    content: bytes | None
+
+    def __init__(self, message: str, status_code: int | None = None, content: bytes | None = None):
+        if status_code is None:
+            super().__init__(message)
+        else:
+            super().__init__(message, status_code, content)
+        self.status_code = status_code
+        self.content = content
+
+    def __str__(self) -> str:
+        if self.status_code is None:
+            return super().__str__()
+        if self.content:
+            return f"Failed to {self.args[0]}: {self.status_code} - {self.content[:200].decode(errors='replace')}"
+        return f"Failed to {self.args[0]}: {self.status_code}"
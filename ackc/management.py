@@ -4,7 +4,6 @@ Keycloak Management Interface API client.
 This module provides access to the Keycloak management interface endpoints
 (health, metrics) that are exposed on port 9000 by default.
 """
-import os
 from typing import Any, Literal
 from urllib.parse import urljoin
 